@@ -0,0 +1,65 @@
+"""
+====================================
+Benchmark date-time format & parsing
+====================================
+
+Compare *rororo* date-time formatter with ``openapi-core`` one, which checks
+date-time format with regex and after parses date-time with ``isodate``.
+
+Usage::
+
+    python benchmarks/date_time_formatter.py [-n NUMBER]
+
+"""
+
+import argparse
+import sys
+import timeit
+from typing import Callable, List, Union
+
+from isodate import parse_datetime
+from openapi_schema_validator._format import oas30_format_checker
+
+from rororo.openapi.core_validators import (
+    DATE_TIME_FORMATTER,
+    reuse_parsed_date_times,
+)
+
+
+VALUES = (
+    "2020-04-01T12:00:00Z",
+    "2020-04-01T12:00:00.123456+03:00",
+    "2020-04-01T12:00:00.1234-05:30",
+)
+
+
+def core_date_time(value: str) -> None:
+    oas30_format_checker.check(value, "date-time")
+    parse_datetime(value)
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(prog="date_time_formatter")
+    parser.add_argument("-n", "--number", default=100_000, type=int)
+    args = parser.parse_args(argv)
+
+    def rororo_date_time(value: str) -> None:
+        with reuse_parsed_date_times():
+            DATE_TIME_FORMATTER.validate(value)
+            DATE_TIME_FORMATTER.unmarshal(value)
+
+    funcs: List[Callable[[str], None]] = [core_date_time, rororo_date_time]
+    for value in VALUES:
+        print(value)
+        for func in funcs:
+            seconds = timeit.timeit(lambda: func(value), number=args.number)
+            print(
+                f"  {func.__name__}: {seconds * 1_000_000 / args.number:.2f}"
+                "us per value"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
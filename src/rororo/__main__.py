@@ -0,0 +1,79 @@
+"""
+===============
+rororo.__main__
+===============
+
+Command line interface for *rororo* utilities.
+
+Bundle OpenAPI schema into single flat JSON file::
+
+    python -m rororo bundle openapi.yaml -o openapi.bundle.json
+
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Union
+
+import yaml
+
+from rororo.openapi.bundle import bundle_openapi_schema, dump_bundled_schema
+from rororo.openapi.exceptions import ConfigurationError
+
+
+def bundle(args: argparse.Namespace) -> int:
+    try:
+        schema = bundle_openapi_schema(
+            args.schema_path, strip_docs=not args.keep_docs
+        )
+    except (ConfigurationError, OSError) as err:
+        print(f"ERROR: {err}", file=sys.stderr)
+        return 1
+    except (json.JSONDecodeError, UnicodeDecodeError, yaml.YAMLError) as err:
+        print(
+            f"ERROR: Unable to parse OpenAPI schema {args.schema_path}: {err}",
+            file=sys.stderr,
+        )
+        return 1
+
+    dump_bundled_schema(schema, args.output)
+    return 0
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m rororo")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bundle_parser = subparsers.add_parser(
+        "bundle",
+        help=(
+            "Bundle OpenAPI schema into single flat JSON file without any "
+            "references and documentation-only data."
+        ),
+    )
+    bundle_parser.add_argument(
+        "schema_path", type=Path, help="Path to OpenAPI schema file."
+    )
+    bundle_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        required=True,
+        help="Path to store bundled OpenAPI schema.",
+    )
+    bundle_parser.add_argument(
+        "--keep-docs",
+        action="store_true",
+        default=False,
+        help="Do not strip documentation-only data from OpenAPI schema.",
+    )
+    bundle_parser.set_defaults(func=bundle)
+
+    args = parser.parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
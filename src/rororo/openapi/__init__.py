@@ -23,11 +23,15 @@ from rororo.openapi.exceptions import (
 )
 from rororo.openapi.openapi import (
     OperationTableDef,
+    preload_openapi,
+    PreloadedOpenAPI,
     read_openapi_schema,
     setup_openapi,
 )
+from rororo.openapi.responses import json_response
 from rororo.openapi.utils import (
     get_openapi_context,
+    get_openapi_operation,
     get_openapi_schema,
     get_openapi_spec,
     get_validated_data,
@@ -52,10 +56,15 @@ __all__ = (
     "ValidationError",
     # openapi
     "OperationTableDef",
+    "preload_openapi",
+    "PreloadedOpenAPI",
     "read_openapi_schema",
     "setup_openapi",
+    # responses
+    "json_response",
     # utils
     "get_openapi_context",
+    "get_openapi_operation",
     "get_openapi_schema",
     "get_openapi_spec",
     "get_validated_data",
@@ -1,5 +1,6 @@
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Union
 
+from aiohttp import web
 from aiohttp_middlewares.annotations import (
     ExceptionType,
     Handler,
@@ -7,11 +8,19 @@ from aiohttp_middlewares.annotations import (
     UrlCollection,
 )
 from aiohttp_middlewares.error import Config as ErrorMiddlewareConfig
+from openapi_core.schema.operations.models import Operation
 
-from rororo.annotations import TypedDict
+from rororo.annotations import Literal, TypedDict
 
 
+AuthenticateFunc = Callable[[str, Any], Awaitable[Any]]
+FrozenData = Literal["pyrsistent", "proxy", "none"]
+JsonDumps = Callable[[Any], Union[bytes, str]]
+JsonLoads = Callable[[Union[bytes, str]], Any]
 SecurityDict = Dict[str, List[str]]
+ValidateResponseFunc = Callable[[Operation, web.Request], bool]
+ValidateResponse = Union[bool, float, ValidateResponseFunc]
+ValidationEngine = Literal["default", "compiled"]
 
 
 class CorsMiddlewareKwargsDict(TypedDict, total=False):
@@ -0,0 +1,166 @@
+"""
+=====================
+rororo.openapi.bundle
+=====================
+
+Bundle OpenAPI schema into single flat JSON file, which does not contain any
+references and documentation-only data.
+
+"""
+
+import json
+from pathlib import Path
+from typing import Any, cast, Tuple, Union
+from urllib.parse import urldefrag, urljoin
+
+import attr
+from jsonschema.exceptions import RefResolutionError
+from jsonschema.validators import RefResolver
+from openapi_spec_validator import default_handlers
+
+from rororo.annotations import DictStrAny
+from rororo.openapi.exceptions import ConfigurationError
+from rororo.openapi.openapi import read_openapi_schema, SchemaLoader
+
+
+#: Keys, which values are arbitrary data and should be bundled as is
+DATA_KEYS = frozenset(("const", "default", "enum", "example", "value"))
+
+#: Documentation-only keys, which are stripped from the bundled schema
+DOCUMENTATION_KEYS = frozenset(
+    ("description", "example", "examples", "externalDocs", "summary")
+)
+
+#: Keys, which values are mappings with user defined names as keys
+MAPPING_KEYS = frozenset(
+    (
+        "callbacks",
+        "content",
+        "encoding",
+        "headers",
+        "links",
+        "mapping",
+        "parameters",
+        "paths",
+        "properties",
+        "requestBodies",
+        "responses",
+        "schemas",
+        "scopes",
+        "securitySchemes",
+        "variables",
+    )
+)
+
+
+@attr.dataclass(frozen=True, slots=True)
+class SchemaBundler:
+    """Inline references & strip documentation-only data from OpenAPI schema.
+
+    Recursive references cannot be inlined, so they are kept as is, but only
+    if they point to the main OpenAPI schema file.
+    """
+
+    resolver: RefResolver
+    base_url: str
+    strip_docs: bool = True
+
+    def bundle(
+        self,
+        value: Any,
+        *,
+        is_mapping: bool = False,
+        is_response: bool = False,
+        refs: Tuple[str, ...] = (),
+    ) -> Any:
+        if isinstance(value, list):
+            return [self.bundle(item, refs=refs) for item in value]
+
+        if not isinstance(value, dict):
+            return value
+
+        if not is_mapping and isinstance(value.get("$ref"), str):
+            return self.bundle_ref(
+                value["$ref"], is_response=is_response, refs=refs
+            )
+
+        bundled: DictStrAny = {}
+        for key, item in value.items():
+            if is_mapping:
+                bundled[key] = self.bundle(
+                    item, is_response=is_response, refs=refs
+                )
+            elif key.startswith("x-"):
+                bundled[key] = item
+            elif self.strip_docs and key in DOCUMENTATION_KEYS:
+                # Response description is required by OpenAPI 3
+                if is_response and key == "description":
+                    bundled[key] = ""
+            elif key in DATA_KEYS:
+                bundled[key] = item
+            else:
+                bundled[key] = self.bundle(
+                    item,
+                    is_mapping=key in MAPPING_KEYS,
+                    is_response=key == "responses",
+                    refs=refs,
+                )
+
+        return bundled
+
+    def bundle_ref(
+        self, ref: str, *, is_response: bool, refs: Tuple[str, ...]
+    ) -> Any:
+        resolver = self.resolver
+        url = urljoin(resolver.resolution_scope, ref)
+
+        if url in refs:
+            base_url, fragment = urldefrag(url)
+            if base_url != self.base_url:
+                raise ConfigurationError(
+                    f"Unable to bundle recursive reference {ref!r} to other "
+                    "file. Please move referenced data into the main OpenAPI "
+                    "schema file."
+                )
+            return {"$ref": f"#{fragment}"}
+
+        try:
+            with resolver.resolving(ref) as resolved:
+                return self.bundle(
+                    resolved, is_response=is_response, refs=(*refs, url)
+                )
+        except RefResolutionError as err:
+            raise ConfigurationError(
+                f"Unable to resolve reference {ref!r}: {err}"
+            )
+
+
+def bundle_openapi_schema(
+    path: Path,
+    *,
+    loader: Union[SchemaLoader, None] = None,
+    strip_docs: bool = True,
+) -> DictStrAny:
+    """Bundle OpenAPI schema from given path into single flat schema dict.
+
+    All ``$ref`` references (including references to other files) are
+    inlined, except of recursive references, which are kept as is. When
+    ``strip_docs`` is truthy, documentation-only keys (such as
+    ``description`` or ``examples``) are stripped from the schema as well.
+    """
+    schema = read_openapi_schema(path, loader=loader)
+    base_url = path.absolute().as_uri()
+    bundler = SchemaBundler(
+        RefResolver(base_url, schema, handlers=default_handlers),
+        base_url,
+        strip_docs=strip_docs,
+    )
+    return cast(DictStrAny, bundler.bundle(schema))
+
+
+def dump_bundled_schema(schema: DictStrAny, path: Path) -> None:
+    """Dump bundled OpenAPI schema into compact JSON file."""
+    path.write_text(
+        json.dumps(schema, ensure_ascii=False, separators=(",", ":")),
+        encoding="utf-8",
+    )
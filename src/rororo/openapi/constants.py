@@ -1,9 +1,33 @@
 #: Key to store OpenAPI schema within the ``web.Application`` instance
 APP_OPENAPI_SCHEMA_KEY = "rororo_openapi_schema"
 
+#: Key to store security scheme name -> authenticator mapping within the
+#: ``web.Application`` instance
+APP_OPENAPI_AUTHENTICATORS_KEY = "rororo_openapi_authenticators"
+
+#: Key to store function to dump JSON data within the ``web.Application``
+#: instance
+APP_OPENAPI_JSON_DUMPS_KEY = "rororo_openapi_json_dumps"
+
+#: Key to store operation ID -> max request body size mapping within the
+#: ``web.Application`` instance
+APP_OPENAPI_MAX_BODY_SIZES_KEY = "rororo_openapi_max_body_sizes"
+
+#: Key to store operation ID -> OpenAPI core operation mapping within the
+#: ``web.Application`` instance
+APP_OPENAPI_OPERATIONS_KEY = "rororo_openapi_operations"
+
+#: Key to store OpenAPI schema, rendered into supported formats, within the
+#: ``web.Application`` instance
+APP_OPENAPI_SCHEMA_DOCUMENTS_KEY = "rororo_openapi_schema_documents"
+
 #: Key to store OpenAPI spec within the ``web.Application`` instance
 APP_OPENAPI_SPEC_KEY = "rororo_openapi_spec"
 
+#: Key to store request & response validators to reuse for all requests
+#: within the ``web.Application`` instance
+APP_OPENAPI_VALIDATORS_KEY = "rororo_openapi_validators"
+
 #: Key to store kwargs to pass to ``validate_email`` function
 APP_VALIDATE_EMAIL_KWARGS_KEY = "rororo_validate_email_kwargs"
 
@@ -20,3 +44,15 @@ REQUEST_CORE_REQUEST_KEY = "rororo_core_request"
 
 #: Key to store valid OpenAPI context within the ``web.Request`` instance
 REQUEST_OPENAPI_CONTEXT_KEY = "rororo_openapi_context"
+
+#: OpenAPI schema extension to define max request body size (in bytes) for
+#: the operation
+MAX_BODY_SIZE_EXTENSION = "x-rororo-max-body-size"
+
+#: OpenAPI schema extension to define response validation policy for the
+#: operation
+VALIDATE_RESPONSE_EXTENSION = "x-rororo-validate-response"
+
+#: OpenAPI schema extension to enable streaming JSON array request body for
+#: the operation
+STREAM_REQUEST_BODY_EXTENSION = "x-rororo-stream-request-body"
@@ -0,0 +1,714 @@
+"""
+============================
+rororo.openapi.core_compiler
+============================
+
+Compile OpenAPI schemas into specialised Python functions.
+
+Unlike ``openapi-core`` unmarshallers, which interpret schema tree with
+``jsonschema`` validator on each call, schema compiled only once into the
+Python function, which checks whether given value is valid for the schema.
+
+Compiled functions only answer, whether value is valid or not. On invalid
+values ``openapi-core`` unmarshaller still used to provide exactly same
+validation errors as without compiled validation engine.
+
+"""
+
+import logging
+import re
+import threading
+from numbers import Number
+from typing import Any, Callable, cast, Dict, List, Set, Union
+
+from jsonschema.exceptions import FormatError
+from jsonschema.validators import RefResolver
+from openapi_core.schema.schemas.enums import SchemaType
+from openapi_core.schema.schemas.models import Schema
+from openapi_core.schema.schemas.types import NoValue
+from openapi_core.unmarshalling.schemas.enums import UnmarshalContext
+from openapi_core.unmarshalling.schemas.exceptions import (
+    InvalidSchemaFormatValue,
+    UnmarshalError,
+)
+from openapi_core.unmarshalling.schemas.formatters import Formatter
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator._format import OASFormatChecker
+
+from rororo.annotations import DictStrAny, Protocol
+
+
+IsValid = Callable[[Any], bool]
+Unmarshal = Callable[[Any], Any]
+
+ANY_SCHEMA_TYPES_ORDER = (
+    SchemaType.OBJECT,
+    SchemaType.ARRAY,
+    SchemaType.BOOLEAN,
+    SchemaType.INTEGER,
+    SchemaType.NUMBER,
+    SchemaType.STRING,
+)
+COMBINING_KEYWORDS = frozenset(("allOf", "anyOf", "oneOf"))
+DELEGATED_KEYWORDS = frozenset(("enum", "multipleOf", "uniqueItems"))
+IGNORED_KEYWORDS = frozenset(
+    (
+        "deprecated",
+        "discriminator",
+        "example",
+        "externalDocs",
+        "nullable",
+        "xml",
+    )
+)
+TYPE_CHECKS = {
+    "array": "isinstance(x, list)",
+    "boolean": "isinstance(x, bool)",
+    "integer": "isinstance(x, int) and not isinstance(x, bool)",
+    "number": "isinstance(x, Number) and not isinstance(x, bool)",
+    "object": "isinstance(x, dict)",
+    "string": "isinstance(x, (str, bytes))",
+}
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaNotCompilable(Exception):
+    """Schema uses features, which are not supported by schema compiler.
+
+    ``openapi-core`` unmarshaller should be used for such schemas instead.
+    """
+
+
+class UnmarshallersFactory(Protocol):
+    context: Union[UnmarshalContext, None]
+
+    def create(
+        self, schema: Schema, type_override: Union[SchemaType, None] = None
+    ) -> Unmarshal: ...
+
+    def get_formatter(
+        self,
+        default_formatters: Dict[str, Formatter],
+        type_format: Union[str, None] = None,
+    ) -> Formatter: ...
+
+
+class SchemaCompiler:
+    """Compile schema dicts into functions, which check value validity.
+
+    Each compiled function returns ``True`` only if ``OAS30Validator`` will
+    not yield any error for given value, so keyword evaluation order does
+    not matter and compiled function fails fast.
+
+    Functions are compiled once per schema dict, so nested & referenced
+    schemas are shared between all compiled functions. Compiling is guarded
+    by the lock, as schemas might be compiled concurrently, when validation
+    runs in thread pool executor.
+    """
+
+    def __init__(
+        self,
+        resolver: RefResolver,
+        format_checker: OASFormatChecker,
+        *,
+        context: Union[UnmarshalContext, None] = None,
+    ) -> None:
+        self.resolver = resolver
+        self.context = context
+
+        self.namespace: DictStrAny = {
+            "FormatError": FormatError,
+            "Number": Number,
+            "check_format": format_checker.check,
+            "validator": OAS30Validator({}),
+        }
+        self.names: Dict[int, str] = {}
+        self.schemas: List[Any] = []
+        self._lock = threading.RLock()
+
+    def compile(self, schema: Any) -> IsValid:  # noqa: A003
+        """Compile schema into the function to check value validity.
+
+        Raise :class:`SchemaNotCompilable` if schema or any of its subschemas
+        cannot be compiled.
+        """
+        with self._lock:
+            names = self.names.copy()
+            try:
+                name = self.compile_schema(schema)
+            except SchemaNotCompilable:
+                self.names = names
+                raise
+            return cast(IsValid, self.namespace[name])
+
+    def add_constant(self, value: Any) -> str:
+        name = f"c{len(self.schemas)}"
+        self.namespace[name] = value
+        self.schemas.append(value)
+        return name
+
+    def compile_schema(self, schema: Any) -> str:
+        if not isinstance(schema, dict):
+            raise SchemaNotCompilable(f"Unsupported schema: {schema!r}")
+
+        key = id(schema)
+        if key in self.names:
+            return self.names[key]
+
+        # Register function name before compiling its body to support
+        # recursive schemas
+        name = self.names[key] = f"is_valid_{len(self.schemas)}"
+        self.schemas.append(schema)
+
+        body = "\n".join(
+            f"    {line}" for line in self.compile_keywords(schema)
+        )
+        source = f"def {name}(x):\n{body}\n    return True\n"
+        exec(
+            compile(source, f"<rororo schema {name}>", "exec"), self.namespace
+        )
+        return name
+
+    def compile_keywords(self, schema: DictStrAny) -> List[str]:
+        if schema.get("id") or "patternProperties" in schema:
+            raise SchemaNotCompilable("Unsupported schema keywords")
+        if "discriminator" in schema and COMBINING_KEYWORDS & schema.keys():
+            raise SchemaNotCompilable("Discriminator is not supported")
+
+        lines = []
+        if not schema.get("nullable", False):
+            lines.append("if x is None: return False")
+
+        for keyword, value in schema.items():
+            if keyword not in OAS30Validator.VALIDATORS:
+                continue
+
+            if keyword in DELEGATED_KEYWORDS:
+                lines.extend(self.compile_delegated(keyword, value, schema))
+                continue
+
+            if keyword in IGNORED_KEYWORDS:
+                continue
+
+            method = getattr(self, f"compile_{keyword.lstrip('$')}", None)
+            if method is None:
+                raise SchemaNotCompilable(f"Unsupported keyword: {keyword}")
+            lines.extend(method(value, schema))
+
+        return lines
+
+    def compile_additionalProperties(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        if value is True:
+            return []
+
+        properties = self.add_constant(frozenset(schema.get("properties", {})))
+        if value is False:
+            return [
+                "if isinstance(x, dict):",
+                "    for key in x:",
+                f"        if key not in {properties}: return False",
+            ]
+
+        is_valid = self.compile_schema(value)
+        return [
+            "if isinstance(x, dict):",
+            "    for key, item in x.items():",
+            f"        if key not in {properties} and not {is_valid}(item):",
+            "            return False",
+        ]
+
+    def compile_allOf(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        names = self.compile_subschemas(value)
+        if not names:
+            return []
+        return [f"if not ({' and '.join(names)}): return False"]
+
+    def compile_anyOf(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        names = self.compile_subschemas(value)
+        return [f"if not ({' or '.join(names) or 'False'}): return False"]
+
+    def compile_delegated(
+        self, keyword: str, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        func = self.add_constant(OAS30Validator.VALIDATORS[keyword])
+        value_name = self.add_constant(value)
+        schema_name = self.add_constant(schema)
+        return [
+            f"for _ in {func}(validator, {value_name}, x, {schema_name}):",
+            "    return False",
+        ]
+
+    def compile_format(self, value: Any, schema: DictStrAny) -> List[str]:
+        return [
+            "if x is not None:",
+            "    try:",
+            f"        check_format(x, {value!r})",
+            "    except FormatError:",
+            "        return False",
+        ]
+
+    def compile_items(self, value: Any, schema: DictStrAny) -> List[str]:
+        is_valid = self.compile_schema(value)
+        return [
+            "if isinstance(x, list):",
+            "    for item in x:",
+            f"        if not {is_valid}(item): return False",
+        ]
+
+    def compile_maximum(self, value: Any, schema: DictStrAny) -> List[str]:
+        operator = ">=" if schema.get("exclusiveMaximum", False) else ">"
+        return [
+            f"if {TYPE_CHECKS['number']} and "
+            f"x {operator} {self.add_constant(value)}: return False"
+        ]
+
+    def compile_maxItems(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        return [
+            f"if isinstance(x, list) and len(x) > {self.add_constant(value)}:",
+            "    return False",
+        ]
+
+    def compile_maxLength(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        return [
+            f"if {TYPE_CHECKS['string']} and "
+            f"len(x) > {self.add_constant(value)}: return False"
+        ]
+
+    def compile_maxProperties(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        return [
+            f"if isinstance(x, dict) and len(x) > {self.add_constant(value)}:",
+            "    return False",
+        ]
+
+    def compile_minimum(self, value: Any, schema: DictStrAny) -> List[str]:
+        operator = "<=" if schema.get("exclusiveMinimum", False) else "<"
+        return [
+            f"if {TYPE_CHECKS['number']} and "
+            f"x {operator} {self.add_constant(value)}: return False"
+        ]
+
+    def compile_minItems(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        return [
+            f"if isinstance(x, list) and len(x) < {self.add_constant(value)}:",
+            "    return False",
+        ]
+
+    def compile_minLength(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        return [
+            f"if {TYPE_CHECKS['string']} and "
+            f"len(x) < {self.add_constant(value)}: return False"
+        ]
+
+    def compile_minProperties(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        return [
+            f"if isinstance(x, dict) and len(x) < {self.add_constant(value)}:",
+            "    return False",
+        ]
+
+    def compile_not(self, value: Any, schema: DictStrAny) -> List[str]:
+        return [f"if {self.compile_schema(value)}(x): return False"]
+
+    def compile_oneOf(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        names = self.compile_subschemas(value)
+        return [f"if ({' + '.join(names) or '0'}) != 1: return False"]
+
+    def compile_pattern(self, value: Any, schema: DictStrAny) -> List[str]:
+        try:
+            pattern = self.add_constant(re.compile(value).search)
+        except (re.error, TypeError):
+            raise SchemaNotCompilable(f"Invalid pattern: {value!r}")
+        return [
+            f"if {TYPE_CHECKS['string']} and not {pattern}(x): return False"
+        ]
+
+    def compile_properties(self, value: Any, schema: DictStrAny) -> List[str]:
+        if not isinstance(value, dict):
+            raise SchemaNotCompilable(f"Unsupported properties: {value!r}")
+
+        lines = ["if isinstance(x, dict):"]
+        for name, subschema in value.items():
+            is_valid = self.compile_schema(subschema)
+            lines.append(
+                f"    if {name!r} in x and not {is_valid}(x[{name!r}]): "
+                "return False"
+            )
+        return lines
+
+    def compile_readOnly(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        if value and self.context == UnmarshalContext.REQUEST:
+            return ["return False"]
+        return []
+
+    def compile_ref(self, value: Any, schema: DictStrAny) -> List[str]:
+        try:
+            scope, resolved = self.resolver.resolve(value)  # type: ignore[no-untyped-call]
+        except Exception:
+            raise SchemaNotCompilable(f"Unable to resolve {value!r}")
+
+        self.resolver.push_scope(scope)
+        try:
+            return [f"if not {self.compile_schema(resolved)}(x): return False"]
+        finally:
+            self.resolver.pop_scope()
+
+    def compile_required(self, value: Any, schema: DictStrAny) -> List[str]:
+        if not isinstance(value, list):
+            raise SchemaNotCompilable(f"Unsupported required: {value!r}")
+
+        properties = schema.get("properties", {})
+        required = []
+        for name in value:
+            # Same as ``openapi-schema-validator`` do not require read only
+            # properties in request & write only properties in response
+            subschema = properties.get(name)
+            if subschema:
+                if (
+                    self.context == UnmarshalContext.REQUEST
+                    and subschema.get("readOnly", False)
+                ) or (
+                    self.context == UnmarshalContext.RESPONSE
+                    and subschema.get("writeOnly", False)
+                ):
+                    continue
+            required.append(f"{name!r} not in x")
+
+        if not required:
+            return []
+        return [
+            f"if isinstance(x, dict) and ({' or '.join(required)}): "
+            "return False"
+        ]
+
+    def compile_subschemas(self, value: Any) -> List[str]:
+        if not isinstance(value, list):
+            raise SchemaNotCompilable(f"Unsupported subschemas: {value!r}")
+        return [f"{self.compile_schema(item)}(x)" for item in value]
+
+    def compile_type(self, value: Any, schema: DictStrAny) -> List[str]:
+        try:
+            type_check = TYPE_CHECKS[value]
+        except (KeyError, TypeError):
+            raise SchemaNotCompilable(f"Unsupported type: {value!r}")
+        return [f"if x is not None and not ({type_check}): return False"]
+
+    def compile_writeOnly(  # noqa: N802
+        self, value: Any, schema: DictStrAny
+    ) -> List[str]:
+        if value and self.context == UnmarshalContext.RESPONSE:
+            return ["return False"]
+        return []
+
+
+class CompiledUnmarshaller:
+    """Unmarshal values, which are valid for compiled schema.
+
+    When value is not valid for the schema (or for ``None`` values), call
+    ``openapi-core`` unmarshaller to get the same result (or the same
+    validation error), as without compiled validation engine.
+    """
+
+    __slots__ = ("fallback", "is_valid", "unmarshal")
+
+    def __init__(self, fallback: Unmarshal) -> None:
+        self.fallback = fallback
+        self.is_valid: Union[IsValid, None] = None
+        self.unmarshal: Unmarshal = fallback
+
+    def __call__(self, value: Any = NoValue) -> Any:
+        is_valid = self.is_valid
+        if (
+            is_valid is None
+            or value is None
+            or value is NoValue
+            or not is_valid(value)
+        ):
+            return self.fallback(value)
+        return self.unmarshal(value)
+
+    def unmarshal_valid(self, value: Any) -> Any:
+        """Unmarshal value, which is already validated by parent schema."""
+        if self.is_valid is None or value is None:
+            return self.fallback(value)
+        return self.unmarshal(value)
+
+
+class CompiledAnyUnmarshaller(CompiledUnmarshaller):
+    """Unmarshal values for schemas without type.
+
+    Same as ``openapi-core`` any unmarshaller, do not validate value against
+    the schema itself, but use first valid ``oneOf`` / ``allOf`` subschema
+    or first schema type matched given value.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, value: Any = NoValue) -> Any:
+        if self.is_valid is None or value is NoValue:
+            return self.fallback(value)
+        return self.unmarshal(value)
+
+    def unmarshal_valid(self, value: Any) -> Any:
+        return self(value)
+
+
+def compile_unmarshaller(
+    unmarshaller: CompiledUnmarshaller,
+    schema: Schema,
+    *,
+    compiler: SchemaCompiler,
+    factory: UnmarshallersFactory,
+    type_override: Union[SchemaType, None] = None,
+) -> None:
+    """Compile schema validator & unmarshal function for the unmarshaller.
+
+    Unmarshaller instance already should be cached by the factory to support
+    recursive schemas. On errors unmarshaller will use ``openapi-core``
+    unmarshaller for all values.
+    """
+    schema_type = type_override or schema.type
+    if (schema_type == SchemaType.ANY) != isinstance(
+        unmarshaller, CompiledAnyUnmarshaller
+    ):
+        raise SchemaNotCompilable("Invalid unmarshaller class")
+
+    is_valid = compiler.compile(schema.__dict__)
+
+    unmarshal: Unmarshal
+    if schema_type == SchemaType.ANY:
+        unmarshal = compile_any_unmarshal(
+            schema, compiler=compiler, factory=factory
+        )
+    elif schema_type == SchemaType.ARRAY:
+        unmarshal = compile_array_unmarshal(schema, factory=factory)
+    elif schema_type == SchemaType.OBJECT:
+        unmarshal = compile_object_unmarshal(schema, factory=factory)
+    else:
+        unmarshal = compile_primitive_unmarshal(
+            schema, factory=factory, type_override=type_override
+        )
+
+    unmarshaller.unmarshal = unmarshal
+    unmarshaller.is_valid = is_valid
+
+
+def compile_any_unmarshal(
+    schema: Schema, *, compiler: SchemaCompiler, factory: UnmarshallersFactory
+) -> Unmarshal:
+    if schema.format is not None:
+        raise SchemaNotCompilable("Schema without type cannot have format")
+
+    one_of = [
+        (compiler.compile(item.__dict__), get_unmarshal_valid(factory, item))
+        for item in schema.one_of
+    ]
+    all_of = [
+        (compiler.compile(item.__dict__), get_unmarshal_valid(factory, item))
+        for item in schema.all_of
+        if item.type != SchemaType.ANY
+    ]
+    by_type = []
+    for schema_type in ANY_SCHEMA_TYPES_ORDER:
+        klass = get_unmarshaller_class(factory, schema_type)
+        formatter = factory.get_formatter(klass.FORMATTERS, schema.format)
+        by_type.append(
+            (formatter.validate, factory.create(schema, schema_type))
+        )
+
+    def unmarshal(value: Any) -> Any:
+        for is_valid, unmarshal_valid in one_of:
+            if is_valid(value):
+                return unmarshal_valid(value)
+
+        for is_valid, unmarshal_valid in all_of:
+            if is_valid(value):
+                return unmarshal_valid(value)
+
+        for validate, unmarshaller in by_type:
+            if validate(value):
+                return unmarshaller(value)
+
+        logger.warning("failed to unmarshal any type")
+        return value
+
+    return unmarshal
+
+
+def compile_array_unmarshal(
+    schema: Schema, *, factory: UnmarshallersFactory
+) -> Unmarshal:
+    if schema.format is not None or schema.items is None:
+        raise SchemaNotCompilable("Unsupported array schema")
+
+    unmarshal_item = get_unmarshal_valid(factory, schema.items)
+
+    def unmarshal(value: Any) -> Any:
+        return [unmarshal_item(item) for item in value]
+
+    return unmarshal
+
+
+def compile_object_unmarshal(
+    schema: Schema, *, factory: UnmarshallersFactory
+) -> Unmarshal:
+    if schema.format is not None or "x-model" in schema.extensions:
+        raise SchemaNotCompilable("Unsupported object schema")
+
+    if not schema.one_of:
+        return compile_properties_unmarshal(schema, factory=factory)
+
+    one_of = [
+        compile_properties_unmarshal(schema, item, factory=factory)
+        for item in schema.one_of
+    ]
+
+    def unmarshal(value: Any) -> Any:
+        properties = None
+        for unmarshal_properties in one_of:
+            try:
+                unmarshalled = unmarshal_properties(value)
+            except (UnmarshalError, ValueError):
+                continue
+
+            if properties is not None:
+                logger.warning("multiple valid oneOf schemas found")
+                continue
+            properties = unmarshalled
+
+        if properties is None:
+            logger.warning("valid oneOf schema not found")
+
+        return properties
+
+    return unmarshal
+
+
+def compile_primitive_unmarshal(
+    schema: Schema,
+    *,
+    factory: UnmarshallersFactory,
+    type_override: Union[SchemaType, None] = None,
+) -> Unmarshal:
+    klass = get_unmarshaller_class(factory, type_override or schema.type)
+    formatter_unmarshal = factory.get_formatter(
+        klass.FORMATTERS, schema.format
+    ).unmarshal
+    schema_format = schema.format
+
+    def unmarshal(value: Any) -> Any:
+        try:
+            return formatter_unmarshal(value)
+        except ValueError as err:
+            raise InvalidSchemaFormatValue(value, schema_format, err)
+
+    return unmarshal
+
+
+def compile_properties_unmarshal(
+    schema: Schema,
+    one_of_schema: Union[Schema, None] = None,
+    *,
+    factory: UnmarshallersFactory,
+) -> Unmarshal:
+    """Compile unmarshalling object properties.
+
+    Properties from ``oneOf`` subschema are not validated by the parent
+    schema validator, so they need to be validated on unmarshalling.
+    """
+    all_properties = schema.get_all_properties()
+    validated: Set[str] = set(all_properties)
+    if one_of_schema is not None:
+        one_of_properties = one_of_schema.get_all_properties()
+        all_properties.update(one_of_properties)
+        validated -= set(one_of_properties)
+
+    names = frozenset(all_properties)
+    context = factory.context
+
+    additional: Union[Unmarshal, None] = None
+    additional_properties = schema.additional_properties
+    if isinstance(additional_properties, Schema):
+        additional = get_unmarshal_valid(factory, additional_properties)
+    elif additional_properties is True:
+        additional = identity
+
+    properties = []
+    for name, prop in all_properties.items():
+        if (context == UnmarshalContext.REQUEST and prop.read_only) or (
+            context == UnmarshalContext.RESPONSE and prop.write_only
+        ):
+            continue
+
+        unmarshaller = factory.create(prop)
+        properties.append(
+            (
+                name,
+                (
+                    get_unmarshal_valid(factory, prop)
+                    if name in validated
+                    else unmarshaller
+                ),
+                unmarshaller,
+                prop.default,
+            )
+        )
+
+    def unmarshal(value: Any) -> Any:
+        result = {}
+        if additional is not None:
+            for name in value.keys() - names:
+                result[name] = additional(value[name])
+
+        for name, unmarshal_value, unmarshal_default, default in properties:
+            if name in value:
+                result[name] = unmarshal_value(value[name])
+            elif default is not NoValue:
+                result[name] = unmarshal_default(default)
+
+        return result
+
+    return unmarshal
+
+
+def get_unmarshal_valid(
+    factory: UnmarshallersFactory, schema: Schema
+) -> Unmarshal:
+    unmarshaller = factory.create(schema)
+    if isinstance(unmarshaller, CompiledUnmarshaller):
+        return unmarshaller.unmarshal_valid
+    return unmarshaller
+
+
+def get_unmarshaller_class(
+    factory: UnmarshallersFactory, schema_type: SchemaType
+) -> Any:
+    return {
+        **factory.PRIMITIVE_UNMARSHALLERS,  # type: ignore[attr-defined]
+        **factory.COMPLEX_UNMARSHALLERS,  # type: ignore[attr-defined]
+    }[schema_type]
+
+
+def identity(value: Any) -> Any:
+    return value
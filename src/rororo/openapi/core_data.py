@@ -1,8 +1,13 @@
-from typing import cast, Union
+from itertools import chain
+from typing import Any, cast, Dict, Iterable, Mapping, Tuple, Union
 
-from aiohttp import hdrs, web
+import attr
+from aiohttp import StreamReader, web
 from aiohttp.payload import IOBasePayload, Payload
+from multidict import CIMultiDict, MultiDict
+from openapi_core.schema.media_types.exceptions import InvalidContentType
 from openapi_core.schema.operations.models import Operation
+from openapi_core.schema.schemas.enums import SchemaFormat, SchemaType
 from openapi_core.schema.specs.models import Spec
 from openapi_core.validation.request.datatypes import (
     OpenAPIRequest,
@@ -11,39 +16,191 @@ from openapi_core.validation.request.datatypes import (
 from openapi_core.validation.response.datatypes import OpenAPIResponse
 from yarl import URL
 
-from rororo.annotations import Handler
-from rororo.openapi.constants import HANDLER_OPENAPI_MAPPING_KEY
+from rororo.annotations import MappingStrAny
+from rororo.openapi.constants import (
+    APP_OPENAPI_MAX_BODY_SIZES_KEY,
+    REQUEST_CORE_OPERATION_KEY,
+    STREAM_REQUEST_BODY_EXTENSION,
+)
 from rororo.openapi.exceptions import OperationError
-from rororo.openapi.utils import get_openapi_spec
+from rororo.openapi.responses import JSONResponse
 
 
-def find_core_operation(
-    request: web.Request, handler: Handler
-) -> Union[Operation, None]:
-    mapping = getattr(handler, HANDLER_OPENAPI_MAPPING_KEY, None)
-    if not mapping:
-        return None
+#: Mimetypes of request bodies, which size cannot be derived from the schema
+NOT_RAW_MIMETYPES = frozenset(
+    (
+        "application/json",
+        "application/x-www-form-urlencoded",
+        "multipart/form-data",
+    )
+)
+
+
+#: Whether ``openapi-core`` request parameters expect headers as a dict (or
+#: as an iterable of header items otherwise), detected once at import time
+IS_HEADER_DICT_FACTORY = (
+    attr.fields(RequestParameters).header.default.factory == dict
+)
+
+
+class OperationRequest(OpenAPIRequest):
+    """OpenAPI core request, bound to OpenAPI core operation of matched route.
+
+    As aiohttp.web router already matched the route for the request, there is
+    no need to find path, operation & server for the request in OpenAPI spec
+    once again on validating it.
+
+    If request security is already validated (before reading request body),
+    it is not validated once again as well.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        core_operation: Union[Operation, None] = None,
+        security: Union[MappingStrAny, None] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.core_operation = core_operation
+        self.security = security
 
-    operation_id = mapping.get(request.method) or mapping.get(hdrs.METH_ANY)
-    if operation_id is None:
-        return None
 
+@attr.dataclass(frozen=True, slots=True)
+class ParameterNames:
+    """Names of request parameters, which operation actually needs.
+
+    Contains names of declared operation (and path) parameters, as well as
+    names of parameters needed to get security data of the operation, per
+    location. Path parameters are not listed, as all of them are declared.
+    """
+
+    query: Tuple[str, ...] = ()
+    header: Tuple[str, ...] = ()
+    cookie: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[str, str]]) -> "ParameterNames":
+        """Create parameter names from ``(location, name)`` items."""
+        names: Dict[str, Dict[str, None]] = {
+            "query": {},
+            "header": {},
+            "cookie": {},
+        }
+        for location, name in items:
+            if location in names:
+                names[location][name] = None
+        return cls(
+            query=tuple(names["query"]),
+            header=tuple(names["header"]),
+            cookie=tuple(names["cookie"]),
+        )
+
+
+@attr.dataclass(frozen=True, slots=True)
+class RequestBodyStream:
+    """Request body, which is read from the request stream on validating it.
+
+    Passed to openapi-core request instead of request body bytes for
+    operations, which stream JSON array request bodies. Reading more than
+    ``max_size`` bytes from the stream results in 413 error.
+    """
+
+    content: StreamReader
+    max_size: Union[int, None] = None
+
+
+@attr.dataclass(frozen=True, slots=True)
+class ResponseData:
+    """Data of JSON response, which is not dumped to JSON yet.
+
+    Passed to openapi-core response as is to validate response data without
+    loading it back from JSON bytes.
+    """
+
+    value: Any
+
+
+def ensure_content_length(
+    request: web.Request, max_body_size: Union[int, None]
+) -> None:
+    """Ensure request content length does not exceed max body size."""
+    content_length = request.content_length
+    if (
+        max_body_size is not None
+        and content_length is not None
+        and content_length > max_body_size
+    ):
+        raise web.HTTPRequestEntityTooLarge(
+            max_size=max_body_size, actual_size=content_length
+        )
+
+
+def estimate_json_size(value: Any, limit: int) -> int:
+    """Estimate size of value dumped to JSON, without dumping it.
+
+    Stop walking the value as soon as estimated size reaches given limit, so
+    the cost of estimating is bounded by the limit instead of the value size.
+    """
+    size = 0
+    stack = [value]
+    while stack and size < limit:
+        item = stack.pop()
+        if isinstance(item, str):
+            size += len(item) + 2
+        elif isinstance(item, Mapping):
+            # Account braces, colons & commas before walking mapping items
+            size += 2 + 2 * len(item)
+            if size < limit:
+                stack.extend(chain.from_iterable(item.items()))
+        elif isinstance(item, (list, tuple)):
+            # Account brackets & commas before walking array items
+            size += 2 + len(item)
+            if size < limit:
+                stack.extend(item)
+        else:
+            size += 4
+    return size
+
+
+def get_body_size(body: Any, limit: int) -> Union[int, None]:
+    """Get (estimated) size of request or response body in bytes.
+
+    Size of not dumped JSON response data is estimated up to given limit.
+    Return ``None`` for missing bodies & bodies, which read from the request
+    stream, as their size is unknown.
+    """
+    if isinstance(body, (bytes, bytearray, str)):
+        return len(body)
+    if isinstance(body, ResponseData):
+        return estimate_json_size(body.value, limit)
+    return None
+
+
+def get_core_operation(
+    core_operations: Mapping[str, Operation], operation_id: str
+) -> Operation:
+    """Get OpenAPI core operation from operation ID -> operation mapping."""
     try:
-        return get_core_operation(
-            get_openapi_spec(request.config_dict), operation_id
+        return core_operations[operation_id]
+    except KeyError:
+        raise OperationError(
+            f"Unable to find operation '{operation_id}' in given OpenAPI spec"
         )
-    except OperationError:
-        return None
 
 
-def get_core_operation(spec: Spec, operation_id: str) -> Operation:
-    for path in spec.paths.values():
-        for operation in path.operations.values():
-            if operation.operation_id == operation_id:
-                return operation
-    raise OperationError(
-        f"Unable to find operation '{operation_id}' in given OpenAPI spec"
-    )
+def get_core_operations(spec: Spec) -> Dict[str, Operation]:
+    """Index all OpenAPI core operations in the spec by their IDs.
+
+    Operations without ``operationId`` cannot be registered as view handlers,
+    so they are not indexed.
+    """
+    return {
+        operation.operation_id: operation
+        for path in spec.paths.values()
+        for operation in path.operations.values()
+        if operation.operation_id is not None
+    }
 
 
 def get_full_url_pattern(request: web.Request) -> str:
@@ -52,6 +209,74 @@ def get_full_url_pattern(request: web.Request) -> str:
     return full_url.human_repr()
 
 
+def get_max_body_size(
+    core_operation: Union[Operation, None],
+    mimetype: str,
+    max_body_sizes: Mapping[str, int],
+) -> Union[int, None]:
+    """Get max request body size (in bytes) for given operation & mimetype.
+
+    Max body size is taken from ``x-rororo-max-body-size`` operation extension
+    if it is defined, otherwise it is derived from the request body schema,
+    where it is possible. It is possible only for string request bodies with
+    ``maxLength``, but not for JSON or form request bodies, as their size
+    might not be limited by schema (due to whitespaces, escaping, etc).
+    """
+    if core_operation is None:
+        return None
+
+    max_body_size = max_body_sizes.get(core_operation.operation_id)
+    if max_body_size is not None:
+        return max_body_size
+
+    request_body = core_operation.request_body
+    if request_body is None or mimetype in NOT_RAW_MIMETYPES:
+        return None
+
+    try:
+        schema = request_body[mimetype].schema
+    except InvalidContentType:
+        return None
+
+    if (
+        schema is None
+        or schema.type != SchemaType.STRING
+        or schema.max_length is None
+    ):
+        return None
+
+    # Binary string length is a number of bytes, while for text strings each
+    # char might take up to 4 bytes in UTF-8
+    if schema.format == SchemaFormat.BINARY.value:
+        return cast(int, schema.max_length)
+    return cast(int, schema.max_length) * 4
+
+
+def get_parameter_names(
+    spec: Spec,
+    core_operation: Operation,
+    extra_items: Iterable[Tuple[str, str]] = (),
+) -> ParameterNames:
+    """Get names of parameters, declared for the operation & its path.
+
+    Pass ``extra_items`` to include names of other needed parameters (such
+    as parameters to get security data from) as well.
+    """
+    path_parameters = spec.paths[core_operation.path_name].parameters
+    return ParameterNames.from_items(
+        chain(
+            (
+                (parameter.location.value, parameter.name)
+                for parameter in chain(
+                    core_operation.parameters.values(),
+                    path_parameters.values(),
+                )
+            ),
+            extra_items,
+        )
+    )
+
+
 def get_path_pattern(request: web.Request) -> str:
     """Get path pattern for given :class:`aiohttp.web.Request` instance.
 
@@ -63,29 +288,180 @@ def get_path_pattern(request: web.Request) -> str:
     return cast(str, formatter if formatter is not None else info.get("path"))
 
 
-async def to_core_openapi_request(request: web.Request) -> OpenAPIRequest:
+def get_stream_max_body_size(
+    request: web.Request, max_body_size: Union[int, None]
+) -> Union[int, None]:
+    """Get max size of request body, which is read from the request stream.
+
+    Reading from the request stream bypasses ``client_max_size`` check of
+    ``aiohttp.web``, so the smallest of application limit & max body size of
+    the operation is used. ``aiohttp.web`` treats ``0`` as no limit.
+    """
+    client_max_size = request._client_max_size
+    if not client_max_size:
+        return max_body_size
+    if max_body_size is None:
+        return client_max_size
+    return min(client_max_size, max_body_size)
+
+
+def is_stream_request_body(
+    core_operation: Union[Operation, None], mimetype: str
+) -> bool:
+    """Check whether request body needs to be streamed.
+
+    Only JSON array request bodies of operations, which enable
+    ``x-rororo-stream-request-body`` extension, are streamed.
+    """
+    if core_operation is None or mimetype != "application/json":
+        return False
+
+    extension = core_operation.extensions.get(STREAM_REQUEST_BODY_EXTENSION)
+    if extension is None or extension.value is not True:
+        return False
+
+    request_body = core_operation.request_body
+    if request_body is None:
+        return False
+
+    try:
+        schema = request_body[mimetype].schema
+    except InvalidContentType:
+        return False
+
+    return schema is not None and schema.type == SchemaType.ARRAY
+
+
+def is_text_request_body(
+    core_operation: Union[Operation, None], mimetype: str
+) -> bool:
+    """Check whether request body needs to be decoded into string.
+
+    There is no need to decode request body, when,
+
+    - Operation does not expect request body at all
+    - Request body is JSON, as JSON loads function accepts bytes
+    - Request body schema is a binary string
+    """
+    if core_operation is None:
+        return True
+
+    request_body = core_operation.request_body
+    if request_body is None or mimetype == "application/json":
+        return False
+
+    try:
+        schema = request_body[mimetype].schema
+    except InvalidContentType:
+        return True
+
+    return not (
+        schema is not None
+        and schema.type == SchemaType.STRING
+        and schema.format == SchemaFormat.BINARY.value
+    )
+
+
+async def read_request_body(
+    request: web.Request, max_body_size: Union[int, None]
+) -> bytes:
+    """Read request body, ensuring it is not larger than max body size.
+
+    Request ``Content-Length`` is checked before reading request body, while
+    size of chunked request body is checked on reading each chunk. In both
+    cases :class:`aiohttp.web.HTTPRequestEntityTooLarge` is raised for larger
+    request bodies. Max body size of ``0`` means no request body allowed.
+    """
+    if max_body_size is None:
+        return await request.read()
+
+    ensure_content_length(request, max_body_size)
+
+    # If application limit is not greater than max body size, reuse
+    # aiohttp.web logic of reading request body, which checks its size and
+    # caches read request body. ``aiohttp.web`` treats ``0`` as no limit
+    client_max_size = request._client_max_size
+    if client_max_size and client_max_size <= max_body_size:
+        return await request.read()
+
+    body = bytearray()
+    async for chunk in request.content.iter_any():
+        body.extend(chunk)
+        if len(body) > max_body_size:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=max_body_size, actual_size=len(body)
+            )
+
+    # Cache read request body the same way as ``aiohttp.web`` does, so
+    # ``request.read()``, ``request.text()`` & ``request.post()`` calls in
+    # the handler return request body instead of empty bytes
+    request._read_bytes = data = bytes(body)
+    return data
+
+
+async def to_core_openapi_request(
+    request: web.Request,
+    *,
+    parameters: Union[RequestParameters, None] = None,
+    security: Union[MappingStrAny, None] = None,
+) -> OpenAPIRequest:
     """Convert aiohttp.web request to openapi-core request.
 
     Afterwards opeanpi-core request can be used for validation request data
     against spec.
+
+    If OpenAPI core operation for the request is already known, bind it to the
+    openapi-core request to avoid looking up for it on validating.
+
+    Request body larger than max body size of the operation is not read, but
+    rejected with 413 error. Otherwise, request body is passed to
+    openapi-core request as is, without copying it into string, unless the
+    operation expects text request body. For
+    operations, which stream JSON array request bodies, request body is not
+    read at all, but read from the request stream on validating it.
+
+    Pass ``parameters`` & ``security``, if request parameters are already
+    converted & request security is already validated.
     """
-    body: Union[bytes, str, None] = None
+    core_operation = request.get(REQUEST_CORE_OPERATION_KEY)
+
+    body: Union[bytes, str, RequestBodyStream, None] = None
     if request.body_exists and request.can_read_body:
-        raw_body = await request.read()
+        max_body_size = get_max_body_size(
+            core_operation,
+            request.content_type,
+            request.config_dict.get(APP_OPENAPI_MAX_BODY_SIZES_KEY) or {},
+        )
+
+        if is_stream_request_body(core_operation, request.content_type):
+            ensure_content_length(request, max_body_size)
+            body = RequestBodyStream(
+                request.content,
+                max_size=get_stream_max_body_size(request, max_body_size),
+            )
+        else:
+            body = await read_request_body(request, max_body_size)
 
-        # If it possible, convert bytes to string
-        try:
-            body = raw_body.decode("utf-8")
-        # If not, use bytes as request body instead
-        except UnicodeDecodeError:
-            body = raw_body
+            if is_text_request_body(core_operation, request.content_type):
+                # If it possible, convert bytes to string
+                try:
+                    body = body.decode("utf-8")
+                # If not, use bytes as request body instead
+                except UnicodeDecodeError:
+                    pass
 
-    return OpenAPIRequest(
+    return OperationRequest(
         full_url_pattern=get_full_url_pattern(request),
         method=request.method.lower(),
         body=body,
         mimetype=request.content_type,
-        parameters=to_core_request_parameters(request),
+        parameters=(
+            to_core_request_parameters(request)
+            if parameters is None
+            else parameters
+        ),
+        core_operation=core_operation,
+        security=security,
     )
 
 
@@ -100,7 +476,10 @@ def to_core_openapi_response(response: web.StreamResponse) -> OpenAPIResponse:
 
 def to_core_openapi_response_data(
     response: web.StreamResponse,
-) -> Union[bytes, None]:
+) -> Union[bytes, ResponseData, None]:
+    if isinstance(response, JSONResponse) and not response.is_dumped:
+        return ResponseData(response.data)
+
     if isinstance(response, web.Response):
         body = response.body
         if not body:
@@ -117,17 +496,48 @@ def to_core_openapi_response_data(
     return None
 
 
-def to_core_request_parameters(request: web.Request) -> RequestParameters:
-    header_attr = [
-        item
-        for item in RequestParameters.__attrs_attrs__
-        if item.name == "header"
-    ][0]
-    is_dict_factory = header_attr.default.factory == dict
+def to_core_request_parameters(
+    request: web.Request,
+    parameter_names: Union[ParameterNames, None] = None,
+) -> RequestParameters:
+    """Convert aiohttp.web request parameters to openapi-core parameters.
+
+    If ``parameter_names`` are given, pass to openapi-core only those query
+    parameters, headers & cookies, which operation actually needs, instead of
+    converting all of them on each request.
+    """
+    if parameter_names is None:
+        return RequestParameters(
+            query=request.rel_url.query,
+            header=(
+                request.headers
+                if IS_HEADER_DICT_FACTORY
+                else request.headers.items()
+            ),
+            cookie=request.cookies,
+            path=request.match_info,
+        )
+
+    query = request.rel_url.query
+    request_headers = request.headers
+    headers = CIMultiDict(
+        (name, value)
+        for name in parameter_names.header
+        for value in request_headers.getall(name, ())
+    )
+    cookies = request.cookies
 
     return RequestParameters(
-        query=request.rel_url.query,
-        header=request.headers if is_dict_factory else request.headers.items(),
-        cookie=request.cookies,
+        query=MultiDict(
+            (name, value)
+            for name in parameter_names.query
+            for value in query.getall(name, ())
+        ),
+        header=headers if IS_HEADER_DICT_FACTORY else headers.items(),
+        cookie={
+            name: cookies[name]
+            for name in parameter_names.cookie
+            if name in cookies
+        },
         path=request.match_info,
     )
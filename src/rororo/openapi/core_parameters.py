@@ -0,0 +1,230 @@
+"""
+==============================
+rororo.openapi.core_parameters
+==============================
+
+Compile decoders for OpenAPI operation parameters.
+
+``openapi-core`` creates parameter deserializer & schema caster for each
+parameter on each request. Instead, compile decoder for each declared
+parameter of the operation once, which gets raw parameter value from the
+request, deserializes it according to parameter style & explode, and casts
+it to parameter schema type. Decoders raise same ``openapi-core`` errors as
+``openapi-core`` itself, so validation errors stay the same.
+
+"""
+
+import warnings
+from typing import Any, Callable, Dict, Iterable, Tuple, Union
+
+import attr
+from openapi_core.casting.schemas.exceptions import CastError as CoreCastError
+from openapi_core.casting.schemas.util import forcebool
+from openapi_core.deserializing.exceptions import DeserializeError
+from openapi_core.deserializing.parameters.exceptions import (
+    EmptyParameterValue,
+)
+from openapi_core.schema.parameters.enums import (
+    ParameterLocation,
+    ParameterStyle,
+)
+from openapi_core.schema.parameters.exceptions import (
+    MissingParameter,
+    MissingRequiredParameter,
+)
+from openapi_core.schema.parameters.models import Parameter
+from openapi_core.schema.schemas.enums import SchemaType
+from openapi_core.schema.schemas.models import Schema
+from openapi_core.schema.schemas.types import NoValue
+from openapi_core.validation.request.datatypes import RequestParameters
+
+from rororo.openapi.exceptions import CastError
+
+
+Cast = Callable[[Any], Any]
+Deserialize = Callable[[Any], Any]
+
+#: Python functions to cast raw parameter values to primitive schema types
+PRIMITIVE_CASTS: Dict[SchemaType, Cast] = {
+    SchemaType.BOOLEAN: forcebool,
+    SchemaType.INTEGER: int,
+    SchemaType.NUMBER: float,
+}
+
+#: Delimiters of array values for parameter styles, which do not explode
+STYLE_DELIMITERS = {
+    ParameterStyle.FORM: ",",
+    ParameterStyle.PIPE_DELIMITED: "|",
+    ParameterStyle.SIMPLE: ",",
+    ParameterStyle.SPACE_DELIMITED: " ",
+}
+
+
+@attr.dataclass(frozen=True, slots=True)
+class ParameterDecoder:
+    """Decode raw value of the parameter from request parameters.
+
+    Decoded value is not validated against parameter schema yet, which is
+    still a job of schema unmarshaller.
+    """
+
+    parameter: Parameter
+    name: str
+    location: str
+    required: bool
+    is_multi: bool
+    default: Any
+    deserialize: Deserialize
+    cast: Cast
+
+    def decode(self, parameters: RequestParameters) -> Any:
+        """Get, deserialize & cast parameter value from request parameters.
+
+        Raise ``MissingRequiredParameter`` for missing required parameters
+        & ``MissingParameter`` for missing parameters without default value.
+        """
+        source = parameters[self.location]
+        name = self.name
+
+        if name not in source:
+            if self.required:
+                raise MissingRequiredParameter(name)
+            if self.default is NoValue:
+                raise MissingParameter(name)
+            return self.default
+
+        if self.is_multi:
+            value = (
+                source.getall(name)
+                if hasattr(source, "getall")
+                else source.getlist(name)
+            )
+        else:
+            value = source[name]
+
+        try:
+            return self.cast(self.deserialize(value))
+        except CoreCastError as err:
+            # Pass parameter name to cast error
+            raise CastError(name=name, value=err.value, type=err.type)
+
+
+def compile_cast(schema: Union[Schema, None]) -> Cast:
+    """Compile function to cast raw value to the schema type.
+
+    Strings, objects & values of schemas without type are not casted.
+    """
+    if schema is None:
+        return identity
+
+    schema_type = schema.type
+    if schema_type in PRIMITIVE_CASTS:
+        return compile_primitive_cast(
+            PRIMITIVE_CASTS[schema_type], schema_type.value
+        )
+
+    if schema_type == SchemaType.ARRAY and schema.items is not None:
+        item_cast = compile_cast(schema.items)
+        if item_cast is identity:
+            return identity
+
+        def array_cast(value: Any) -> Any:
+            if value is None or value is NoValue:
+                return value
+            return [item_cast(item) for item in value]
+
+        return array_cast
+
+    return identity
+
+
+def compile_deserialize(parameter: Parameter) -> Deserialize:
+    """Compile function to deserialize raw value due to parameter style.
+
+    Only array & object values of parameters, which do not explode, need to
+    be split by style delimiter. Values of such parameters in styles without
+    delimiter (``deepObject``, ``label`` & ``matrix``) cannot be deserialized,
+    so ``DeserializeError`` is raised on decoding them, not on compiling.
+    """
+    is_query = parameter.location == ParameterLocation.QUERY
+    check_empty = is_query and not parameter.allow_empty_value
+    name = parameter.name
+    style = parameter.style
+
+    delimiter: Union[str, None] = None
+    is_supported = True
+    if parameter.aslist and not parameter.explode:
+        delimiter = STYLE_DELIMITERS.get(style)
+        is_supported = delimiter is not None
+
+    def deserialize(value: Any) -> Any:
+        if check_empty and value == "":
+            raise EmptyParameterValue(value, style, name)
+
+        if not is_supported:
+            raise DeserializeError(value, style)
+        if delimiter is None:
+            return value
+        try:
+            return value.split(delimiter)
+        except (ValueError, TypeError, AttributeError):
+            raise DeserializeError(value, style)
+
+    return deserialize
+
+
+def compile_parameter_decoder(parameter: Parameter) -> ParameterDecoder:
+    # Unlike ``openapi-core``, warn about deprecated parameter only once, on
+    # compiling its decoder, not on each request
+    if parameter.deprecated:
+        warnings.warn(
+            f"{parameter.name} parameter is deprecated", DeprecationWarning
+        )
+
+    schema = parameter.schema
+    return ParameterDecoder(
+        parameter=parameter,
+        name=parameter.name,
+        location=parameter.location.value,
+        required=parameter.required,
+        is_multi=bool(parameter.aslist and parameter.explode),
+        default=(
+            schema.default
+            if schema is not None and schema.has_default()
+            else NoValue
+        ),
+        deserialize=compile_deserialize(parameter),
+        cast=compile_cast(schema),
+    )
+
+
+def compile_parameter_decoders(
+    parameters: Iterable[Parameter],
+) -> Tuple[ParameterDecoder, ...]:
+    """Compile decoders for given parameters.
+
+    Operation parameters are expected to be passed before path parameters,
+    as first parameter with same name & location wins.
+    """
+    decoders: Dict[Tuple[str, str], ParameterDecoder] = {}
+    for parameter in parameters:
+        key = (parameter.name, parameter.location.value)
+        if key not in decoders:
+            decoders[key] = compile_parameter_decoder(parameter)
+    return tuple(decoders.values())
+
+
+def compile_primitive_cast(func: Cast, type_name: str) -> Cast:
+    def primitive_cast(value: Any) -> Any:
+        if value is None or value is NoValue:
+            return value
+        try:
+            return func(value)
+        except (ValueError, TypeError):
+            raise CoreCastError(value, type_name)
+
+    return primitive_cast
+
+
+def identity(value: Any) -> Any:
+    return value
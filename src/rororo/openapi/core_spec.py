@@ -0,0 +1,220 @@
+"""
+========================
+rororo.openapi.core_spec
+========================
+
+Create OpenAPI core spec lazily, to not pay the cost of creating spec objects
+for all schema operations on setting up OpenAPI, but only for operations,
+which are actually used.
+
+"""
+
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Mapping, Union
+
+from jsonschema.validators import RefResolver
+from openapi_core.schema.operations.models import Operation
+from openapi_core.schema.paths.models import Path
+from openapi_core.schema.specs.factories import SpecFactory
+from openapi_core.schema.specs.models import Spec
+from openapi_spec_validator import default_handlers
+from openapi_spec_validator.validators import PathItemValidator
+
+from rororo.annotations import DictStrAny
+
+
+class LazyOperation(Operation):
+    """OpenAPI core operation, which creates its spec objects on first use.
+
+    Only HTTP method, path name & operation ID are known from the start, which
+    is enough for registering the operation route. All other attributes, such
+    as parameters, request body & responses, are created on first access to
+    any of them under the operation lock.
+    """
+
+    def __init__(
+        self,
+        http_method: str,
+        path_name: str,
+        operation_id: Union[str, None],
+        *,
+        create_operation: Callable[[], Operation],
+    ) -> None:
+        # Do not call parent constructor as it requires all operation spec
+        # objects to be created
+        self.http_method = http_method
+        self.path_name = path_name
+        self.operation_id = operation_id
+        self._create_operation = create_operation
+        self._is_created = False
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Method called only for attributes, which are not set yet, which
+        # means operation spec objects are not created yet
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        with self._lock:
+            if not self._is_created:
+                self.__dict__.update(vars(self._create_operation()))
+                self._is_created = True
+
+        return object.__getattribute__(self, name)
+
+
+class LazySchemas(Mapping[str, Any]):
+    """Components schemas mapping, which creates each schema on first use."""
+
+    def __init__(self, factory: SpecFactory, schemas_spec: DictStrAny) -> None:
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._schemas: Dict[str, Any] = {}
+        self._schemas_spec = schemas_spec
+
+    def __getitem__(self, name: str) -> Any:
+        schema = self._schemas.get(name)
+        if schema is not None:
+            return schema
+
+        schema_spec = self._schemas_spec[name]
+        with self._lock:
+            schema = self._schemas.get(name)
+            if schema is None:
+                schema, _ = self._factory.schemas_registry.get_or_create(
+                    schema_spec
+                )
+                self._schemas[name] = schema
+
+        return schema
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schemas_spec)
+
+    def __len__(self) -> int:
+        return len(self._schemas_spec)
+
+
+def create_lazy_path(
+    factory: SpecFactory, path_name: str, path_spec: DictStrAny
+) -> Path:
+    dereferencer = factory.dereferencer
+    paths_generator = factory.paths_generator
+
+    path_deref = dereferencer.dereference(path_spec)
+    operations = []
+    for http_method, operation_spec in path_deref.items():
+        if http_method not in PathItemValidator.OPERATIONS:
+            continue
+
+        operation_deref = dereferencer.dereference(operation_spec)
+        operations.append(
+            (
+                http_method,
+                LazyOperation(
+                    http_method,
+                    path_name,
+                    operation_deref.get("operationId"),
+                    create_operation=partial(
+                        create_operation,
+                        factory,
+                        path_name,
+                        http_method,
+                        operation_deref,
+                    ),
+                ),
+            )
+        )
+
+    return Path(
+        path_name,
+        operations,
+        parameters=list(
+            paths_generator.parameters_generator.generate_from_list(
+                path_deref.get("parameters", [])
+            )
+        ),
+        summary=path_deref.get("summary"),
+        description=path_deref.get("description"),
+        servers=list(
+            paths_generator.servers_generator.generate(
+                path_deref.get("servers", [])
+            )
+        ),
+        extensions=paths_generator.extensions_generator.generate(path_deref),
+    )
+
+
+def create_lazy_spec(schema: DictStrAny) -> Spec:
+    """Create OpenAPI core spec, which creates its operations on first use.
+
+    Unlike ``openapi_core.shortcuts.create_spec`` the function does not
+    validate OpenAPI schema and does not create spec objects for paths
+    operations & components schemas. Instead each operation is created on
+    first access to its data (on first request to the operation in most
+    cases), and each components schema on first access to it.
+    """
+    factory = SpecFactory(
+        RefResolver("", schema, handlers=default_handlers),
+        config={"validate_spec": False},
+    )
+    dereferencer = factory.dereferencer
+
+    schema_deref = dereferencer.dereference(schema)
+    components_deref = dereferencer.dereference(
+        schema_deref.get("components", {})
+    )
+
+    components = factory.components_factory.create(
+        {
+            key: value
+            for key, value in components_deref.items()
+            if key != "schemas"
+        }
+    )
+    components.schemas = LazySchemas(
+        factory, dereferencer.dereference(components_deref.get("schemas", {}))
+    )
+
+    return Spec(
+        factory.info_factory.create(schema_deref.get("info", {})),
+        [
+            (path_name, create_lazy_path(factory, path_name, path_spec))
+            for path_name, path_spec in dereferencer.dereference(
+                schema_deref.get("paths", {})
+            ).items()
+        ],
+        servers=list(
+            factory.servers_generator.generate(
+                schema_deref.get("servers") or [{"url": "/"}]
+            )
+        ),
+        components=components,
+        security=list(
+            factory.security_requirements_generator.generate(
+                schema_deref.get("security", [])
+            )
+        ),
+        extensions=factory.extensions_generator.generate(schema_deref),
+        _resolver=factory.spec_resolver,
+    )
+
+
+def create_operation(
+    factory: SpecFactory,
+    path_name: str,
+    http_method: str,
+    operation_spec: DictStrAny,
+) -> Operation:
+    ((_, operation),) = factory.paths_generator.operations_generator.generate(
+        path_name, {http_method: operation_spec}
+    )
+
+    # Same as ``rororo.openapi.openapi.fix_spec_operations`` does, set up
+    # operation security to ``None`` if it is not defined within the
+    # operation schema
+    if operation.security == []:
+        operation.security = operation_spec.get("security")
+
+    return operation
@@ -1,15 +1,45 @@
+import asyncio
+import contextvars
+import datetime
+import json
+import re
+import threading
 from collections import deque
-from functools import partial
-from typing import Any, cast, Dict, Iterator, List, Tuple, Union
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import chain
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    cast,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-import pyrsistent
+import attr
+from aiohttp import web
+from aiohttp.helpers import ChainMapProxy
 from email_validator import EmailNotValidError, validate_email
-from isodate import parse_datetime
+from isodate import parse_datetime as parse_iso_date_time
+from jsonschema import FormatChecker
 from jsonschema.exceptions import FormatError
 from more_itertools import peekable
 from openapi_core.casting.schemas.exceptions import CastError as CoreCastError
+from openapi_core.deserializing.exceptions import DeserializeError
 from openapi_core.exceptions import OpenAPIError as CoreOpenAPIError
+from openapi_core.schema.media_types.models import MediaType
 from openapi_core.schema.operations.models import Operation
+from openapi_core.schema.parameters.exceptions import (
+    MissingParameter,
+    MissingRequiredParameter,
+)
 from openapi_core.schema.parameters.models import Parameter
 from openapi_core.schema.paths.models import Path
 from openapi_core.schema.schemas.enums import SchemaFormat, SchemaType
@@ -24,7 +54,10 @@ from openapi_core.templating.paths.exceptions import (
 )
 from openapi_core.templating.paths.finders import PathFinder as CorePathFinder
 from openapi_core.unmarshalling.schemas.enums import UnmarshalContext
-from openapi_core.unmarshalling.schemas.exceptions import InvalidSchemaValue
+from openapi_core.unmarshalling.schemas.exceptions import (
+    InvalidSchemaValue,
+    UnmarshalError as CoreUnmarshalError,
+)
 from openapi_core.unmarshalling.schemas.factories import (
     SchemaUnmarshallersFactory as CoreSchemaUnmarshallersFactory,
 )
@@ -32,6 +65,7 @@ from openapi_core.unmarshalling.schemas.formatters import Formatter
 from openapi_core.unmarshalling.schemas.unmarshallers import (
     ArrayUnmarshaller as CoreArrayUnmarshaller,
     ObjectUnmarshaller as CoreObjectUnmarshaller,
+    PrimitiveTypeUnmarshaller,
 )
 from openapi_core.validation.request.datatypes import (
     OpenAPIRequest,
@@ -47,21 +81,84 @@ from openapi_core.validation.response.validators import (
 from openapi_core.validation.validators import (
     BaseValidator as CoreBaseValidator,
 )
-from openapi_schema_validator._format import oas30_format_checker
 
 from rororo.annotations import MappingStrAny
-from rororo.openapi.annotations import ValidateEmailKwargsDict
-from rororo.openapi.data import OpenAPIParameters, to_openapi_parameters
-from rororo.openapi.exceptions import CastError, ValidationError
-from rororo.openapi.security import validate_security
+from rororo.openapi.annotations import (
+    FrozenData,
+    JsonLoads,
+    ValidateEmailKwargsDict,
+    ValidationEngine,
+)
+from rororo.openapi.constants import APP_OPENAPI_VALIDATORS_KEY
+from rororo.openapi.core_compiler import (
+    compile_unmarshaller,
+    CompiledAnyUnmarshaller,
+    CompiledUnmarshaller,
+    SchemaCompiler,
+    SchemaNotCompilable,
+)
+from rororo.openapi.core_data import (
+    get_parameter_names,
+    OperationRequest,
+    ParameterNames,
+    RequestBodyStream,
+    ResponseData,
+)
+from rororo.openapi.core_parameters import (
+    compile_parameter_decoders,
+    ParameterDecoder,
+)
+from rororo.openapi.data import (
+    freeze_data,
+    OpenAPIParameters,
+    to_openapi_parameters,
+)
+from rororo.openapi.exceptions import (
+    CastError,
+    ConfigurationError,
+    ValidationError,
+)
+from rororo.openapi.security import (
+    create_security_plan,
+    get_security_list,
+    SecurityPlan,
+    validate_security,
+)
+from rororo.openapi.stream import iter_sized_json_array
 from rororo.openapi.utils import get_base_url
 
 
-DATE_TIME_FORMATTER = Formatter.from_callables(
-    partial(oas30_format_checker.check, format="date-time"),
-    parse_datetime,
-)
 PathTuple = Tuple[Path, Operation, Server, TemplateResult, TemplateResult]
+T = TypeVar("T")
+
+#: Date-time strings parsed on checking their format, to reuse parsed values
+#: on unmarshalling them (see :func:`reuse_parsed_date_times`)
+PARSED_DATE_TIMES: contextvars.ContextVar[
+    Union[Dict[str, datetime.datetime], None]
+] = contextvars.ContextVar("rororo_parsed_date_times", default=None)
+
+#: Shape of RFC 3339 date-time strings, which parsed by
+#: :meth:`datetime.datetime.fromisoformat` after replacing ``Z`` UTC offset
+RFC3339_DATE_TIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}[Tt]\d{2}:\d{2}:\d{2}(\.\d+)?"
+    r"([Zz]|[+-]\d{2}:\d{2})",
+    re.ASCII,
+)
+
+#: Default max number of email validation outcomes to keep in cache
+DEFAULT_EMAIL_CACHE_SIZE = 1024
+
+STREAM_ERROR_MESSAGE = "Request body validation error"
+
+#: Default min size of request & response body (in bytes) to validate it in
+#: executor, if any
+DEFAULT_EXECUTOR_THRESHOLD = 256 * 1024
+
+#: Supported container types for validated request data
+FROZEN_DATA_TYPES = ("pyrsistent", "proxy", "none")
+
+#: Supported engines to validate request & response data
+VALIDATION_ENGINES = ("default", "compiled")
 
 
 class ArrayUnmarshaller(CoreArrayUnmarshaller):
@@ -77,28 +174,92 @@ class ArrayUnmarshaller(CoreArrayUnmarshaller):
         return cast(List[Any], super().__call__(value))
 
 
+class DateTimeFormatter(Formatter):
+    """Formatter to support RFC 3339 date-time strings.
+
+    Unlike ``openapi-core`` date-time formatter, which checks string format
+    with regex and after parses it with ``isodate`` library, parse string
+    once with :func:`parse_date_time` for both checking its format &
+    unmarshalling it. Within :func:`reuse_parsed_date_times` block values
+    parsed on checking format are reused on unmarshalling.
+    """
+
+    def unmarshal(self, value: str) -> datetime.datetime:
+        parsed = PARSED_DATE_TIMES.get()
+        if parsed is None:
+            return parse_date_time(value)
+
+        result = parsed.get(value)
+        if result is None:
+            result = parsed[value] = parse_date_time(value)
+        return result
+
+    def validate(self, value: Any) -> bool:
+        if not isinstance(value, str):
+            return False
+
+        parsed = PARSED_DATE_TIMES.get()
+        if parsed is not None and value in parsed:
+            return True
+
+        try:
+            result = parse_date_time(value)
+        except ValueError:
+            return False
+
+        if parsed is not None:
+            parsed[value] = result
+        return True
+
+
+DATE_TIME_FORMATTER = DateTimeFormatter()
+
+
 class EmailFormatter(Formatter):
     """Formatter to support email strings.
 
     Use `email-validator <https://pypi.org/project/email-validator>`_ library
     to ensure that given string is a valid email.
+
+    Outcomes of validating email strings are kept in LRU cache of
+    ``cache_size``, so repeated emails are not validated again. As formatter
+    kwargs do not change after instantiation, cache is keyed by email string
+    only. Pass ``cache_size=0`` to disable the cache.
     """
 
     kwargs: ValidateEmailKwargsDict
 
     def __init__(
-        self, kwargs: Union[ValidateEmailKwargsDict, None] = None
+        self,
+        kwargs: Union[ValidateEmailKwargsDict, None] = None,
+        *,
+        cache_size: int = DEFAULT_EMAIL_CACHE_SIZE,
     ) -> None:
         self.kwargs: ValidateEmailKwargsDict = kwargs or {
             "check_deliverability": False
         }
+        self.cache_size = cache_size
+        self._get_error: Callable[[str], Union[str, None]] = (
+            lru_cache(maxsize=cache_size)(self._validate_email)
+            if cache_size
+            else self._validate_email
+        )
 
     def validate(self, value: str) -> bool:
+        error = self._get_error(value)
+        if error is not None:
+            raise FormatError(
+                f"{value!r} is not an 'email'",
+                cause=EmailNotValidError(error),
+            )
+        return True
+
+    def _validate_email(self, value: str) -> Union[str, None]:
         try:
             validate_email(value, **self.kwargs)
         except EmailNotValidError as err:
-            raise FormatError(f"{value!r} is not an 'email'", cause=err)
-        return True
+            return str(err)
+        return None
 
 
 class ObjectUnmarshaller(CoreObjectUnmarshaller):
@@ -159,6 +320,11 @@ class SchemaUnmarshallersFactory(CoreSchemaUnmarshallersFactory):
 
     Temporary fix to https://github.com/p1c2u/openapi-core/issues/235, to be
     removed from *rororo* after next ``openapi-core`` release.
+
+    Also, cache format checker & created unmarshallers as ``openapi-core``
+    deep copies format checker and instantiates new JSON schema validator on
+    each ``create`` call, while complex unmarshallers call ``create`` for
+    each of their items & properties on each unmarshalling.
     """
 
     COMPLEX_UNMARSHALLERS = {
@@ -167,6 +333,35 @@ class SchemaUnmarshallersFactory(CoreSchemaUnmarshallersFactory):
         SchemaType.OBJECT: ObjectUnmarshaller,
     }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._format_checker: Union[FormatChecker, None] = None
+        self._unmarshallers: Dict[
+            Tuple[Any, Union[SchemaType, None]], PrimitiveTypeUnmarshaller
+        ] = {}
+
+    def create(
+        self, schema: Any, type_override: Union[SchemaType, None] = None
+    ) -> PrimitiveTypeUnmarshaller:
+        key = (schema, type_override)
+        try:
+            return self._unmarshallers[key]
+        except KeyError:
+            unmarshaller = self._unmarshallers[key] = super().create(
+                schema, type_override
+            )
+            return unmarshaller
+
+    def _get_format_checker(self) -> FormatChecker:
+        if self._format_checker is None:
+            format_checker = super()._get_format_checker()
+            if SchemaFormat.DATETIME.value not in self.custom_formatters:
+                format_checker.checks(SchemaFormat.DATETIME.value)(
+                    DATE_TIME_FORMATTER.validate
+                )
+            self._format_checker = format_checker
+        return self._format_checker
+
     def get_formatter(
         self,
         default_formatters: Dict[str, Formatter],
@@ -177,12 +372,104 @@ class SchemaUnmarshallersFactory(CoreSchemaUnmarshallersFactory):
         return super().get_formatter(default_formatters, type_format)
 
 
+class CompiledSchemaUnmarshallersFactory(SchemaUnmarshallersFactory):
+    """Schema unmarshallers factory for compiled validation engine.
+
+    Compile schema into Python function to validate values, instead of
+    interpreting schema by ``jsonschema`` validator on each call. For
+    invalid values, as well as for schemas, which cannot be compiled, use
+    ``openapi-core`` unmarshallers to provide same validation errors.
+
+    Unmarshallers are created lazily, on first validation of the schema, and
+    validation might run concurrently in thread pool executor, so creating
+    unmarshallers is guarded by the lock. While unmarshaller is compiling,
+    other threads use ``openapi-core`` unmarshaller for its values.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.fallback_factory = SchemaUnmarshallersFactory(*args, **kwargs)
+        self.compiler = SchemaCompiler(
+            self.resolver,
+            self.fallback_factory._get_format_checker(),
+            context=self.context,
+        )
+        self._lock = threading.RLock()
+
+    def create(
+        self, schema: Any, type_override: Union[SchemaType, None] = None
+    ) -> PrimitiveTypeUnmarshaller:
+        key = (schema, type_override)
+        try:
+            return self._unmarshallers[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            return self._create(schema, type_override)
+
+    def _create(
+        self, schema: Any, type_override: Union[SchemaType, None] = None
+    ) -> PrimitiveTypeUnmarshaller:
+        key = (schema, type_override)
+        try:
+            return self._unmarshallers[key]
+        except KeyError:
+            pass
+
+        fallback = self.fallback_factory.create(schema, type_override)
+        klass = (
+            CompiledAnyUnmarshaller
+            if (type_override or schema.type) == SchemaType.ANY
+            else CompiledUnmarshaller
+        )
+
+        # Cache unmarshaller before compiling to support recursive schemas
+        unmarshaller = klass(fallback)
+        self._unmarshallers[key] = cast(
+            PrimitiveTypeUnmarshaller, unmarshaller
+        )
+
+        try:
+            compile_unmarshaller(
+                unmarshaller,
+                schema,
+                compiler=self.compiler,
+                factory=self,
+                type_override=type_override,
+            )
+        except SchemaNotCompilable:
+            self._unmarshallers[key] = fallback
+
+        return self._unmarshallers[key]
+
+
 class BaseValidator(CoreBaseValidator):
     """Custom base validator to deal with tz aware date time strings.
 
     To be removed from *rororo* after next ``openapi-core`` version release.
+
+    Validator keeps one unmarshallers factory per unmarshal context, so
+    validator instance is expected to be reused between requests. As of
+    that, base URL for finding request path is calculated from the request
+    itself, if not supplied on validator instantiation.
+
+    Pass ``validation_engine="compiled"`` to compile schemas into Python
+    functions instead of interpreting them on each call.
     """
 
+    def __init__(
+        self,
+        *args: Any,
+        validation_engine: ValidationEngine = "default",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.validation_engine = validation_engine
+        self._unmarshallers_factories: Dict[
+            UnmarshalContext, SchemaUnmarshallersFactory
+        ] = {}
+
     def _cast(self, param_or_media_type: Any, value: Any) -> Any:
         try:
             return super()._cast(param_or_media_type, value)
@@ -193,7 +480,44 @@ class BaseValidator(CoreBaseValidator):
             )
 
     def _find_path(self, request: OpenAPIRequest) -> PathTuple:
-        return PathFinder(self.spec, base_url=self.base_url).find(request)
+        """Find path, operation & server for the request.
+
+        When request is bound to OpenAPI core operation of matched route, take
+        all of them from the operation & path params from route match info,
+        instead of matching request URL against all spec paths.
+        """
+        if (
+            isinstance(request, OperationRequest)
+            and request.core_operation is not None
+        ):
+            return get_operation_path_tuple(
+                self.spec, request.core_operation, request.parameters.path
+            )
+        return PathFinder(
+            self.spec, base_url=self.base_url or get_base_url(request)
+        ).find(request)
+
+    def _get_unmarshallers_factory(
+        self, context: UnmarshalContext
+    ) -> SchemaUnmarshallersFactory:
+        try:
+            return self._unmarshallers_factories[context]
+        except KeyError:
+            factory_class = (
+                CompiledSchemaUnmarshallersFactory
+                if self.validation_engine == "compiled"
+                else SchemaUnmarshallersFactory
+            )
+            # Ensure all threads use same factory, even if it is created
+            # concurrently
+            return self._unmarshallers_factories.setdefault(
+                context,
+                factory_class(
+                    self.spec._resolver,
+                    self.custom_formatters,
+                    context=context,
+                ),
+            )
 
     def _unmarshal(
         self, param_or_media_type: Any, value: Any, context: UnmarshalContext
@@ -202,15 +526,13 @@ class BaseValidator(CoreBaseValidator):
         if not param_or_media_type.schema:
             return value
 
-        unmarshallers_factory = SchemaUnmarshallersFactory(
-            self.spec._resolver,
-            self.custom_formatters,
-            context=context,
+        unmarshaller = self._get_unmarshallers_factory(context).create(
+            param_or_media_type.schema
         )
-        unmarshaller = unmarshallers_factory.create(param_or_media_type.schema)
 
         try:
-            return unmarshaller(value)
+            with reuse_parsed_date_times():
+                return unmarshaller(value)
         except InvalidSchemaValue as err:
             # Modify invalid schema validation errors to include parameter name
             if isinstance(param_or_media_type, Parameter):
@@ -225,14 +547,166 @@ class BaseValidator(CoreBaseValidator):
 
 
 class RequestValidator(BaseValidator, CoreRequestValidator):
+    """Request validator, which knows how to freeze validated request data.
+
+    Pass ``frozen_data`` to choose container type for request parameters &
+    body data (see :func:`rororo.openapi.data.freeze_data`).
+
+    Pass ``security_plans`` (mapping of operation IDs to security plans,
+    created at setup time) to not resolve operation security requirements
+    on each request.
+
+    Pass ``executor`` to validate items of streamed request bodies, which
+    size is greater than or equal to ``executor_threshold``, in it.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        frozen_data: FrozenData = "pyrsistent",
+        security_plans: Union[Mapping[str, SecurityPlan], None] = None,
+        executor: Union[Executor, None] = None,
+        executor_threshold: int = DEFAULT_EXECUTOR_THRESHOLD,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.frozen_data = frozen_data
+        self.executor = executor
+        self.executor_threshold = executor_threshold
+        self.security_plans: Dict[str, SecurityPlan] = dict(
+            security_plans or {}
+        )
+        self._parameter_decoders: Dict[str, Tuple[ParameterDecoder, ...]] = {}
+        self._parameter_names: Dict[str, ParameterNames] = {}
+
+    def get_parameter_decoders(
+        self, operation: Operation
+    ) -> Tuple[ParameterDecoder, ...]:
+        """Get decoders of operation & its path parameters.
+
+        Decoders are compiled once per operation, on first request to it.
+        """
+        operation_id = operation.operation_id
+        decoders = self._parameter_decoders.get(operation_id)
+        if decoders is None:
+            decoders = compile_parameter_decoders(
+                chain(
+                    operation.parameters.values(),
+                    self.spec.paths[operation.path_name].parameters.values(),
+                )
+            )
+            if operation_id is not None:
+                self._parameter_decoders[operation_id] = decoders
+        return decoders
+
+    def get_parameter_names(self, operation: Operation) -> ParameterNames:
+        """Get names of request parameters, which operation needs.
+
+        Names of declared parameters & parameters with security data are
+        collected once per operation, so on each request only these
+        parameters are converted for ``openapi-core``.
+        """
+        operation_id = operation.operation_id
+        names = self._parameter_names.get(operation_id)
+        if names is None:
+            names = get_parameter_names(
+                self.spec,
+                operation,
+                self.get_security_plan(operation).iter_parameters(),
+            )
+            if operation_id is not None:
+                self._parameter_names[operation_id] = names
+        return names
+
+    def get_security_plan(self, operation: Operation) -> SecurityPlan:
+        """Get security plan of the operation.
+
+        Security plan of the operation is created at setup time, but if
+        operation is not known to the validator, create its plan on first
+        request to the operation & cache it.
+        """
+        operation_id = operation.operation_id
+        plan = self.security_plans.get(operation_id)
+        if plan is None:
+            plan = create_security_plan(
+                get_security_list(self.spec, operation),
+                self.spec.components.security_schemes,
+            )
+            if operation_id is not None:
+                self.security_plans[operation_id] = plan
+        return plan
+
+    def _decode_parameters(
+        self,
+        request: OpenAPIRequest,
+        decoders: Tuple[ParameterDecoder, ...],
+    ) -> Tuple[RequestParameters, List[CoreOpenAPIError]]:
+        errors: List[CoreOpenAPIError] = []
+        locations: Dict[str, Dict[str, Any]] = {}
+
+        for decoder in decoders:
+            try:
+                value = decoder.decode(request.parameters)
+            except MissingRequiredParameter as err:
+                errors.append(err)
+                continue
+            except MissingParameter:
+                continue
+            except (CoreCastError, DeserializeError) as err:
+                errors.append(err)
+                continue
+
+            try:
+                value = self._unmarshal(decoder.parameter, value)
+            except CoreUnmarshalError as err:
+                errors.append(err)
+            else:
+                locations.setdefault(decoder.location, {})[
+                    decoder.name
+                ] = value
+
+        return RequestParameters(**locations), errors
+
+    def _get_body(
+        self, request: OpenAPIRequest, operation: Operation
+    ) -> Tuple[Any, List[CoreOpenAPIError]]:
+        """Validate streamed JSON array request body item by item.
+
+        Instead of reading & validating whole request body, return async
+        iterator, which reads request body items from the request stream and
+        validates each of them on iterating.
+        """
+        if isinstance(request.body, RequestBodyStream):
+            media_type = operation.request_body[request.mimetype]
+            return (
+                validate_json_array_stream(self, media_type, request.body),
+                [],
+            )
+        return cast(
+            Tuple[Any, List[CoreOpenAPIError]],
+            super()._get_body(request, operation),
+        )
+
     def _get_parameters(
         self, request: OpenAPIRequest, params: MappingStrAny
     ) -> Tuple[RequestParameters, List[CoreOpenAPIError]]:
         """
         Distinct parameters errors from body errors to supply proper validation
         error response.
+
+        When request is bound to OpenAPI core operation, decode parameters
+        with decoders, compiled once for the operation.
         """
-        parameters, errors = super()._get_parameters(request, params)
+        if (
+            isinstance(request, OperationRequest)
+            and request.core_operation is not None
+        ):
+            parameters, errors = self._decode_parameters(
+                request, self.get_parameter_decoders(request.core_operation)
+            )
+        else:
+            parameters, errors = super()._get_parameters(request, params)
+
         if errors:
             raise ValidationError.from_request_errors(
                 errors, base_loc=["parameters"]
@@ -247,9 +721,17 @@ class RequestValidator(BaseValidator, CoreRequestValidator):
         JWT tokens without decoding them from ``base64`` (as needed for
         basic authorization).
 
-        Consider to remove from *rororo* after next ``openapi-core`` release.
+        Do not validate security once again, if it is already validated
+        before reading request body.
         """
-        return validate_security(self, request, operation)
+        if (
+            isinstance(request, OperationRequest)
+            and request.security is not None
+        ):
+            return request.security
+        return validate_security(
+            self.get_security_plan(operation), request.parameters
+        )
 
     def _unmarshal(self, param_or_media_type: Any, value: Any) -> Any:  # type: ignore[override]
         return super()._unmarshal(
@@ -258,69 +740,307 @@ class RequestValidator(BaseValidator, CoreRequestValidator):
 
 
 class ResponseValidator(BaseValidator, CoreResponseValidator):
+    def _deserialise_media_type(self, media_type: Any, value: Any) -> Any:
+        """Do not deserialise data of JSON response, which is not dumped yet.
+
+        Data of such response is already a Python object, so there is no
+        need to dump it to JSON & load it back just to validate it.
+        """
+        if isinstance(value, ResponseData):
+            return value.value
+        return super()._deserialise_media_type(media_type, value)
+
     def _unmarshal(self, param_or_media_type: Any, value: Any) -> Any:  # type: ignore[override]
         return super()._unmarshal(
             param_or_media_type, value, UnmarshalContext.RESPONSE
         )
 
 
-def get_custom_formatters(
-    *, validate_email_kwargs: Union[ValidateEmailKwargsDict, None] = None
-) -> Dict[str, Formatter]:
-    return {"email": EmailFormatter(validate_email_kwargs)}
+@attr.dataclass(frozen=True, slots=True)
+class CoreValidators:
+    """Request & response validators to reuse for all application requests.
 
+    Built once on setting up OpenAPI for the application to not instantiate
+    custom formatters, validators, unmarshallers factories & unmarshallers
+    on each request.
 
-def validate_core_request(
+    When ``executor`` is supplied, request & response bodies of size greater
+    than or equal to ``executor_threshold`` (in bytes) are validated in given
+    executor to not block the event loop.
+    """
+
+    request: RequestValidator
+    response: ResponseValidator
+    executor: Union[Executor, None] = None
+    executor_threshold: int = DEFAULT_EXECUTOR_THRESHOLD
+
+
+def create_core_validators(
     spec: Spec,
-    core_request: OpenAPIRequest,
     *,
     validate_email_kwargs: Union[ValidateEmailKwargsDict, None] = None,
+    validate_email_cache_size: int = DEFAULT_EMAIL_CACHE_SIZE,
+    validation_engine: ValidationEngine = "default",
+    json_loads: Union[JsonLoads, None] = None,
+    frozen_data: FrozenData = "pyrsistent",
+    executor: Union[Executor, None] = None,
+    executor_threshold: int = DEFAULT_EXECUTOR_THRESHOLD,
+    security_plans: Union[Mapping[str, SecurityPlan], None] = None,
+) -> CoreValidators:
+    if frozen_data not in FROZEN_DATA_TYPES:
+        raise ConfigurationError(
+            f"Invalid 'frozen_data' value: {frozen_data!r}. Please supply one "
+            f"of: {', '.join(FROZEN_DATA_TYPES)}."
+        )
+    if validation_engine not in VALIDATION_ENGINES:
+        raise ConfigurationError(
+            f"Invalid 'validation_engine' value: {validation_engine!r}. "
+            f"Please supply one of: {', '.join(VALIDATION_ENGINES)}."
+        )
+
+    # Validators are bound to the spec, which is not cheap (and in most cases
+    # not possible) to pickle, so they cannot be sent to other processes
+    if isinstance(executor, ProcessPoolExecutor):
+        raise ConfigurationError(
+            "Unable to validate request & response data in process pool "
+            "executor. Please use thread pool executor instead."
+        )
+
+    custom_formatters = get_custom_formatters(
+        validate_email_kwargs=validate_email_kwargs,
+        validate_email_cache_size=validate_email_cache_size,
+    )
+    # Deserialize JSON request & response bodies with custom function, if
+    # any. Otherwise use :func:`json.loads`, which accepts bytes as is, as
+    # ``openapi-core`` JSON loads function decodes bytes into string first
+    custom_media_type_deserializers = {
+        "application/json": json_loads or json.loads
+    }
+    return CoreValidators(
+        request=RequestValidator(
+            spec,
+            custom_formatters=custom_formatters,
+            custom_media_type_deserializers=custom_media_type_deserializers,
+            validation_engine=validation_engine,
+            frozen_data=frozen_data,
+            security_plans=security_plans,
+            executor=executor,
+            executor_threshold=executor_threshold,
+        ),
+        response=ResponseValidator(
+            spec,
+            custom_formatters=custom_formatters,
+            custom_media_type_deserializers=custom_media_type_deserializers,
+            validation_engine=validation_engine,
+        ),
+        executor=executor,
+        executor_threshold=executor_threshold,
+    )
+
+
+def get_core_validators(
+    mixed: Union[web.Application, ChainMapProxy]
+) -> CoreValidators:
+    try:
+        return cast(CoreValidators, mixed[APP_OPENAPI_VALIDATORS_KEY])
+    except KeyError:
+        raise ConfigurationError(
+            "Seems like OpenAPI validators not registered to the application. "
+            'Use "from rororo import setup_openapi" function to register '
+            "OpenAPI schema to your web.Application."
+        )
+
+
+def get_custom_formatters(
+    *,
+    validate_email_kwargs: Union[ValidateEmailKwargsDict, None] = None,
+    validate_email_cache_size: int = DEFAULT_EMAIL_CACHE_SIZE,
+) -> Dict[str, Formatter]:
+    return {
+        "email": EmailFormatter(
+            validate_email_kwargs, cache_size=validate_email_cache_size
+        )
+    }
+
+
+def get_operation_path_tuple(
+    spec: Spec, operation: Operation, path_variables: MappingStrAny
+) -> PathTuple:
+    """Build path tuple for the known OpenAPI core operation.
+
+    Result is the same as result of ``PathFinder.find`` call, but without
+    iterating over all spec paths, operations & servers.
+    """
+    path = spec.paths[operation.path_name]
+    server = (path.servers or operation.servers or spec.servers)[0]
+    return (
+        path,
+        operation,
+        server,
+        TemplateResult(path.name, dict(path_variables)),
+        TemplateResult(server.url, {}),
+    )
+
+
+def parse_date_time(value: str) -> datetime.datetime:
+    """Parse RFC 3339 date-time string into timezone aware datetime.
+
+    Common date-time shapes parsed by :meth:`datetime.datetime.fromisoformat`
+    after replacing ``Z`` UTC offset with ``+00:00``, while ``isodate`` used
+    only for inputs, not supported by ``fromisoformat`` (such as fractions of
+    second with other than 3 or 6 digits on Python < 3.11).
+
+    Raise :class:`ValueError` if given string is not a RFC 3339 date-time.
+    """
+    if RFC3339_DATE_TIME_RE.fullmatch(value) is None:
+        raise ValueError(f"{value!r} is not a RFC 3339 date-time")
+
+    if value[-1] in "Zz":
+        iso_value = f"{value[:-1]}+00:00"
+    else:
+        iso_value = value
+
+    try:
+        return datetime.datetime.fromisoformat(iso_value)
+    except ValueError:
+        return cast(datetime.datetime, parse_iso_date_time(value.upper()))
+
+
+@contextmanager
+def reuse_parsed_date_times() -> Iterator[None]:
+    """Reuse date-time strings parsed on checking format within the block.
+
+    As value is validated against the schema before unmarshalling it, each
+    date-time string is parsed once on checking its format & parsed value is
+    reused on unmarshalling it. Parsed values are kept only until the end of
+    the block, so they are not shared between requests.
+    """
+    token = PARSED_DATE_TIMES.set({})
+    try:
+        yield
+    finally:
+        PARSED_DATE_TIMES.reset(token)
+
+
+async def run_in_executor(
+    executor: Executor, func: Callable[..., T], *args: Any
+) -> T:
+    """Run function in given executor with copy of current context.
+
+    Copy of current context is needed to have same context vars within the
+    executor.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, partial(context.run, func, *args)
+    )
+
+
+def validate_core_request(
+    validator: RequestValidator, core_request: OpenAPIRequest
 ) -> Tuple[MappingStrAny, OpenAPIParameters, Any]:
     """
     Instead of validating request parameters & body in two calls, validate them
     at once with passing custom formatters.
-    """
-    custom_formatters = get_custom_formatters(
-        validate_email_kwargs=validate_email_kwargs
-    )
 
-    validator = RequestValidator(
-        spec,
-        custom_formatters=custom_formatters,
-        base_url=get_base_url(core_request),
-    )
+    Request parameters & body data are frozen as configured for the
+    validator.
+    """
     result = validator.validate(core_request)
 
     if result.errors:
         raise ValidationError.from_request_errors(result.errors)
 
+    frozen_data = validator.frozen_data
     return (
         result.security,
-        to_openapi_parameters(result.parameters),
-        pyrsistent.freeze(result.body),
+        to_openapi_parameters(result.parameters, frozen_data=frozen_data),
+        freeze_data(result.body, frozen_data),
     )
 
 
 def validate_core_response(
-    spec: Spec,
+    validator: ResponseValidator,
     core_request: OpenAPIRequest,
     core_response: OpenAPIResponse,
-    *,
-    validate_email_kwargs: Union[ValidateEmailKwargsDict, None] = None,
 ) -> Any:
     """Pass custom formatters for validating response data."""
-    custom_formatters = get_custom_formatters(
-        validate_email_kwargs=validate_email_kwargs
-    )
-
-    validator = ResponseValidator(
-        spec,
-        custom_formatters=custom_formatters,
-        base_url=get_base_url(core_request),
-    )
     result = validator.validate(core_request, core_response)
 
     if result.errors:
         raise ValidationError.from_response_errors(result.errors)
 
     return result.data
+
+
+async def validate_json_array_stream(
+    validator: RequestValidator,
+    media_type: MediaType,
+    body: RequestBodyStream,
+) -> AsyncIterator[Any]:
+    """Read JSON array items from the request stream & validate each of them.
+
+    Stop on first invalid item (or on invalid JSON) by raising
+    :class:`rororo.openapi.exceptions.ValidationError`. Array ``minItems`` &
+    ``maxItems`` are checked as well, but ``uniqueItems`` is not, as checking
+    it requires to keep all array items in memory.
+
+    Items, which size is greater than or equal to executor threshold, are
+    validated in validation executor (if any) to not block the event loop.
+    """
+    schema = media_type.schema
+    items_media_type = MediaType(media_type.mimetype, schema=schema.items)
+    frozen_data = validator.frozen_data
+    executor = validator.executor
+
+    total = 0
+    try:
+        async for item, size in iter_sized_json_array(
+            body.content, max_size=body.max_size
+        ):
+            if schema.max_items is not None and total >= schema.max_items:
+                raise ValidationError(
+                    message=STREAM_ERROR_MESSAGE,
+                    errors=[
+                        {
+                            "loc": ["body"],
+                            "message": (
+                                "Array has more than "
+                                f"{schema.max_items} items"
+                            ),
+                        }
+                    ],
+                )
+
+            try:
+                if executor is None or size < validator.executor_threshold:
+                    data = validator._unmarshal(items_media_type, item)
+                else:
+                    data = await run_in_executor(
+                        executor, validator._unmarshal, items_media_type, item
+                    )
+            except CoreUnmarshalError as err:
+                raise ValidationError.from_request_errors(
+                    [err], base_loc=["body", total]
+                )
+
+            total += 1
+            yield freeze_data(data, frozen_data)
+    except ValueError as err:
+        raise ValidationError(
+            message=STREAM_ERROR_MESSAGE,
+            errors=[
+                {"loc": ["body"], "message": f"Invalid JSON array: {err}"}
+            ],
+        )
+
+    if schema.min_items is not None and total < schema.min_items:
+        raise ValidationError(
+            message=STREAM_ERROR_MESSAGE,
+            errors=[
+                {
+                    "loc": ["body"],
+                    "message": f"Array has less than {schema.min_items} items",
+                }
+            ],
+        )
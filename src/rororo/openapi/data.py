@@ -7,15 +7,17 @@ Provide structures for OpenAPI data.
 
 """
 
-from typing import Any
+from typing import Any, Iterator, Mapping, overload, Sequence, Union
 
 import attr
+import pyrsistent
 from aiohttp import web
 from aiohttp.helpers import ChainMapProxy
 from openapi_core.validation.request.datatypes import RequestParameters
 from pyrsistent import pmap
 
 from rororo.annotations import MappingStrAny
+from rororo.openapi.annotations import FrozenData
 
 
 @attr.dataclass(frozen=True, slots=True)
@@ -90,14 +92,120 @@ class OpenAPIContext:
     #: Request body data
     data: Any = None
 
+    #: Results of authenticating request security data by authenticators of
+    #: security schemes
+    auth: MappingStrAny = attr.Factory(pmap)
+
+
+class ReadOnlyMapping(Mapping[str, Any]):
+    """Read-only view of the dict, which wraps nested values on access.
+
+    Unlike :func:`pyrsistent.freeze` does not copy the data on creation,
+    instead nested dicts & lists are wrapped into read-only views only when
+    accessed.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: MappingStrAny) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return to_read_only(self._data[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._data!r})"
+
+
+class ReadOnlySequence(Sequence[Any]):
+    """Read-only view of the list, which wraps nested values on access."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Sequence[Any]) -> None:
+        self._data = data
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ReadOnlySequence):
+            other = other._data
+        if not isinstance(other, (list, tuple, pyrsistent.PVector)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            item == other_item for item, other_item in zip(self, other)
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ReadOnlySequence": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return ReadOnlySequence(self._data[index])
+        return to_read_only(self._data[index])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._data!r})"
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def freeze_data(value: Any, frozen_data: FrozenData = "pyrsistent") -> Any:
+    """Convert validated data into the container of given frozen data type.
+
+    - ``pyrsistent`` deeply converts data into pyrsistent structures
+    - ``proxy`` wraps data into read-only views without copying it
+    - ``none`` returns data as is
+    """
+    if frozen_data == "proxy":
+        return to_read_only(value)
+    if frozen_data == "none":
+        return value
+    return pyrsistent.freeze(value)
+
 
 def to_openapi_parameters(
     core_parameters: RequestParameters,
+    *,
+    frozen_data: FrozenData = "pyrsistent",
 ) -> OpenAPIParameters:
     """Convert openapi-core parameters to internal parameters instance."""
+    if frozen_data == "proxy":
+        return OpenAPIParameters(
+            path=ReadOnlyMapping(core_parameters.path),
+            query=ReadOnlyMapping(core_parameters.query),
+            header=ReadOnlyMapping(core_parameters.header),
+            cookie=ReadOnlyMapping(core_parameters.cookie),
+        )
+    if frozen_data == "none":
+        return OpenAPIParameters(
+            path=dict(core_parameters.path),
+            query=dict(core_parameters.query),
+            header=dict(core_parameters.header),
+            cookie=dict(core_parameters.cookie),
+        )
     return OpenAPIParameters(
         path=pmap(core_parameters.path),
         query=pmap(core_parameters.query),
         header=pmap(core_parameters.header),
         cookie=pmap(core_parameters.cookie),
     )
+
+
+def to_read_only(value: Any) -> Any:
+    """Wrap dicts & lists into read-only views, return other values as is."""
+    if isinstance(value, dict):
+        return ReadOnlyMapping(value)
+    if isinstance(value, list):
+        return ReadOnlySequence(value)
+    return value
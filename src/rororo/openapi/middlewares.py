@@ -1,38 +1,24 @@
-from functools import partial
-from typing import Awaitable, Callable, Tuple, Type, Union
+from typing import Awaitable, Callable, Mapping, Tuple, Type, Union
 
 from aiohttp import web
 from aiohttp_middlewares import error_middleware, get_error_response
 from aiohttp_middlewares.annotations import Middleware
 
 from rororo.annotations import Handler
-from rororo.openapi.annotations import ErrorMiddlewareKwargsDict
+from rororo.openapi.annotations import (
+    ErrorMiddlewareKwargsDict,
+    ValidateResponse,
+)
 from rororo.openapi.constants import REQUEST_CORE_OPERATION_KEY
-from rororo.openapi.core_data import find_core_operation
-from rororo.openapi.validators import validate_request, validate_response
-
-
-def get_actual_handler(handler: Handler) -> Handler:
-    """Remove partially applied middlewares from actual handler.
-
-    aiohttp wraps handler into middlewares, so if any middlewares declared in
-    application after ``openapi_middleware`` the handler will look like::
-
-        functools.partial(
-            <function middleware1.<locals>.middleware at 0x111325b80>,
-            handler=functools.partial(
-                <function middleware2.<locals>.middleware at 0x111325ca0>,
-                handler=<function actual_handler at 0x1112aa700>
-            )
-        )
-
-    In that case ``HANDLER_OPENAPI_MAPPING_KEY`` will not be accessed in the
-    partial, which results that handler will not be validated against
-    OpenAPI schema.
-    """
-    if isinstance(handler, partial) and "handler" in handler.keywords:
-        return get_actual_handler(handler.keywords["handler"])
-    return handler
+from rororo.openapi.responses import JSONResponse
+from rororo.openapi.routes import get_route_core_operation
+from rororo.openapi.utils import get_json_dumps
+from rororo.openapi.validators import (
+    ensure_validate_response,
+    should_validate_response,
+    validate_request,
+    validate_response,
+)
 
 
 def ensure_ignore_exceptions(
@@ -59,9 +45,12 @@ def ensure_ignore_exceptions(
 
 def openapi_middleware(
     *,
-    is_validate_response: bool = True,
+    is_validate_response: ValidateResponse = True,
     use_error_middleware: bool = True,
     error_middleware_kwargs: Union[ErrorMiddlewareKwargsDict, None] = None,
+    operations_validate_response: Union[
+        Mapping[str, ValidateResponse], None
+    ] = None,
 ) -> Middleware:
     """Middleware to handle requests to handlers covered by OpenAPI schema.
 
@@ -70,7 +59,25 @@ def openapi_middleware(
     but if, for some reason, you don't want to call high order
     ``setup_openapi`` function, you'll need to add given middleware to your
     :class:`aiohttp.web.Applicaiton` manually.
+
+    Middleware validates requests to routes, registered via
+    :func:`rororo.openapi.openapi.convert_operations_to_routes`, which have
+    OpenAPI operations bound to them on registration. Requests to handlers,
+    added to the router manually, are validated only if handler has
+    ``HANDLER_OPENAPI_MAPPING_KEY`` attribute (as handlers, registered with
+    :class:`rororo.openapi.OperationTableDef` have) and OpenAPI operation is
+    looked up for them on each request.
+
+    ``is_validate_response`` might be a boolean, a sampling rate (number from
+    0 to 1), or a function, which accepts OpenAPI core operation & request,
+    and returns whether to validate the response. Pass
+    ``operations_validate_response`` mapping to override this policy for
+    given operation IDs.
     """
+    is_validate_response = ensure_validate_response(
+        is_validate_response, name="is_validate_response"
+    )
+    operations_validate_response = operations_validate_response or {}
 
     error_middleware_kwargs = error_middleware_kwargs or {}
     # Do not handle ``HTTPRedirection`` errors by error middleware, as they
@@ -96,12 +103,10 @@ def openapi_middleware(
     async def middleware(
         request: web.Request, handler: Handler
     ) -> web.StreamResponse:
-        # At first, check that given handler registered as OpenAPI operation
-        # handler. For this check remove all partially applied middlewares
-        # from the handler,
-        core_operation = find_core_operation(
-            request, get_actual_handler(handler)
-        )
+        # At first, check that matched route registered as OpenAPI operation
+        # route. OpenAPI core operation is bound to the route on registering
+        # it, so no need to look up for it on every request
+        core_operation = get_route_core_operation(request)
         if core_operation is None:
             return await get_response(request, handler)
 
@@ -112,11 +117,23 @@ def openapi_middleware(
                 await validate_request(request), handler
             )
 
-            # For performance considerations it is useful to turn off
-            # validating responses at production environment as unfortunately
-            # it will need to do extra checks after response is ready
-            if is_validate_response:
-                validate_response(request, response)
+            # For performance considerations it is useful to turn off (or
+            # sample) validating responses at production environment as
+            # unfortunately it will need to do extra checks after response
+            # is ready
+            if should_validate_response(
+                operations_validate_response.get(
+                    core_operation.operation_id, is_validate_response
+                ),
+                core_operation,
+                request,
+            ):
+                await validate_response(request, response)
+
+            # Data of JSON response validated as is, so dump it to JSON only
+            # after validation passed
+            if isinstance(response, JSONResponse):
+                response.dump(get_json_dumps(request.config_dict))
 
             return response
         except web.HTTPRedirection:
@@ -1,27 +1,46 @@
+import hashlib
 import inspect
 import json
+import logging
 import os
+import pickle
+import platform
+import re
+import stat
+import tempfile
 import warnings
+from concurrent.futures import Executor
 from functools import lru_cache, partial
 from pathlib import Path
 from typing import (
+    Any,
     Callable,
     cast,
     Deque,
     Dict,
+    Iterator,
     List,
+    Mapping,
     overload,
     Tuple,
     Type,
     Union,
 )
+from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.request import url2pathname
 
 import attr
 import yaml
 from aiohttp import hdrs, web
 from aiohttp_middlewares import cors_middleware
+from jsonschema.validators import RefResolver
+from openapi_core import __version__ as openapi_core_version
+from openapi_core.schema.operations.models import Operation
+from openapi_core.schema.schemas.models import Schema
+from openapi_core.schema.schemas.types import NoValue
 from openapi_core.schema.specs.models import Spec
 from openapi_core.shortcuts import create_spec
+from openapi_spec_validator import default_handlers
 from pyrsistent import pmap
 from yarl import URL
 
@@ -35,27 +54,94 @@ from rororo.annotations import (
 )
 from rororo.openapi import views
 from rororo.openapi.annotations import (
+    AuthenticateFunc,
     CorsMiddlewareKwargsDict,
     ErrorMiddlewareKwargsDict,
+    FrozenData,
+    JsonDumps,
+    JsonLoads,
     SecurityDict,
     ValidateEmailKwargsDict,
+    ValidateResponse,
+    ValidationEngine,
 )
 from rororo.openapi.constants import (
+    APP_OPENAPI_AUTHENTICATORS_KEY,
+    APP_OPENAPI_JSON_DUMPS_KEY,
+    APP_OPENAPI_MAX_BODY_SIZES_KEY,
+    APP_OPENAPI_OPERATIONS_KEY,
+    APP_OPENAPI_SCHEMA_DOCUMENTS_KEY,
     APP_OPENAPI_SCHEMA_KEY,
     APP_OPENAPI_SPEC_KEY,
+    APP_OPENAPI_VALIDATORS_KEY,
     APP_VALIDATE_EMAIL_KWARGS_KEY,
     HANDLER_OPENAPI_MAPPING_KEY,
+    MAX_BODY_SIZE_EXTENSION,
+    VALIDATE_RESPONSE_EXTENSION,
+)
+from rororo.openapi.core_data import get_core_operation, get_core_operations
+from rororo.openapi.core_spec import create_lazy_spec, LazyOperation
+from rororo.openapi.core_validators import (
+    create_core_validators,
+    DEFAULT_EMAIL_CACHE_SIZE,
+    DEFAULT_EXECUTOR_THRESHOLD,
 )
-from rororo.openapi.core_data import get_core_operation
 from rororo.openapi.exceptions import ConfigurationError
 from rororo.openapi.middlewares import openapi_middleware
-from rororo.openapi.utils import add_prefix
+from rororo.openapi.routes import OperationRouteDef
+from rororo.openapi.security import (
+    create_authenticators,
+    create_security_plans,
+    DEFAULT_AUTHENTICATION_CACHE_SIZE,
+    DEFAULT_AUTHENTICATION_CACHE_TTL,
+)
+from rororo.openapi.utils import add_prefix, iter_schema_operations
+from rororo.openapi.validators import ensure_validate_response
 from rororo.settings import APP_SETTINGS_KEY, BaseSettings
 
 
 SchemaLoader = Callable[[bytes], DictStrAny]
 Url = Union[str, URL]
 
+#: Find external ``$ref`` URLs in raw JSON & YAML schema files
+EXTERNAL_REF_RE = re.compile(rb"""["']?\$ref["']?\s*:\s*["']?([^"'#\s,}]+)""")
+
+SCHEMA_STATE_ATTRS = (
+    "type",
+    "properties",
+    "items",
+    "format",
+    "required",
+    "default",
+    "nullable",
+    "enum",
+    "deprecated",
+    "all_of",
+    "one_of",
+    "additional_properties",
+    "min_items",
+    "max_items",
+    "min_length",
+    "max_length",
+    "pattern",
+    "unique_items",
+    "minimum",
+    "maximum",
+    "multiple_of",
+    "exclusive_minimum",
+    "exclusive_maximum",
+    "min_properties",
+    "max_properties",
+    "read_only",
+    "write_only",
+    "extensions",
+    "_all_required_properties_cache",
+    "_all_optional_properties_cache",
+    "_source",
+)
+
+logger = logging.getLogger(__name__)
+
 
 class CreateSchemaAndSpec(Protocol):
     def __call__(
@@ -226,57 +312,159 @@ class OperationTableDef:
         return mapping
 
 
+@attr.dataclass(frozen=True, slots=True)
+class PreloadedOpenAPI:
+    """OpenAPI schema & spec, prepared for setting up OpenAPI in advance.
+
+    Use :func:`rororo.openapi.preload_openapi` to instantiate it.
+    """
+
+    #: OpenAPI schema dict
+    schema: DictStrAny
+
+    #: OpenAPI spec with fixed operation securities
+    spec: Spec
+
+    #: Operation ID -> OpenAPI core operation mapping
+    operations: Mapping[str, Operation]
+
+
+class SpecPickler(pickle.Pickler):
+    """Pickle OpenAPI spec without its ref resolver.
+
+    Ref resolver is not picklable, but as it is fully defined by the schema
+    it is safe to instantiate it again on unpickling the spec. Schema models
+    overwrite their ``__dict__`` with source schema dict, so need to pickle
+    their state explicitly.
+    """
+
+    def persistent_id(self, obj: object) -> Union[str, None]:
+        if obj is NoValue:
+            return "no_value"
+        if isinstance(obj, RefResolver):
+            return "resolver"
+        return None
+
+    def reducer_override(self, obj: object) -> Any:
+        if isinstance(obj, Schema):
+            return (
+                object.__new__,
+                (Schema,),
+                {name: getattr(obj, name) for name in SCHEMA_STATE_ATTRS},
+                None,
+                None,
+                set_schema_state,
+            )
+        return NotImplemented
+
+
+class SpecUnpickler(pickle.Unpickler):
+    """Unpickle OpenAPI spec, pickled by :class:`SpecPickler`."""
+
+    resolver: Union[RefResolver, None] = None
+
+    def persistent_load(self, pid: object) -> Any:
+        if pid == "no_value":
+            return NoValue
+        if pid == "resolver" and self.resolver is not None:
+            return self.resolver
+        raise pickle.UnpicklingError(f"Unsupported persistent ID: {pid!r}")
+
+
 def convert_operations_to_routes(
     operations: OperationTableDef,
-    spec: Spec,
+    core_operations: Mapping[str, Operation],
     *,
     prefix: Union[str, None] = None,
-) -> web.RouteTableDef:
-    """Convert operations table defintion to routes table definition."""
+) -> List[web.AbstractRouteDef]:
+    """Convert operations table defintion to list of route definitions.
+
+    ``core_operations`` is an operation ID -> OpenAPI core operation mapping
+    as returned by :func:`rororo.openapi.core_data.get_core_operations`.
+
+    Each OpenAPI core operation bound to the route on its registration, so
+    there is no need to look up for the operation on handling the request.
+    """
 
     async def noop(request: web.Request) -> web.Response:
         return web.json_response(status=204)  # pragma: no cover
 
-    routes = web.RouteTableDef()
+    routes: List[web.AbstractRouteDef] = []
 
     # Add plain handlers to the route table def as a route
     for handler in operations.handlers:
         operation_id = getattr(handler, HANDLER_OPENAPI_MAPPING_KEY)[
             hdrs.METH_ANY
         ]
-        core_operation = get_core_operation(spec, operation_id)
-
-        routes.route(
-            core_operation.http_method,
-            add_prefix(core_operation.path_name, prefix),
-            name=get_route_name(core_operation.operation_id),
-        )(handler)
+        core_operation = get_core_operation(core_operations, operation_id)
+
+        routes.append(
+            OperationRouteDef(
+                core_operation.http_method,
+                add_prefix(core_operation.path_name, prefix),
+                handler,
+                pmap({hdrs.METH_ANY: core_operation}),
+                name=get_route_name(core_operation.operation_id),
+            )
+        )
 
     # But view should be added as a view instead
     for view in operations.views:
-        ids: Deque[str] = Deque(
-            getattr(view, HANDLER_OPENAPI_MAPPING_KEY).values()
-        )
+        mapping = getattr(view, HANDLER_OPENAPI_MAPPING_KEY)
+        ids: Deque[str] = Deque(mapping.values())
 
         first_operation_id = ids.popleft()
-        core_operation = get_core_operation(spec, first_operation_id)
+        core_operation = get_core_operation(
+            core_operations, first_operation_id
+        )
 
         path = add_prefix(core_operation.path_name, prefix)
-        routes.view(
-            path,
-            name=get_route_name(core_operation.operation_id),
-        )(view)
+        routes.append(
+            OperationRouteDef(
+                hdrs.METH_ANY,
+                path,
+                view,
+                pmap(
+                    {
+                        method: get_core_operation(
+                            core_operations, operation_id
+                        )
+                        for method, operation_id in mapping.items()
+                    }
+                ),
+                name=get_route_name(core_operation.operation_id),
+            )
+        )
 
         # Hacky way of adding aliases to class based views with multiple
         # registered view methods
         for other_operation_id in ids:
-            routes.route(
-                hdrs.METH_ANY, path, name=get_route_name(other_operation_id)
-            )(noop)
+            routes.append(
+                web.route(
+                    hdrs.METH_ANY,
+                    path,
+                    noop,
+                    name=get_route_name(other_operation_id),
+                )
+            )
 
     return routes
 
 
+def create_schema_and_lazy_spec(
+    path: Path, *, schema_loader: Union[SchemaLoader, None] = None
+) -> Tuple[DictStrAny, Spec]:
+    schema = read_openapi_schema(path, loader=schema_loader)
+    return (schema, create_lazy_spec(schema))
+
+
+@lru_cache(maxsize=128)
+def create_schema_and_lazy_spec_with_cache(
+    path: Path, *, schema_loader: Union[SchemaLoader, None] = None
+) -> Tuple[DictStrAny, Spec]:
+    return create_schema_and_lazy_spec(path, schema_loader=schema_loader)
+
+
 def create_schema_and_spec(
     path: Path, *, schema_loader: Union[SchemaLoader, None] = None
 ) -> Tuple[DictStrAny, Spec]:
@@ -291,6 +479,72 @@ def create_schema_and_spec_with_cache(
     return create_schema_and_spec(path, schema_loader=schema_loader)
 
 
+def create_schema_and_spec_with_disk_cache(
+    path: Path,
+    *,
+    cache_dir: Path,
+    schema_loader: Union[SchemaLoader, None] = None,
+) -> Tuple[DictStrAny, Spec]:
+    """Read schema & create its spec, or load both from the cache directory.
+
+    Cache artifact is keyed by content hash of the schema file & all files it
+    references, as well as by the schema loader, so any change to the schema
+    (as well as upgrading rororo, openapi-core or Python itself) results in
+    reading the schema and creating its spec from scratch.
+
+    As cache artifacts are pickled, cache directory must be trusted. Cache
+    files, which are not owned by current user or are writable by others,
+    are ignored.
+    """
+    cache_key = get_schema_cache_key(path, schema_loader=schema_loader)
+    cache_path = cache_dir / f"rororo-openapi-{cache_key}.pickle"
+
+    try:
+        return load_schema_and_spec(cache_path)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.warning(
+            "Unable to load cached OpenAPI schema & spec from %s. Ignore the "
+            "cache and create spec from scratch",
+            cache_path,
+            exc_info=True,
+        )
+
+    schema, spec = create_schema_and_spec(path, schema_loader=schema_loader)
+    spec = fix_spec_operations(spec, schema)
+
+    try:
+        dump_schema_and_spec(cache_path, schema, spec)
+    except Exception:
+        logger.warning(
+            "Unable to store OpenAPI schema & spec cache at %s",
+            cache_path,
+            exc_info=True,
+        )
+
+    return (schema, spec)
+
+
+def dump_schema_and_spec(path: Path, schema: DictStrAny, spec: Spec) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write cache to the temporary file first and only after replace the
+    # actual cache file to not allow other processes read partial data
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as handler:
+        try:
+            pickler = SpecPickler(handler, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler.dump(schema)
+            pickler.dump(spec)
+        except BaseException:
+            os.unlink(handler.name)
+            raise
+
+    os.replace(handler.name, path)
+
+
 def find_route_prefix(
     oas: DictStrAny,
     *,
@@ -338,21 +592,18 @@ def fix_spec_operations(spec: Spec, schema: DictStrAny) -> Spec:
     as unsecured. With missed operation security - use global security schema
     if it is defined.
     """
-    mapping: Dict[str, Union[SecurityDict, None]] = {}
-
-    for path_data in schema["paths"].values():
-        for maybe_operation_data in path_data.values():
-            if not isinstance(maybe_operation_data, dict):
-                continue
-
-            operation_id = maybe_operation_data.get("operationId")
-            if operation_id is None:
-                continue
-
-            mapping[operation_id] = maybe_operation_data.get("security")
+    mapping: Dict[str, Union[SecurityDict, None]] = {
+        operation_id: operation_data.get("security")
+        for operation_id, operation_data in iter_schema_operations(schema)
+    }
 
     for path in spec.paths.values():
         for operation in path.operations.values():
+            # Lazy operations fix their security on their own, on creating
+            # the operation
+            if isinstance(operation, LazyOperation):
+                continue
+
             if operation.security != []:
                 continue
 
@@ -364,6 +615,109 @@ def fix_spec_operations(spec: Spec, schema: DictStrAny) -> Spec:
     return spec
 
 
+def get_create_schema_and_spec_func(
+    *,
+    cache_create_schema_and_spec: bool = False,
+    cache_dir: Union[str, Path, None] = None,
+    lazy_spec: bool = False,
+) -> CreateSchemaAndSpec:
+    if lazy_spec:
+        if cache_dir is not None:
+            raise ConfigurationError(
+                "Unable to store lazy OpenAPI spec in the cache directory. "
+                "Please supply only `lazy_spec` or only `cache_dir` keyword "
+                "argument, not both."
+            )
+        if cache_create_schema_and_spec:
+            return create_schema_and_lazy_spec_with_cache
+        return create_schema_and_lazy_spec
+    if cache_dir is not None:
+        return partial(
+            create_schema_and_spec_with_disk_cache, cache_dir=Path(cache_dir)
+        )
+    if cache_create_schema_and_spec:
+        return create_schema_and_spec_with_cache
+    return create_schema_and_spec
+
+
+def get_operations_max_body_size(schema: DictStrAny) -> Dict[str, int]:
+    """Read max request body sizes for operations from OpenAPI schema.
+
+    Max request body size (in bytes) for an operation is defined via
+    ``x-rororo-max-body-size`` extension.
+    """
+    mapping: Dict[str, int] = {}
+
+    for operation_id, operation_data in iter_schema_operations(schema):
+        if MAX_BODY_SIZE_EXTENSION not in operation_data:
+            continue
+
+        value = operation_data[MAX_BODY_SIZE_EXTENSION]
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise ConfigurationError(
+                f"Invalid {MAX_BODY_SIZE_EXTENSION!r} value for "
+                f"{operation_id!r} operation: {value!r}. Please supply "
+                "non-negative integer (max request body size in bytes)."
+            )
+
+        mapping[operation_id] = value
+
+    return mapping
+
+
+def get_operations_validate_response(
+    schema: DictStrAny,
+) -> Dict[str, ValidateResponse]:
+    """Read response validation policies for operations from OpenAPI schema.
+
+    Policy for an operation is defined via ``x-rororo-validate-response``
+    extension, which might be a boolean or a sampling rate.
+    """
+    return {
+        operation_id: ensure_validate_response(
+            operation_data[VALIDATE_RESPONSE_EXTENSION],
+            name=VALIDATE_RESPONSE_EXTENSION,
+        )
+        for operation_id, operation_data in iter_schema_operations(schema)
+        if VALIDATE_RESPONSE_EXTENSION in operation_data
+    }
+
+
+def get_schema_and_spec(
+    schema_path: Union[str, Path],
+    *,
+    schema_loader: Union[SchemaLoader, None] = None,
+    cache_create_schema_and_spec: bool = False,
+    cache_dir: Union[str, Path, None] = None,
+    lazy_spec: bool = False,
+) -> Tuple[DictStrAny, Spec]:
+    # Ensure OpenAPI schema is a readable file
+    path = Path(schema_path) if isinstance(schema_path, str) else schema_path
+    if not path.exists() or not path.is_file():
+        uid = os.getuid()
+        raise ConfigurationError(
+            f"Unable to find OpenAPI schema file at {path}. Please check "
+            "that file exists at given path and readable by current user "
+            f"ID: {uid}"
+        )
+
+    create_func = get_create_schema_and_spec_func(
+        cache_create_schema_and_spec=cache_create_schema_and_spec,
+        cache_dir=cache_dir,
+        lazy_spec=lazy_spec,
+    )
+
+    try:
+        return create_func(path, schema_loader=schema_loader)
+    except Exception:
+        raise ConfigurationError(
+            f"Unable to load valid OpenAPI schema in {path}. In most "
+            "cases it means that given file doesn't contain valid OpenAPI "
+            "3 schema. To get full details about errors run "
+            f"`openapi-spec-validator {path.absolute()}`"
+        )
+
+
 def get_default_yaml_loader() -> Type[yaml.BaseLoader]:
     return cast(
         Type[yaml.BaseLoader], getattr(yaml, "CSafeLoader", yaml.SafeLoader)
@@ -378,6 +732,150 @@ def get_route_prefix(mixed: Url) -> str:
     return (URL(mixed) if isinstance(mixed, str) else mixed).path
 
 
+def get_callable_cache_key(value: Any) -> str:
+    """Describe callable by its qualified name to use it in cache key."""
+    if value is None:
+        return ""
+
+    if isinstance(value, partial):
+        return "partial({0})".format(
+            ", ".join(
+                (
+                    get_callable_cache_key(value.func),
+                    *(get_callable_cache_key(item) for item in value.args),
+                    *(
+                        f"{key}={get_callable_cache_key(item)}"
+                        for key, item in sorted(value.keywords.items())
+                    ),
+                )
+            )
+        )
+
+    qualname = getattr(value, "__qualname__", None)
+    if qualname is not None:
+        return f"{getattr(value, '__module__', '')}.{qualname}"
+    return repr(value)
+
+
+def get_schema_cache_key(
+    path: Path, *, schema_loader: Union[SchemaLoader, None] = None
+) -> str:
+    from rororo import __version__ as rororo_version
+
+    hashed = hashlib.sha256()
+    for url, content in iter_schema_files(path):
+        hashed.update(url.encode("utf-8"))
+        hashed.update(b"\0")
+        hashed.update(content)
+        hashed.update(b"\0")
+
+    for item in (
+        rororo_version,
+        openapi_core_version,
+        platform.python_version(),
+        get_callable_cache_key(schema_loader),
+    ):
+        hashed.update(b"\0")
+        hashed.update(item.encode("utf-8"))
+
+    return hashed.hexdigest()
+
+
+def iter_schema_files(path: Path) -> Iterator[Tuple[str, bytes]]:
+    """Iterate over URLs & contents of schema file and all files it references.
+
+    External references are found in raw file contents, without loading
+    them. Contents of non-file references (such as HTTP URLs) are not
+    fetched, so only their URLs are yielded.
+    """
+    urls = [path.absolute().as_uri()]
+    seen = set(urls)
+
+    while urls:
+        url = urls.pop()
+        parsed = urlparse(url)
+        if parsed.scheme != "file":
+            yield (url, b"")
+            continue
+
+        try:
+            content = Path(url2pathname(parsed.path)).read_bytes()
+        except OSError:
+            content = b""
+        yield (url, content)
+
+        for match in EXTERNAL_REF_RE.finditer(content):
+            ref_url, _ = urldefrag(
+                urljoin(url, match.group(1).decode("utf-8", "replace"))
+            )
+            if ref_url not in seen:
+                seen.add(ref_url)
+                urls.append(ref_url)
+
+
+def load_schema_and_spec(path: Path) -> Tuple[DictStrAny, Spec]:
+    with open(path, "rb") as handler:
+        # Unpickling might execute arbitrary code, so do not load cache files,
+        # which might be modified by other users
+        if hasattr(os, "getuid"):
+            file_stat = os.fstat(handler.fileno())
+            if file_stat.st_uid != os.getuid() or file_stat.st_mode & (
+                stat.S_IWGRP | stat.S_IWOTH
+            ):
+                raise ConfigurationError(
+                    f"Untrusted OpenAPI schema & spec cache file: {path}. "
+                    "Cache file should be owned by current user & should not "
+                    "be writable by others."
+                )
+
+        unpickler = SpecUnpickler(handler)
+        schema = unpickler.load()
+
+        unpickler.resolver = RefResolver("", schema, handlers=default_handlers)
+        spec = unpickler.load()
+
+    return (schema, spec)
+
+
+def preload_openapi(
+    schema_path: Union[str, Path],
+    *,
+    schema_loader: Union[SchemaLoader, None] = None,
+    cache_dir: Union[str, Path, None] = None,
+) -> PreloadedOpenAPI:
+    """Read OpenAPI schema & create its spec once for multiple applications.
+
+    Useful for preforking servers, which run multiple workers on same host.
+    Instead of reading schema & creating its spec in each worker, do it once
+    in parent process, call :func:`gc.freeze` to not trigger copying memory
+    pages of preloaded objects on garbage collection, and pass preloaded
+    data to :func:`rororo.openapi.setup_openapi` in each worker,
+
+    .. code-block:: python
+
+        import gc
+
+        preloaded = preload_openapi(Path(__file__).parent / "openapi.yaml")
+        gc.freeze()
+
+
+        def create_app() -> web.Application:
+            return setup_openapi(
+                web.Application(), operations, preloaded=preloaded
+            )
+
+    As ``setup_openapi`` does not modify preloaded schema & spec, forked
+    workers share their memory pages with the parent process.
+    """
+    schema, spec = get_schema_and_spec(
+        schema_path, schema_loader=schema_loader, cache_dir=cache_dir
+    )
+    spec = fix_spec_operations(spec, schema)
+    return PreloadedOpenAPI(
+        schema=schema, spec=spec, operations=get_core_operations(spec)
+    )
+
+
 def read_openapi_schema(
     path: Path, *, loader: Union[SchemaLoader, None] = None
 ) -> DictStrAny:
@@ -409,13 +907,18 @@ def read_openapi_schema(
     )
 
 
+def set_schema_state(obj: Schema, state: DictStrAny) -> None:
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
 @overload
 def setup_openapi(
     app: web.Application,
     schema_path: Union[str, Path],
     *operations: OperationTableDef,
     server_url: Union[Url, None] = None,
-    is_validate_response: bool = True,
+    is_validate_response: ValidateResponse = True,
     has_openapi_schema_handler: bool = True,
     use_error_middleware: bool = True,
     error_middleware_kwargs: Union[ErrorMiddlewareKwargsDict, None] = None,
@@ -423,7 +926,19 @@ def setup_openapi(
     cors_middleware_kwargs: Union[CorsMiddlewareKwargsDict, None] = None,
     schema_loader: Union[SchemaLoader, None] = None,
     cache_create_schema_and_spec: bool = False,
+    cache_dir: Union[str, Path, None] = None,
+    lazy_spec: bool = False,
     validate_email_kwargs: Union[ValidateEmailKwargsDict, None] = None,
+    validate_email_cache_size: int = DEFAULT_EMAIL_CACHE_SIZE,
+    validation_engine: ValidationEngine = "default",
+    json_loads: Union[JsonLoads, None] = None,
+    json_dumps: Union[JsonDumps, None] = None,
+    frozen_data: FrozenData = "pyrsistent",
+    validation_executor: Union[Executor, None] = None,
+    validation_executor_threshold: int = DEFAULT_EXECUTOR_THRESHOLD,
+    authenticators: Union[Mapping[str, AuthenticateFunc], None] = None,
+    authentication_cache_size: int = DEFAULT_AUTHENTICATION_CACHE_SIZE,
+    authentication_cache_ttl: float = DEFAULT_AUTHENTICATION_CACHE_TTL,
 ) -> web.Application: ...
 
 
@@ -434,13 +949,49 @@ def setup_openapi(
     schema: DictStrAny,
     spec: Spec,
     server_url: Union[Url, None] = None,
-    is_validate_response: bool = True,
+    is_validate_response: ValidateResponse = True,
+    has_openapi_schema_handler: bool = True,
+    use_error_middleware: bool = True,
+    error_middleware_kwargs: Union[ErrorMiddlewareKwargsDict, None] = None,
+    use_cors_middleware: bool = True,
+    cors_middleware_kwargs: Union[CorsMiddlewareKwargsDict, None] = None,
+    validate_email_kwargs: Union[ValidateEmailKwargsDict, None] = None,
+    validate_email_cache_size: int = DEFAULT_EMAIL_CACHE_SIZE,
+    validation_engine: ValidationEngine = "default",
+    json_loads: Union[JsonLoads, None] = None,
+    json_dumps: Union[JsonDumps, None] = None,
+    frozen_data: FrozenData = "pyrsistent",
+    validation_executor: Union[Executor, None] = None,
+    validation_executor_threshold: int = DEFAULT_EXECUTOR_THRESHOLD,
+    authenticators: Union[Mapping[str, AuthenticateFunc], None] = None,
+    authentication_cache_size: int = DEFAULT_AUTHENTICATION_CACHE_SIZE,
+    authentication_cache_ttl: float = DEFAULT_AUTHENTICATION_CACHE_TTL,
+) -> web.Application: ...
+
+
+@overload
+def setup_openapi(
+    app: web.Application,
+    *operations: OperationTableDef,
+    preloaded: PreloadedOpenAPI,
+    server_url: Union[Url, None] = None,
+    is_validate_response: ValidateResponse = True,
     has_openapi_schema_handler: bool = True,
     use_error_middleware: bool = True,
     error_middleware_kwargs: Union[ErrorMiddlewareKwargsDict, None] = None,
     use_cors_middleware: bool = True,
     cors_middleware_kwargs: Union[CorsMiddlewareKwargsDict, None] = None,
     validate_email_kwargs: Union[ValidateEmailKwargsDict, None] = None,
+    validate_email_cache_size: int = DEFAULT_EMAIL_CACHE_SIZE,
+    validation_engine: ValidationEngine = "default",
+    json_loads: Union[JsonLoads, None] = None,
+    json_dumps: Union[JsonDumps, None] = None,
+    frozen_data: FrozenData = "pyrsistent",
+    validation_executor: Union[Executor, None] = None,
+    validation_executor_threshold: int = DEFAULT_EXECUTOR_THRESHOLD,
+    authenticators: Union[Mapping[str, AuthenticateFunc], None] = None,
+    authentication_cache_size: int = DEFAULT_AUTHENTICATION_CACHE_SIZE,
+    authentication_cache_ttl: float = DEFAULT_AUTHENTICATION_CACHE_TTL,
 ) -> web.Application: ...
 
 
@@ -450,8 +1001,9 @@ def setup_openapi(  # type: ignore[misc]
     *operations: OperationTableDef,
     schema: Union[DictStrAny, None] = None,
     spec: Union[Spec, None] = None,
+    preloaded: Union[PreloadedOpenAPI, None] = None,
     server_url: Union[Url, None] = None,
-    is_validate_response: bool = True,
+    is_validate_response: ValidateResponse = True,
     has_openapi_schema_handler: bool = True,
     use_error_middleware: bool = True,
     error_middleware_kwargs: Union[ErrorMiddlewareKwargsDict, None] = None,
@@ -459,7 +1011,19 @@ def setup_openapi(  # type: ignore[misc]
     cors_middleware_kwargs: Union[CorsMiddlewareKwargsDict, None] = None,
     schema_loader: Union[SchemaLoader, None] = None,
     cache_create_schema_and_spec: bool = False,
+    cache_dir: Union[str, Path, None] = None,
+    lazy_spec: bool = False,
     validate_email_kwargs: Union[ValidateEmailKwargsDict, None] = None,
+    validate_email_cache_size: int = DEFAULT_EMAIL_CACHE_SIZE,
+    validation_engine: ValidationEngine = "default",
+    json_loads: Union[JsonLoads, None] = None,
+    json_dumps: Union[JsonDumps, None] = None,
+    frozen_data: FrozenData = "pyrsistent",
+    validation_executor: Union[Executor, None] = None,
+    validation_executor_threshold: int = DEFAULT_EXECUTOR_THRESHOLD,
+    authenticators: Union[Mapping[str, AuthenticateFunc], None] = None,
+    authentication_cache_size: int = DEFAULT_AUTHENTICATION_CACHE_SIZE,
+    authentication_cache_ttl: float = DEFAULT_AUTHENTICATION_CACHE_TTL,
 ) -> web.Application:
     """Setup OpenAPI schema to use with aiohttp.web application.
 
@@ -548,10 +1112,38 @@ def setup_openapi(  # type: ignore[misc]
 
     By default, *rororo* will validate operation responses against OpenAPI
     schema. To disable this feature, pass ``is_validate_response`` falsy flag.
+    To validate only some of responses, pass sampling rate (number from 0 to
+    1) or function, which accepts OpenAPI core operation & request and
+    returns boolean, instead,
+
+    .. code-block:: python
+
+        app = setup_openapi(
+            web.Application(),
+            Path(__file__).parent / "openapi.yaml",
+            operations,
+            is_validate_response=0.01,
+        )
+
+    Policy might be overridden for given operation via
+    ``x-rororo-validate-response`` extension (boolean or sampling rate) in
+    OpenAPI schema,
+
+    .. code-block:: yaml
+
+        paths:
+          /orders:
+            post:
+              operationId: "create_order"
+              x-rororo-validate-response: true
 
     By default, *rororo* will share the OpenAPI schema which is registered
     for your aiohttp.web application. In case if you don't want to share this
     schema, pass ``has_openapi_schema_handler=False`` on setting up OpenAPI.
+    Schema rendered into JSON or YAML format only once on first request,
+    supports ``ETag`` / ``If-None-Match`` headers, and is served compressed
+    with gzip (or brotli, when ``brotli`` library is installed) if client
+    accepts it.
 
     By default, *rororo* will enable
     :func:`aiohttp_middlewares.cors.cors_middleware` without any settings and
@@ -637,6 +1229,31 @@ def setup_openapi(  # type: ignore[misc]
         attempt read fresh schema from the disk and instantiate OpenAPI Spec
         instance.
 
+    To not read the schema and create its spec on every process start (which
+    might take several seconds for large OpenAPI schemas), pass
+    ``cache_dir`` to store them in the cache directory. Cache is keyed by
+    content hash of the schema file & files it references, schema loader and
+    versions of *rororo* & ``openapi-core``, so it is safe to keep the cache
+    directory between deploys. As cache is stored in pickle format, cache
+    directory must be trusted (not writable by other users),
+
+    .. code-block:: python
+
+        app = setup_openapi(
+            web.Application(),
+            Path(__file__).parent / "openapi.yaml",
+            operations,
+            cache_dir=Path("/var/cache/rororo"),
+        )
+
+    For large OpenAPI schemas, in case if only some of their operations are
+    actually used by the process, pass ``lazy_spec=True`` to not create spec
+    objects for all schema operations on setting up OpenAPI. In lazy mode
+    routes are registered right from the schema dict, while spec objects for
+    each operation are created on first request to the operation. Schema is
+    not validated in lazy mode, so please ensure it is valid in other way
+    (for example, by running ``openapi-spec-validator`` on CI).
+
     By default, *rororo* using ``validate_email`` function from
     `email-validator <https://github.com/JoshData/python-email-validator>`_
     library to validate email strings, which has been declared in OpenAPI
@@ -663,62 +1280,187 @@ def setup_openapi(  # type: ignore[misc]
             validate_email_kwargs={"check_deliverability": False},
         )
 
+    Outcomes of validating email strings are cached in LRU cache, shared
+    between all requests to the application, so repeated emails are not
+    validated again. Pass ``validate_email_cache_size`` to change max number
+    of cached outcomes (``1024`` by default), or ``0`` to disable the cache.
+
+    By default, *rororo* validates request & response data with
+    ``openapi-core`` unmarshallers, which interpret OpenAPI schemas with
+    ``jsonschema`` validator on each call. Pass
+    ``validation_engine="compiled"`` to compile operation schemas into Python
+    functions on first use instead. Validation errors stay the same, as for
+    invalid data ``openapi-core`` unmarshallers are still used to build them.
+
+    When running multiple workers from one parent process, read the schema &
+    create its spec only once in parent process via
+    :func:`rororo.openapi.preload_openapi` and pass the result as
+    ``preloaded`` keyword argument,
+
+    .. code-block:: python
+
+        app = setup_openapi(web.Application(), operations, preloaded=preloaded)
+
+    By default, *rororo* uses :func:`json.loads` & :func:`json.dumps` for
+    loading JSON request & response bodies, and for dumping error responses &
+    OpenAPI schema. Pass ``json_loads`` & ``json_dumps`` to use faster JSON
+    library instead, for example `orjson <https://pypi.org/project/orjson/>`_,
+
+    .. code-block:: python
+
+        import orjson
+
+        app = setup_openapi(
+            web.Application(),
+            Path(__file__).parent / "openapi.yaml",
+            operations,
+            json_loads=orjson.loads,
+            json_dumps=orjson.dumps,
+        )
+
+    ``json_dumps`` function might return either ``str`` or ``bytes``.
+
+    By default, *rororo* deeply converts valid request body data into
+    :mod:`pyrsistent` structures and request parameters into
+    :class:`pyrsistent.PMap` instances. For large request bodies pass
+    ``frozen_data="proxy"`` to wrap data into read-only views instead, which
+    do not copy the data and wrap nested dicts & lists only on access, or
+    ``frozen_data="none"`` to get plain dicts & lists as is.
+
+    Validating large request & response bodies might block the event loop
+    for significant time. Pass ``validation_executor`` (for example,
+    :class:`concurrent.futures.ThreadPoolExecutor`) to validate bodies of size
+    greater than or equal to ``validation_executor_threshold`` (256 KiB by
+    default) in given executor, while small bodies are still validated
+    inline,
+
+    .. code-block:: python
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        app = setup_openapi(
+            web.Application(),
+            Path(__file__).parent / "openapi.yaml",
+            operations,
+            validation_executor=ThreadPoolExecutor(max_workers=2),
+            validation_executor_threshold=1024 * 1024,
+        )
+
+    To authenticate security data of the request (API keys, tokens, basic
+    auth credentials) once for all handlers, pass ``authenticators`` mapping
+    of security scheme names to async functions, which accept security scheme
+    name & credential and return authentication result (for example, current
+    user) or raise an error for invalid credentials,
+
+    .. code-block:: python
+
+        async def authenticate_api_key(scheme_name: str, api_key: str) -> User:
+            user = await find_user_by_api_key(api_key)
+            if user is None:
+                raise InvalidCredentials()
+            return user
+
+
+        app = setup_openapi(
+            web.Application(),
+            Path(__file__).parent / "openapi.yaml",
+            operations,
+            authenticators={"apiKey": authenticate_api_key},
+        )
+
+    Authentication results are available as ``auth`` mapping of OpenAPI
+    context. They are kept in LRU cache (of ``authentication_cache_size``
+    items, ``1024`` by default) for ``authentication_cache_ttl`` seconds
+    (``60`` by default), while concurrent authentication of same credential
+    results in single authenticate function call.
+
     """
 
     if isinstance(schema_path, OperationTableDef):
         operations = (schema_path, *operations)
         schema_path = None
 
-    if schema is None and spec is None:
-        if schema_path is None:
+    core_operations: Mapping[str, Operation]
+    if preloaded is not None:
+        if schema is not None or spec is not None:
             raise ConfigurationError(
-                "Please supply only `spec` keyword argument, or only "
-                "`schema_path` positional argument, not both."
+                "Please supply only `preloaded` keyword argument, or only "
+                "`schema` & `spec` keyword arguments, not both."
             )
 
-        # Ensure OpenAPI schema is a readable file
-        path = (
-            Path(schema_path) if isinstance(schema_path, str) else schema_path
-        )
-        if not path.exists() or not path.is_file():
-            uid = os.getuid()
-            raise ConfigurationError(
-                f"Unable to find OpenAPI schema file at {path}. Please check "
-                "that file exists at given path and readable by current user "
-                f"ID: {uid}"
+        if schema_path is not None:
+            warnings.warn(
+                "You supplied `schema_path` positional argument as well as "
+                "supplying `preloaded` keyword argument. `schema_path` will "
+                "be ignored in favor of `preloaded` arg.",
+                stacklevel=2,
             )
 
-        # Create the spec and put it to the application dict as well
-        create_func: CreateSchemaAndSpec = (
-            create_schema_and_spec_with_cache  # type: ignore[assignment]
-            if cache_create_schema_and_spec
-            else create_schema_and_spec
-        )
+        # Preloaded spec already contains fixed operation securities and
+        # its operations are already indexed, so reuse them as is to not
+        # modify objects, which might be shared with the parent process
+        schema = preloaded.schema
+        spec = preloaded.spec
+        core_operations = preloaded.operations
+    else:
+        if schema is None and spec is None:
+            if schema_path is None:
+                raise ConfigurationError(
+                    "Please supply only `spec` keyword argument, or only "
+                    "`schema_path` positional argument, not both."
+                )
 
-        try:
-            schema, spec = create_func(path, schema_loader=schema_loader)
-        except Exception:
-            raise ConfigurationError(
-                f"Unable to load valid OpenAPI schema in {path}. In most "
-                "cases it means that given file doesn't contain valid OpenAPI "
-                "3 schema. To get full details about errors run "
-                f"`openapi-spec-validator {path.absolute()}`"
+            schema, spec = get_schema_and_spec(
+                schema_path,
+                schema_loader=schema_loader,
+                cache_create_schema_and_spec=cache_create_schema_and_spec,
+                cache_dir=cache_dir,
+                lazy_spec=lazy_spec,
+            )
+        elif schema_path is not None:
+            warnings.warn(
+                "You supplied `schema_path` positional argument as well as "
+                "supplying `schema` & `spec` keyword arguments. "
+                "`schema_path` will be ignored in favor of `schema` & `spec` "
+                "args.",
+                stacklevel=2,
             )
-    elif schema_path is not None:
-        warnings.warn(
-            "You supplied `schema_path` positional argument as well as "
-            "supplying `schema` & `spec` keyword arguments. `schema_path` "
-            "will be ignored in favor of `schema` & `spec` args.",
-            stacklevel=2,
-        )
 
-    # Fix all operation securities within OpenAPI spec
-    spec = fix_spec_operations(spec, cast(DictStrAny, schema))
+        # Fix all operation securities within OpenAPI spec
+        spec = fix_spec_operations(spec, cast(DictStrAny, schema))
 
-    # Store schema, spec, and validate email kwargs in application dict
+        # Index all spec operations by their IDs to not scan whole spec on
+        # looking up for each operation
+        core_operations = get_core_operations(spec)
+
+    # Store schema, spec, operations, validators, authenticators, validate
+    # email kwargs, JSON dumps function, and max request body sizes in
+    # application dict
     app[APP_OPENAPI_SCHEMA_KEY] = schema
     app[APP_OPENAPI_SPEC_KEY] = spec
+    app[APP_OPENAPI_OPERATIONS_KEY] = core_operations
+    app[APP_OPENAPI_VALIDATORS_KEY] = create_core_validators(
+        spec,
+        validate_email_kwargs=validate_email_kwargs,
+        validate_email_cache_size=validate_email_cache_size,
+        validation_engine=validation_engine,
+        json_loads=json_loads,
+        frozen_data=frozen_data,
+        executor=validation_executor,
+        executor_threshold=validation_executor_threshold,
+        security_plans=create_security_plans(spec, cast(DictStrAny, schema)),
+    )
+    app[APP_OPENAPI_AUTHENTICATORS_KEY] = create_authenticators(
+        spec,
+        authenticators,
+        cache_size=authentication_cache_size,
+        cache_ttl=authentication_cache_ttl,
+    )
     app[APP_VALIDATE_EMAIL_KWARGS_KEY] = validate_email_kwargs
+    app[APP_OPENAPI_JSON_DUMPS_KEY] = json_dumps or json.dumps
+    app[APP_OPENAPI_MAX_BODY_SIZES_KEY] = get_operations_max_body_size(
+        cast(DictStrAny, schema)
+    )
 
     # Register the route to dump openapi schema used for the application if
     # required
@@ -728,6 +1470,7 @@ def setup_openapi(  # type: ignore[misc]
         settings=app.get(APP_SETTINGS_KEY),
     )
     if has_openapi_schema_handler:
+        app[APP_OPENAPI_SCHEMA_DOCUMENTS_KEY] = {}
         app.router.add_get(
             add_prefix("/openapi.{schema_format}", route_prefix),
             views.openapi_schema,
@@ -736,7 +1479,9 @@ def setup_openapi(  # type: ignore[misc]
     # Register all operation handlers to web application
     for item in operations:
         app.router.add_routes(
-            convert_operations_to_routes(item, spec, prefix=route_prefix)
+            convert_operations_to_routes(
+                item, core_operations, prefix=route_prefix
+            )
         )
 
     # Add OpenAPI middleware
@@ -750,6 +1495,9 @@ def setup_openapi(  # type: ignore[misc]
                 is_validate_response=is_validate_response,
                 use_error_middleware=use_error_middleware,
                 error_middleware_kwargs=kwargs,
+                operations_validate_response=(
+                    get_operations_validate_response(cast(DictStrAny, schema))
+                ),
             ),
         )
     except TypeError:
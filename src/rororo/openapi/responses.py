@@ -0,0 +1,101 @@
+"""
+========================
+rororo.openapi.responses
+========================
+
+Provide JSON response, which data validated against OpenAPI schema before
+dumping it to JSON.
+
+"""
+
+import json
+from typing import Any, Union
+
+from aiohttp import web
+from aiohttp.typedefs import LooseHeaders
+from aiohttp.web_request import BaseRequest
+
+from rororo.openapi.annotations import JsonDumps
+from rororo.openapi.utils import dump_json, get_json_dumps
+
+
+class JSONResponse(web.Response):
+    """JSON response, which dumps its data only on preparing the response.
+
+    This allows OpenAPI middleware to validate response data as is, without
+    loading it back from JSON bytes, and to dump data into JSON exactly once
+    afterwards. If ``dumps`` function is not supplied, JSON dumps function of
+    the application is used.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        *,
+        status: int = 200,
+        reason: Union[str, None] = None,
+        headers: Union[LooseHeaders, None] = None,
+        content_type: str = "application/json",
+        dumps: Union[JsonDumps, None] = None,
+    ) -> None:
+        super().__init__(
+            status=status,
+            reason=reason,
+            headers=headers,
+            content_type=content_type,
+        )
+        self.data = data
+        self.dumps = dumps
+        self.is_dumped = False
+
+    def dump(self, dumps: JsonDumps) -> None:
+        """Dump response data into response body, if not dumped yet."""
+        if not self.is_dumped:
+            self.body = dump_json(self.dumps or dumps, self.data)
+            self.is_dumped = True
+
+    async def prepare(self, request: BaseRequest) -> Any:
+        self.dump(
+            get_json_dumps(request.config_dict)
+            if isinstance(request, web.Request)
+            else json.dumps
+        )
+        return await super().prepare(request)
+
+
+def json_response(
+    data: Any,
+    *,
+    status: int = 200,
+    reason: Union[str, None] = None,
+    headers: Union[LooseHeaders, None] = None,
+    content_type: str = "application/json",
+    dumps: Union[JsonDumps, None] = None,
+) -> JSONResponse:
+    """Return JSON response, which data validated before dumping it to JSON.
+
+    Unlike :func:`aiohttp.web.json_response`, data is not dumped to JSON on
+    calling the function. Instead, OpenAPI middleware validates response data
+    against OpenAPI schema as is and only after that data is dumped to JSON
+    with JSON dumps function of the application (or given ``dumps``).
+
+    .. code-block:: python
+
+        from rororo.openapi import json_response
+
+
+        @operations.register
+        async def retrieve_user(request: web.Request) -> web.Response:
+            return json_response({"id": 1, "email": "user@example.com"})
+
+    As response data validated as is, it should contain only JSON compatible
+    values (dicts, lists, strings, numbers, booleans & ``None``).
+    """
+    return JSONResponse(
+        data,
+        status=status,
+        reason=reason,
+        headers=headers,
+        content_type=content_type,
+        dumps=dumps,
+    )
@@ -0,0 +1,109 @@
+"""
+=====================
+rororo.openapi.routes
+=====================
+
+Bind OpenAPI operations to aiohttp.web routes on registering them, so there
+is no need to look up for the operation on handling each request.
+
+"""
+
+from typing import List, Mapping, Union
+
+import attr
+from aiohttp import hdrs, web
+from aiohttp.web_urldispatcher import AbstractResource
+from openapi_core.schema.operations.models import Operation
+
+from rororo.annotations import Handler, ViewType
+from rororo.openapi.constants import HANDLER_OPENAPI_MAPPING_KEY
+from rororo.openapi.exceptions import OperationError
+from rororo.openapi.utils import get_openapi_operation
+
+
+class OperationRoute(web.ResourceRoute):
+    """Route to view handler, which serves OpenAPI operation(s).
+
+    Keeps request method -> OpenAPI core operation mapping, the same way as
+    ``HANDLER_OPENAPI_MAPPING_KEY`` keeps request method -> operation ID
+    mapping for the view handler.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        handler: Union[Handler, ViewType],
+        resource: AbstractResource,
+        *,
+        core_operations: Mapping[str, Operation],
+    ) -> None:
+        super().__init__(method, handler, resource)
+        self.core_operations = core_operations
+
+    def get_core_operation(self, method: str) -> Union[Operation, None]:
+        """Return OpenAPI core operation for given request method."""
+        core_operations = self.core_operations
+        return core_operations.get(method) or core_operations.get(
+            hdrs.METH_ANY
+        )
+
+
+@attr.dataclass(frozen=True, repr=False, slots=True)
+class OperationRouteDef(web.AbstractRouteDef):
+    """Route definition for view handler, which serves OpenAPI operation(s).
+
+    Unlike :class:`aiohttp.web.RouteDef` registers
+    :class:`rororo.openapi.routes.OperationRoute` instead of generic
+    :class:`aiohttp.web.ResourceRoute`.
+    """
+
+    method: str
+    path: str
+    handler: Union[Handler, ViewType]
+    core_operations: Mapping[str, Operation]
+    name: Union[str, None] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<OperationRouteDef {self.method} {self.path} -> "
+            f"{self.handler.__name__!r}, name={self.name!r}>"
+        )
+
+    def register(self, router: web.UrlDispatcher) -> List[web.AbstractRoute]:
+        resource = router.add_resource(self.path, name=self.name)
+        route = OperationRoute(
+            self.method,
+            self.handler,
+            resource,
+            core_operations=self.core_operations,
+        )
+        resource.register_route(route)
+        return [route]
+
+
+def get_route_core_operation(request: web.Request) -> Union[Operation, None]:
+    """Return OpenAPI core operation, bound to the matched route.
+
+    For routes, added to the router manually, look up for the operation by
+    ``HANDLER_OPENAPI_MAPPING_KEY`` of the route handler (if any).
+
+    In case if request is not handled by OpenAPI operation view handler,
+    return ``None``.
+    """
+    match_info = request.match_info
+    route = match_info.route
+    if isinstance(route, OperationRoute):
+        return route.get_core_operation(request.method)
+
+    mapping = getattr(match_info.handler, HANDLER_OPENAPI_MAPPING_KEY, None)
+    if not isinstance(mapping, Mapping):
+        return None
+
+    operation_id = mapping.get(request.method) or mapping.get(hdrs.METH_ANY)
+    if operation_id is None:
+        return None
+
+    try:
+        return get_openapi_operation(request.config_dict, operation_id)
+    except OperationError:
+        return None
@@ -1,24 +1,220 @@
-from typing import cast, List, Union
+import asyncio
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import (
+    Any,
+    cast,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+)
 
+import attr
 from aiohttp import BasicAuth, hdrs
 from openapi_core.schema.operations.models import Operation
-from openapi_core.schema.security_schemes.enums import (
-    HttpAuthScheme,
-    SecuritySchemeType,
-)
+from openapi_core.schema.security_schemes.enums import SecuritySchemeType
 from openapi_core.schema.security_schemes.models import SecurityScheme
-from openapi_core.security.exceptions import SecurityError as CoreSecurityError
-from openapi_core.validation.request.datatypes import OpenAPIRequest
-from openapi_core.validation.request.validators import RequestValidator
+from openapi_core.schema.specs.models import Spec
+from openapi_core.validation.request.datatypes import RequestParameters
 from pyrsistent import pmap
 
-from rororo.annotations import MappingStrAny
-from rororo.openapi.annotations import SecurityDict
-from rororo.openapi.exceptions import BasicSecurityError, SecurityError
+from rororo.annotations import DictStrAny, MappingStrAny
+from rororo.openapi.annotations import AuthenticateFunc, SecurityDict
+from rororo.openapi.exceptions import (
+    BasicSecurityError,
+    ConfigurationError,
+    SecurityError,
+)
+from rororo.openapi.utils import iter_schema_operations
 
 
 AUTHORIZATION_HEADER = hdrs.AUTHORIZATION
 
+HTTP_BASIC = "basic"
+LOCATION_HEADER = "header"
+
+#: Default max number of authentication results to keep in cache for each
+#: security scheme
+DEFAULT_AUTHENTICATION_CACHE_SIZE = 1024
+
+#: Default time (in seconds) to keep authentication results in cache
+DEFAULT_AUTHENTICATION_CACHE_TTL = 60.0
+
+
+class Authenticator:
+    """Authenticate security data of the security scheme with TTL cache.
+
+    Results of ``authenticate(scheme_name, credential)`` calls are kept in
+    bounded LRU cache (of ``cache_size`` items) for ``cache_ttl`` seconds, so
+    same credential is authenticated once per TTL, not on each request.
+    Concurrent calls for same credential are deduplicated into single
+    ``authenticate`` call, which result is shared by all callers.
+
+    Errors raised by ``authenticate`` (such as
+    :class:`rororo.openapi.exceptions.InvalidCredentials`) are re-raised for
+    all waiting callers and are not cached. Pass ``cache_size=0`` or
+    ``cache_ttl=0`` to disable the cache, while keep deduplicating concurrent
+    calls.
+    """
+
+    def __init__(
+        self,
+        scheme_name: str,
+        authenticate: AuthenticateFunc,
+        *,
+        cache_size: int = DEFAULT_AUTHENTICATION_CACHE_SIZE,
+        cache_ttl: float = DEFAULT_AUTHENTICATION_CACHE_TTL,
+    ) -> None:
+        self.scheme_name = scheme_name
+        self.authenticate = authenticate
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+
+        self._cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._pending: "Dict[Hashable, asyncio.Future[Any]]" = {}
+
+    async def __call__(self, credential: Hashable) -> Any:
+        cached = self._cache.get(credential)
+        if cached is not None:
+            expires_at, result = cached
+            if expires_at > time.monotonic():
+                self._cache.move_to_end(credential)
+                return result
+            del self._cache[credential]
+
+        future = self._pending.get(credential)
+        if future is None:
+            future = self._pending[credential] = asyncio.ensure_future(
+                self.authenticate(self.scheme_name, credential)
+            )
+            future.add_done_callback(partial(self._store, credential))
+
+        # Do not cancel authentication, shared with other callers, on
+        # cancelling one of them
+        return await asyncio.shield(future)
+
+    def clear(self) -> None:
+        """Clear all cached authentication results."""
+        self._cache.clear()
+
+    def _store(
+        self, credential: Hashable, future: "asyncio.Future[Any]"
+    ) -> None:
+        del self._pending[credential]
+        if (
+            future.cancelled()
+            or future.exception() is not None
+            or not self.cache_size
+            or self.cache_ttl <= 0
+        ):
+            return
+
+        cache = self._cache
+        cache[credential] = (
+            time.monotonic() + self.cache_ttl,
+            future.result(),
+        )
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+
+@attr.dataclass(frozen=True, slots=True)
+class SecuritySchemePlan:
+    """Security scheme, resolved to get its data from the request.
+
+    ``location`` is a request parameters location (``header``, ``query`` or
+    ``cookie``) and ``key`` is a name of the parameter to get security data
+    from. For HTTP security schemes ``http_scheme`` is a lower-cased
+    authorization method, expected in ``Authorization`` header.
+
+    Missing & unsupported (OAuth 2 & OpenID) security schemes do not have
+    ``location``, so their security data is never found in the request.
+    """
+
+    name: str
+    location: Union[str, None] = None
+    key: Union[str, None] = None
+    http_scheme: Union[str, None] = None
+
+    @property
+    def is_basic_auth(self) -> bool:
+        return self.http_scheme == HTTP_BASIC
+
+    def get_data(
+        self, parameters: RequestParameters
+    ) -> Union[BasicAuth, str, None]:
+        """Get security data from request parameters.
+
+        Currently supported getting API Key & HTTP security data. OAuth &
+        OpenID data not supported yet.
+        """
+        if self.location is None:
+            return None
+
+        value: Union[str, None] = parameters[self.location].get(self.key)
+        if value is None or self.http_scheme is None:
+            return value
+
+        # Unlike ``openapi-core``, do not decode JWT bearer tokens using same
+        # rules as for basic auth
+        try:
+            auth_type, credentials = value.split(" ", 1)
+        except ValueError:
+            return None
+
+        if auth_type.lower() != self.http_scheme:
+            return None
+
+        if self.http_scheme == HTTP_BASIC:
+            return basic_auth_factory(credentials)
+        return credentials
+
+
+@attr.dataclass(frozen=True, slots=True)
+class SecurityPlan:
+    """Security requirements of the operation, resolved at setup time.
+
+    ``requirements`` are alternatives to check in given order, while each
+    alternative is a tuple of security schemes, which all should be matched
+    in the request. Empty alternative (for optional security) is always the
+    last one.
+    """
+
+    requirements: Tuple[Tuple[SecuritySchemePlan, ...], ...] = ()
+    is_basic_auth_only: bool = False
+
+    def iter_parameters(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over ``(location, name)`` of parameters with security data."""
+        for item in self.requirements:
+            for scheme in item:
+                if scheme.location is not None and scheme.key is not None:
+                    yield scheme.location, scheme.key
+
+
+async def authenticate_security(
+    authenticators: Union[Mapping[str, Authenticator], None],
+    security: MappingStrAny,
+) -> MappingStrAny:
+    """Authenticate security data with authenticators of security schemes.
+
+    Return mapping of security scheme names to authentication results, for
+    all matched security schemes, which have authenticators.
+    """
+    if not authenticators or not security:
+        return pmap()
+    return pmap(
+        {
+            scheme_name: await authenticators[scheme_name](credential)
+            for scheme_name, credential in security.items()
+            if scheme_name in authenticators
+        }
+    )
+
 
 def basic_auth_factory(value: str) -> BasicAuth:
     # Workaround for ``openapi-core==0.13.3``
@@ -29,133 +225,153 @@ def basic_auth_factory(value: str) -> BasicAuth:
     return BasicAuth.decode(f"Basic {value}")
 
 
-def get_jwt_security_data(request: OpenAPIRequest) -> Union[str, None]:
-    """Get JWT bearer security data.
+def create_authenticators(
+    spec: Spec,
+    authenticators: Union[Mapping[str, AuthenticateFunc], None],
+    *,
+    cache_size: int = DEFAULT_AUTHENTICATION_CACHE_SIZE,
+    cache_ttl: float = DEFAULT_AUTHENTICATION_CACHE_TTL,
+) -> Dict[str, Authenticator]:
+    """Create authenticators for given security schemes.
 
-    At a moment, openapi-core attempts to decode JWT header using same rules
-    as for basic auth, which might return unexpected results.
+    Raise :class:`rororo.openapi.exceptions.ConfigurationError` if security
+    scheme is not defined in OpenAPI schema or its authenticate function is
+    not callable.
     """
-    header: Union[str, None] = request.parameters.header.get(
-        AUTHORIZATION_HEADER
+    if not authenticators:
+        return {}
+
+    security_schemes = spec.components.security_schemes
+    for scheme_name, authenticate in authenticators.items():
+        if scheme_name not in security_schemes:
+            raise ConfigurationError(
+                f"Unable to register authenticator for {scheme_name!r} "
+                "security scheme, as it is not defined in OpenAPI schema."
+            )
+        if not callable(authenticate):
+            raise ConfigurationError(
+                f"Invalid authenticator for {scheme_name!r} security scheme: "
+                f"{authenticate!r}. Please supply async function, which "
+                "accepts security scheme name & credential."
+            )
+
+    return {
+        scheme_name: Authenticator(
+            scheme_name,
+            authenticate,
+            cache_size=cache_size,
+            cache_ttl=cache_ttl,
+        )
+        for scheme_name, authenticate in authenticators.items()
+    }
+
+
+def create_security_plan(
+    security_list: List[SecurityDict],
+    security_schemes: Mapping[str, SecurityScheme],
+) -> SecurityPlan:
+    """Create security plan from security requirements of the operation.
+
+    If operation "secured" with an empty object it means the whole security
+    rules are optional. However to not return empty security details, given
+    security requirement is moved to the bottom of the plan.
+    """
+    requirements = tuple(
+        tuple(
+            create_security_scheme_plan(name, security_schemes.get(name))
+            for name in item
+        )
+        for item in sorted(security_list, key=lambda item: not item)
     )
 
-    # Header does not exist
-    if header is None:
-        return None
-
-    try:
-        maybe_bearer, value = header.split(" ", 1)
-    except ValueError:
-        return None
-
-    if maybe_bearer.lower() != "bearer":
-        return None
-
-    return value
+    # If there is only one security schema with one security schema item and
+    # it is a HTTP basic - raise BasicSecurityError (401 Unauthenticated). In
+    # all other cases - raise a SecurityError (403 Access Denied)
+    return SecurityPlan(
+        requirements,
+        is_basic_auth_only=(
+            len(requirements) == 1
+            and len(requirements[0]) == 1
+            and requirements[0][0].is_basic_auth
+        ),
+    )
 
 
-def get_security_data(
-    validator: RequestValidator, request: OpenAPIRequest, scheme_name: str
-) -> Union[BasicAuth, str, None]:
-    """Get security data from request.
+def create_security_plans(
+    spec: Spec, schema: DictStrAny
+) -> Dict[str, SecurityPlan]:
+    """Create security plans for all operations within OpenAPI schema.
 
-    Currently supported getting API Key & HTTP security data. OAuth & OpenID
-    data not supported yet.
+    Security requirements are read from the schema dict, not from the spec
+    operations, so lazy spec operations are not created on setting up
+    OpenAPI.
     """
-    if is_jwt_bearer_security_scheme(validator, scheme_name):
-        return get_jwt_security_data(request)
-
-    try:
-        value: str = validator._get_security_value(scheme_name, request)
-    except CoreSecurityError:
-        return None
+    security_schemes = spec.components.security_schemes
+    global_security = schema.get("security") or []
+    plans: Dict[str, SecurityPlan] = {}
 
-    if is_basic_auth_security_scheme(validator, scheme_name):
-        return basic_auth_factory(value)
-    return value
+    for operation_id, operation_data in iter_schema_operations(schema):
+        security_list = operation_data.get("security")
+        plans[operation_id] = create_security_plan(
+            global_security if security_list is None else security_list,
+            security_schemes,
+        )
 
+    return plans
 
-def get_security_list(
-    validator: RequestValidator, operation: Operation
-) -> List[SecurityDict]:
-    if operation.security is not None:
-        return cast(List[SecurityDict], operation.security)
-    return cast(List[SecurityDict], validator.spec.security)
 
+def create_security_scheme_plan(
+    name: str, scheme: Union[SecurityScheme, None]
+) -> SecuritySchemePlan:
+    if scheme is None:
+        return SecuritySchemePlan(name)
 
-def get_security_scheme(
-    validator: RequestValidator, scheme_name: str
-) -> Union[SecurityScheme, None]:
-    return validator.spec.components.security_schemes.get(scheme_name)
+    if scheme.type == SecuritySchemeType.API_KEY:
+        return SecuritySchemePlan(
+            name, location=scheme.apikey_in.value, key=scheme.name
+        )
 
+    if scheme.type == SecuritySchemeType.HTTP:
+        return SecuritySchemePlan(
+            name,
+            location=LOCATION_HEADER,
+            key=AUTHORIZATION_HEADER,
+            http_scheme=scheme.scheme.value.lower(),
+        )
 
-def is_basic_auth_security_scheme(
-    validator: RequestValidator, scheme_name: str
-) -> bool:
-    scheme = get_security_scheme(validator, scheme_name)
-    if scheme is None:
-        return False
-    return cast(
-        bool,
-        scheme.type == SecuritySchemeType.HTTP
-        and scheme.scheme == HttpAuthScheme.BASIC,
-    )
+    return SecuritySchemePlan(name)
 
 
-def is_jwt_bearer_security_scheme(
-    validator: RequestValidator, scheme_name: str
-) -> bool:
-    scheme = get_security_scheme(validator, scheme_name)
-    if scheme is None:
-        return False
-    return cast(
-        bool,
-        scheme.type == SecuritySchemeType.HTTP
-        and scheme.scheme == HttpAuthScheme.BEARER,
-    )
+def get_security_list(spec: Spec, operation: Operation) -> List[SecurityDict]:
+    if operation.security is not None:
+        return cast(List[SecurityDict], operation.security)
+    return cast(List[SecurityDict], spec.security)
 
 
 def validate_security(
-    validator: RequestValidator, request: OpenAPIRequest, operation: Operation
+    plan: SecurityPlan, parameters: RequestParameters
 ) -> MappingStrAny:
     """Validate security data for the request if any.
 
-    First, check whether operation is secured or there is global security
-    definitions. If not and current operation is not secured - return empty
-    :class:`pyrsistent.PMap`.
+    Security data is read only from request headers, query string & cookies,
+    so security might be validated before reading request body.
 
-    If operation secured, go through all security items and attempt to match
-    their data in request. If some of security items is matched - return it
-    as result, if not - raise `SecurityError`.
+    If operation is not secured (and there is no global security
+    definitions) - return empty :class:`pyrsistent.PMap`.
+
+    If operation secured, go through all security requirements of the plan
+    and attempt to match their data in request. If some of security
+    requirements is matched - return it as result, if not - raise
+    `SecurityError`.
     """
-    security_list = get_security_list(validator, operation)
-    if not security_list:
+    if not plan.requirements:
         return pmap()
 
-    # If operation "secured" with an empty object it means the whole security
-    # rules are optional. However to not return empty security details it is
-    # needed to move given security scheme to the bottom
-    has_empty_security = {} in security_list
-    if has_empty_security:
-        security_list.remove({})
-        security_list.append({})
-
-    for item in security_list:
-        data = {
-            key: get_security_data(validator, request, key) for key in item
-        }
+    for item in plan.requirements:
+        data = {scheme.name: scheme.get_data(parameters) for scheme in item}
         if all(value for value in data.values()):
             return pmap(data)
 
-    # To supply proper security error need to check how many security schemas
-    # should be applied for given operation
-    #
-    # If there is only one security schema with one security schema item and
-    # it is a HTTP basic - raise BasicSecurityError (401 Unauthenticated). In
-    # all other cases - raise a SecurityError (403 Access Denied)
-    if len(security_list) == 1 and len(security_list[0]) == 1:
-        scheme_name = list(security_list[0].keys())[0]
-        if is_basic_auth_security_scheme(validator, scheme_name):
-            raise BasicSecurityError()
-
+    if plan.is_basic_auth_only:
+        raise BasicSecurityError()
     raise SecurityError()
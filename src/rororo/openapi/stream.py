@@ -0,0 +1,213 @@
+"""
+=====================
+rororo.openapi.stream
+=====================
+
+Read JSON array request bodies from the request stream item by item, to
+validate each item on reading it instead of buffering the whole body.
+
+"""
+
+import codecs
+import json
+from typing import Any, AsyncIterator, List, Tuple, Union
+
+from aiohttp import StreamReader, web
+
+
+#: Default size of chunk (in bytes) to read from the request stream
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+#: Default max size of single JSON array item (in characters) to buffer on
+#: reading it from the request stream
+DEFAULT_MAX_ITEM_SIZE = 1024 * 1024
+
+JSON_WHITESPACE = frozenset(" \t\n\r")
+JSON_ITEM_DELIMITERS = JSON_WHITESPACE | {",", "]"}
+
+STATE_START = "start"
+STATE_FIRST_ITEM = "first_item"
+STATE_ITEM = "item"
+STATE_DELIMITER = "delimiter"
+STATE_END = "end"
+
+
+class JSONArrayParser:
+    """Incremental parser of JSON array, which returns array items on feeding.
+
+    Only array items are kept in memory, not the whole array. Each item is
+    parsed with :meth:`json.JSONDecoder.raw_decode` as soon as it is fully
+    fed to the parser.
+
+    Parts of item, which is not fed completely yet, are buffered & decoding
+    of the item is retried only after its buffered size doubles (or exceeds
+    ``max_item_size``, if any), so large items are not decoded from the start
+    on feeding each part of them.
+    """
+
+    def __init__(self, *, max_item_size: Union[int, None] = None) -> None:
+        self._buffer: List[str] = []
+        self._buffer_size = 0
+        self._decoder = json.JSONDecoder()
+        self._max_item_size = max_item_size
+        self._min_decode_size = 0
+        self._state = STATE_START
+
+    @property
+    def buffer_size(self) -> int:
+        """Number of characters, which are fed, but not parsed yet."""
+        return self._buffer_size
+
+    def close(self) -> None:
+        """Ensure JSON array is complete after feeding its final part."""
+        if self._state != STATE_END:
+            raise ValueError("Unexpected end of JSON array")
+
+    def feed(self, data: str, *, is_final: bool = False) -> List[Any]:
+        """Feed next part of JSON array & return all items parsed so far.
+
+        Pass ``is_final=True`` on feeding last part of JSON array.
+        """
+        return [item for item, _ in self.feed_sized(data, is_final=is_final)]
+
+    def feed_sized(
+        self, data: str, *, is_final: bool = False
+    ) -> List[Tuple[Any, int]]:
+        """Same as :meth:`feed`, but return items with their raw JSON sizes.
+
+        Size is a number of characters, item has been taken in JSON array.
+        """
+        self._buffer.append(data)
+        self._buffer_size += len(data)
+        if not is_final and self._buffer_size < self._min_decode_size:
+            return []
+
+        buffer = "".join(self._buffer)
+        size = len(buffer)
+        pos = 0
+        items = []
+        self._min_decode_size = 0
+
+        while True:
+            while pos < size and buffer[pos] in JSON_WHITESPACE:
+                pos += 1
+            if pos == size:
+                break
+
+            char = buffer[pos]
+            state = self._state
+
+            if state == STATE_START:
+                if char != "[":
+                    raise ValueError("Expecting JSON array")
+                self._state = STATE_FIRST_ITEM
+                pos += 1
+            elif state == STATE_DELIMITER or (
+                state == STATE_FIRST_ITEM and char == "]"
+            ):
+                if char == "]":
+                    self._state = STATE_END
+                elif char == ",":
+                    self._state = STATE_ITEM
+                else:
+                    raise ValueError(
+                        f"Expecting ',' delimiter or ']' at char {pos}"
+                    )
+                pos += 1
+            elif state == STATE_END:
+                raise ValueError(f"Extra data after JSON array at char {pos}")
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Item might not be fed completely yet
+                    if is_final:
+                        raise
+                    self._delay_decoding(size - pos)
+                    break
+
+                # Numbers might be fed partially (as ``1`` instead of ``1.5``),
+                # so accept item only if it is followed by delimiter
+                if not is_final and (
+                    end == size or buffer[end] not in JSON_ITEM_DELIMITERS
+                ):
+                    self._delay_decoding(size - pos)
+                    break
+
+                items.append((item, end - pos))
+                self._state = STATE_DELIMITER
+                pos = end
+
+        rest = buffer[pos:]
+        self._buffer = [rest]
+        self._buffer_size = len(rest)
+        return items
+
+    def _delay_decoding(self, item_size: int) -> None:
+        min_decode_size = 2 * item_size
+        if self._max_item_size is not None:
+            min_decode_size = min(min_decode_size, self._max_item_size + 1)
+        self._min_decode_size = min_decode_size
+
+
+async def iter_json_array(
+    content: StreamReader,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_size: Union[int, None] = None,
+    max_item_size: int = DEFAULT_MAX_ITEM_SIZE,
+) -> AsyncIterator[Any]:
+    """Iterate over items of JSON array, read from the stream by chunks.
+
+    Raise :class:`ValueError` if stream does not contain valid JSON array.
+    Raise :class:`aiohttp.web.HTTPRequestEntityTooLarge` if more than
+    ``max_size`` bytes read from the stream, or if single array item is
+    larger than ``max_item_size`` characters.
+    """
+    async for item, _ in iter_sized_json_array(
+        content,
+        chunk_size=chunk_size,
+        max_size=max_size,
+        max_item_size=max_item_size,
+    ):
+        yield item
+
+
+async def iter_sized_json_array(
+    content: StreamReader,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_size: Union[int, None] = None,
+    max_item_size: int = DEFAULT_MAX_ITEM_SIZE,
+) -> AsyncIterator[Tuple[Any, int]]:
+    """Same as :func:`iter_json_array`, but yield items with their sizes.
+
+    Size is a number of characters, item has been taken in JSON array.
+    """
+    parser = JSONArrayParser(max_item_size=max_item_size)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    read_size = 0
+
+    while True:
+        chunk = await content.read(chunk_size)
+        is_final = not chunk
+
+        read_size += len(chunk)
+        if max_size is not None and read_size > max_size:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=max_size, actual_size=read_size
+            )
+
+        for sized_item in parser.feed_sized(
+            decoder.decode(chunk, final=is_final), is_final=is_final
+        ):
+            yield sized_item
+
+        if parser.buffer_size > max_item_size:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=max_item_size, actual_size=parser.buffer_size
+            )
+
+        if is_final:
+            parser.close()
+            return
@@ -1,21 +1,31 @@
-from typing import Any, cast, Union
+import json
+from typing import Any, cast, Iterator, Tuple, Union
 
 from aiohttp import web
 from aiohttp.helpers import ChainMapProxy
+from jsonschema.validators import RefResolver
+from openapi_core.schema.operations.models import Operation
 from openapi_core.schema.specs.models import Spec
 from openapi_core.validation.request.datatypes import OpenAPIRequest
+from openapi_spec_validator import default_handlers
 from yarl import URL
 
 from rororo.annotations import DictStrAny
-from rororo.openapi.annotations import ValidateEmailKwargsDict
+from rororo.openapi.annotations import JsonDumps, ValidateEmailKwargsDict
 from rororo.openapi.constants import (
+    APP_OPENAPI_JSON_DUMPS_KEY,
+    APP_OPENAPI_OPERATIONS_KEY,
     APP_OPENAPI_SCHEMA_KEY,
     APP_OPENAPI_SPEC_KEY,
     APP_VALIDATE_EMAIL_KWARGS_KEY,
     REQUEST_OPENAPI_CONTEXT_KEY,
 )
 from rororo.openapi.data import OpenAPIContext, OpenAPIParameters
-from rororo.openapi.exceptions import ConfigurationError, ContextError
+from rororo.openapi.exceptions import (
+    ConfigurationError,
+    ContextError,
+    OperationError,
+)
 
 
 def add_prefix(path: str, prefix: Union[str, None]) -> str:
@@ -26,10 +36,29 @@ def add_prefix(path: str, prefix: Union[str, None]) -> str:
     return path
 
 
+def dump_json(dumps: JsonDumps, data: Any) -> bytes:
+    """Dump data into JSON bytes with given ``dumps`` function.
+
+    ``dumps`` function might return either ``str`` (as :func:`json.dumps`) or
+    ``bytes`` (as ``orjson.dumps``).
+    """
+    value = dumps(data)
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+
 def get_base_url(core_request: OpenAPIRequest) -> str:
     return str(URL(core_request.full_url_pattern).with_path("/"))
 
 
+def get_json_dumps(mixed: Union[web.Application, ChainMapProxy]) -> JsonDumps:
+    """Shortcut to retrieve function to dump JSON data for the application.
+
+    Fallback to :func:`json.dumps` if OpenAPI is not set up for given
+    :class:`aiohttp.web.Application`.
+    """
+    return cast(JsonDumps, mixed.get(APP_OPENAPI_JSON_DUMPS_KEY, json.dumps))
+
+
 def get_openapi_context(request: web.Request) -> OpenAPIContext:
     """Shortcut to retrieve OpenAPI schema from ``aiohttp.web`` request.
 
@@ -49,6 +78,36 @@ def get_openapi_context(request: web.Request) -> OpenAPIContext:
         )
 
 
+def get_openapi_operation(
+    mixed: Union[web.Application, ChainMapProxy], operation_id: str
+) -> Operation:
+    """Shortcut to retrieve OpenAPI operation by its ID.
+
+    Lookup is done against operation ID -> operation mapping, which is built
+    once on :func:`rororo.openapi.setup_openapi` call, so it does not depend
+    on the number of operations in OpenAPI schema.
+
+    ``ConfigurationError`` raises if :class:`aiohttp.web.Application` does not
+    contain registered OpenAPI spec, ``OperationError`` raises if operation
+    with given ID does not exist in the spec.
+    """
+    try:
+        core_operations = mixed[APP_OPENAPI_OPERATIONS_KEY]
+    except KeyError:
+        raise ConfigurationError(
+            "Seems like OpenAPI spec not registered to the application. Use "
+            '"from rororo import setup_openapi" function to register OpenAPI '
+            "schema to your web.Application."
+        )
+
+    try:
+        return cast(Operation, core_operations[operation_id])
+    except KeyError:
+        raise OperationError(
+            f"Unable to find operation '{operation_id}' in given OpenAPI spec"
+        )
+
+
 def get_openapi_schema(
     mixed: Union[web.Application, ChainMapProxy]
 ) -> DictStrAny:
@@ -113,3 +172,31 @@ def get_validated_parameters(request: web.Request) -> OpenAPIParameters:
     ``ContextError`` will be raised.
     """
     return get_openapi_context(request).parameters
+
+
+def iter_schema_operations(
+    schema: DictStrAny,
+) -> Iterator[Tuple[str, DictStrAny]]:
+    """Iterate over operation IDs & data of all operations in OpenAPI schema.
+
+    Operations are read from the schema dict, not from the spec, so lazy spec
+    operations are not created on setting up OpenAPI. Path items, which are
+    ``$ref`` references, are resolved. Operations without ``operationId`` are
+    skipped.
+    """
+    resolver = RefResolver("", schema, handlers=default_handlers)
+
+    for path_data in schema["paths"].values():
+        ref = path_data.get("$ref")
+        if isinstance(ref, str):
+            _, path_data = resolver.resolve(ref)  # type: ignore[no-untyped-call]
+
+        for maybe_operation_data in path_data.values():
+            if not isinstance(maybe_operation_data, dict):
+                continue
+
+            operation_id = maybe_operation_data.get("operationId")
+            if operation_id is None:
+                continue
+
+            yield (operation_id, maybe_operation_data)
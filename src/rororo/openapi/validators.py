@@ -1,32 +1,136 @@
+import random
+from typing import Any, Callable, cast, TypeVar, Union
+
 from aiohttp import web
+from openapi_core.schema.operations.models import Operation
 
+from rororo.annotations import MappingStrAny
+from rororo.openapi.annotations import ValidateResponse, ValidateResponseFunc
 from rororo.openapi.constants import (
+    APP_OPENAPI_AUTHENTICATORS_KEY,
+    REQUEST_CORE_OPERATION_KEY,
     REQUEST_CORE_REQUEST_KEY,
     REQUEST_OPENAPI_CONTEXT_KEY,
 )
 from rororo.openapi.core_data import (
+    get_body_size,
     to_core_openapi_request,
     to_core_openapi_response,
+    to_core_request_parameters,
 )
 from rororo.openapi.core_validators import (
+    CoreValidators,
+    get_core_validators,
+    run_in_executor,
     validate_core_request,
     validate_core_response,
 )
 from rororo.openapi.data import OpenAPIContext
-from rororo.openapi.utils import get_openapi_spec, get_validate_email_kwargs
+from rororo.openapi.exceptions import ConfigurationError
+from rororo.openapi.security import authenticate_security, validate_security
+
+
+T = TypeVar("T")
+
+
+def ensure_validate_response(value: Any, *, name: str) -> ValidateResponse:
+    """Ensure given value is valid response validation policy.
+
+    Policy might be a boolean, a sampling rate (number from 0 to 1), or, if
+    ``name`` is not an OpenAPI schema extension, a callable.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (float, int)):
+        if 0 <= value <= 1:
+            return float(value)
+    elif callable(value) and not name.startswith("x-"):
+        return cast(ValidateResponseFunc, value)
+
+    raise ConfigurationError(
+        f"Invalid {name!r} value: {value!r}. Please supply boolean, sampling "
+        "rate (number from 0 to 1), or function, which accepts operation & "
+        "request, and returns boolean."
+    )
+
+
+async def run_validation(
+    core_validators: CoreValidators,
+    body: Any,
+    func: Callable[..., T],
+    *args: Any,
+) -> T:
+    """Run validation function inline or in the executor for large bodies.
+
+    Validation of request or response body, which size is greater than or
+    equal to executor threshold, runs in validation executor (if any) to not
+    block the event loop. Size of JSON response data, which is not dumped
+    yet, is estimated without dumping it. Errors raised by validation
+    function are re-raised as is.
+    """
+    executor = core_validators.executor
+    threshold = core_validators.executor_threshold
+    size = get_body_size(body, threshold)
+    if executor is None or size is None or size < threshold:
+        return func(*args)
+    return await run_in_executor(executor, func, *args)
+
+
+def should_validate_response(
+    policy: ValidateResponse, operation: Operation, request: web.Request
+) -> bool:
+    """Check whether response for given operation & request to be validated.
+
+    Response is validated for every request on ``True``, for given share of
+    requests on sampling rate, or when function returns ``True``.
+    """
+    if isinstance(policy, bool):
+        return policy
+    if isinstance(policy, float):
+        return random.random() < policy
+    return policy(operation, request)
 
 
 async def validate_request(request: web.Request) -> web.Request:
     config_dict = request.config_dict
+    core_validators = get_core_validators(config_dict)
+    authenticators = config_dict.get(APP_OPENAPI_AUTHENTICATORS_KEY)
+
+    # Convert only parameters, which operation needs. Then validate &
+    # authenticate request security by request headers, query string &
+    # cookies only, before reading request body, to reject unauthenticated
+    # requests without buffering their bodies
+    core_operation = request.get(REQUEST_CORE_OPERATION_KEY)
+    core_parameters = to_core_request_parameters(
+        request,
+        (
+            core_validators.request.get_parameter_names(core_operation)
+            if core_operation is not None
+            else None
+        ),
+    )
+    core_security: Union[MappingStrAny, None] = None
+    auth: Union[MappingStrAny, None] = None
+    if core_operation is not None:
+        core_security = validate_security(
+            core_validators.request.get_security_plan(core_operation),
+            core_parameters,
+        )
+        auth = await authenticate_security(authenticators, core_security)
 
-    core_request = await to_core_openapi_request(request)
+    core_request = await to_core_openapi_request(
+        request, parameters=core_parameters, security=core_security
+    )
     request[REQUEST_CORE_REQUEST_KEY] = core_request
 
-    security, parameters, data = validate_core_request(
-        get_openapi_spec(config_dict),
+    security, parameters, data = await run_validation(
+        core_validators,
+        core_request.body,
+        validate_core_request,
+        core_validators.request,
         core_request,
-        validate_email_kwargs=get_validate_email_kwargs(config_dict),
     )
+
     request[REQUEST_OPENAPI_CONTEXT_KEY] = OpenAPIContext(
         request=request,
         app=request.app,
@@ -34,20 +138,27 @@ async def validate_request(request: web.Request) -> web.Request:
         parameters=parameters,
         security=security,
         data=data,
+        auth=(
+            await authenticate_security(authenticators, security)
+            if auth is None
+            else auth
+        ),
     )
 
     return request
 
 
-def validate_response(
+async def validate_response(
     request: web.Request, response: web.StreamResponse
 ) -> web.StreamResponse:
-    config_dict = request.config_dict
-
-    validate_core_response(
-        get_openapi_spec(config_dict),
+    core_validators = get_core_validators(request.config_dict)
+    core_response = to_core_openapi_response(response)
+    await run_validation(
+        core_validators,
+        core_response.data,
+        validate_core_response,
+        core_validators.response,
         request[REQUEST_CORE_REQUEST_KEY],
-        to_core_openapi_response(response),
-        validate_email_kwargs=get_validate_email_kwargs(config_dict),
+        core_response,
     )
     return response
@@ -1,17 +1,58 @@
+import gzip
+import hashlib
+import json
 import logging
+from typing import Dict, Tuple, Union
 
+import attr
 import yaml
-from aiohttp import web
+from aiohttp import hdrs, web
+from aiohttp.helpers import ChainMapProxy
 from aiohttp_middlewares import error_context
 
-from rororo.annotations import MappingStrStr
+from rororo.annotations import DictStrAny, MappingStrStr
+from rororo.openapi.annotations import JsonDumps
+from rororo.openapi.constants import APP_OPENAPI_SCHEMA_DOCUMENTS_KEY
 from rororo.openapi.exceptions import ConfigurationError, OpenAPIError
-from rororo.openapi.utils import get_openapi_schema
+from rororo.openapi.utils import dump_json, get_json_dumps, get_openapi_schema
 
 
+# Brotli is an optional dependency, schema documents are compressed with
+# gzip only, if it is not installed
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+#: Content encodings of rendered OpenAPI schema in order of preference
+SCHEMA_DOCUMENT_ENCODINGS: Tuple[str, ...] = (
+    ("br", "gzip") if brotli is not None else ("gzip",)
+)
+
 logger = logging.getLogger(__name__)
 
 
+@attr.dataclass(frozen=True, slots=True)
+class SchemaDocument:
+    """OpenAPI schema, rendered into one of supported formats.
+
+    Contains body for each supported content encoding, as well as strong
+    ETag of the identity body, to not render & compress schema on every
+    request.
+    """
+
+    content_type: str
+    etag: str
+    bodies: Dict[str, bytes]
+
+    def get_etag(self, encoding: Union[str, None]) -> str:
+        # Strong ETag must differ for each content encoding of the document
+        if encoding is None:
+            return f'"{self.etag}"'
+        return f'"{self.etag}-{encoding}"'
+
+
 async def default_error_handler(request: web.Request) -> web.Response:
     """Default error handler which will ignore logging OpenAPI errors."""
     with error_context(request) as context:
@@ -23,28 +64,128 @@ async def default_error_handler(request: web.Request) -> web.Response:
         else:
             logger.error(context.message, exc_info=True)  # noqa: LOG014
 
-        return web.json_response(
-            context.data,
+        return web.Response(
+            body=dump_json(get_json_dumps(request.config_dict), context.data),
             status=context.status,
             headers=headers,
+            content_type="application/json",
         )
 
 
+def get_accepted_encoding(request: web.Request) -> Union[str, None]:
+    """Pick most preferred encoding of schema document accepted by client.
+
+    ``None`` means client does not accept any compressed schema document.
+    """
+    accepted: Dict[str, float] = {}
+    for item in request.headers.get(hdrs.ACCEPT_ENCODING, "").split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    for encoding in SCHEMA_DOCUMENT_ENCODINGS:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def get_schema_document(
+    config_dict: ChainMapProxy, schema_format: str
+) -> SchemaDocument:
+    """Get OpenAPI schema, rendered into given format.
+
+    Schema document rendered only once on first request and stored within
+    the ``web.Application`` instance, so all next requests reuse it.
+    """
+    documents: Dict[str, SchemaDocument] = config_dict[
+        APP_OPENAPI_SCHEMA_DOCUMENTS_KEY
+    ]
+    document = documents.get(schema_format)
+    if document is None:
+        document = documents[schema_format] = render_schema_document(
+            get_openapi_schema(config_dict),
+            schema_format,
+            json_dumps=get_json_dumps(config_dict),
+        )
+    return document
+
+
+def is_etag_matched(if_none_match: str, etag: str) -> bool:
+    """Check whether given ETag matches ``If-None-Match`` header value.
+
+    As of RFC 7232, weak comparison is used for ``If-None-Match`` header.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    for item in if_none_match.split(","):
+        item = item.strip()
+        if item.startswith("W/"):
+            item = item[2:]
+        if item == etag:
+            return True
+    return False
+
+
 async def openapi_schema(request: web.Request) -> web.Response:
-    """Dump OpenAPI Schema into specified format."""
-    schema_format = request.match_info.get("schema_format")
-    schema = get_openapi_schema(request.config_dict)
+    """Dump OpenAPI Schema into specified format.
 
-    if schema_format == "json":
-        return web.json_response(schema)
+    Respond with ``304 Not Modified`` if client already has the schema
+    document with same ETag and with compressed document if client accepts
+    it.
+    """
+    document = get_schema_document(
+        request.config_dict, request.match_info.get("schema_format", "")
+    )
+
+    encoding = get_accepted_encoding(request)
+    etag = document.get_etag(encoding)
+    headers = {hdrs.ETAG: etag, hdrs.VARY: hdrs.ACCEPT_ENCODING}
+
+    if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+    if if_none_match is not None and is_etag_matched(if_none_match, etag):
+        return web.Response(status=304, headers=headers)
 
-    if schema_format == "yaml":
+    if encoding is not None:
+        headers[hdrs.CONTENT_ENCODING] = encoding
+
+    return web.Response(
+        body=document.bodies[encoding or "identity"],
+        content_type=document.content_type,
+        headers=headers,
+    )
+
+
+def render_schema_document(
+    schema: DictStrAny,
+    schema_format: str,
+    *,
+    json_dumps: JsonDumps = json.dumps,
+) -> SchemaDocument:
+    if schema_format == "json":
+        body = dump_json(json_dumps, schema)
+        content_type = "application/json"
+    elif schema_format == "yaml":
         safe_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
-        return web.Response(
-            text=yaml.dump(schema, Dumper=safe_dumper),
-            content_type="application/yaml",
+        body = yaml.dump(schema, Dumper=safe_dumper).encode("utf-8")
+        content_type = "application/yaml"
+    else:
+        raise ConfigurationError(
+            f"Schema format {schema_format} not supported at a moment."
         )
 
-    raise ConfigurationError(
-        f"Schema format {schema_format} not supported at a moment."
+    bodies = {"identity": body, "gzip": gzip.compress(body, mtime=0)}
+    if brotli is not None:
+        bodies["br"] = brotli.compress(body)
+
+    return SchemaDocument(
+        content_type=content_type,
+        etag=hashlib.sha256(body).hexdigest()[:32],
+        bodies=bodies,
     )
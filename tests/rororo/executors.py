@@ -0,0 +1,22 @@
+"""
+=========
+executors
+=========
+
+Executors to use in tests.
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool executor, which counts number of submitted calls."""
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.calls = 0
+
+    def submit(self, *args, **kwargs):
+        self.calls += 1
+        return super().submit(*args, **kwargs)
@@ -2,12 +2,17 @@ import datetime
 import io
 import json
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 
 import pyrsistent
 import pytest
 import yaml
 from aiohttp import web
+from openapi_core.deserializing.media_types.factories import (
+    MediaTypeDeserializersFactory,
+)
 from openapi_core.shortcuts import create_spec
 from yarl import URL
 
@@ -22,13 +27,22 @@ from rororo import (
     setup_settings_from_environ,
 )
 from rororo.annotations import DictStrAny
-from rororo.openapi import get_validated_data
+from rororo.openapi import (
+    core_validators as core_validators_module,
+    get_openapi_operation,
+    get_validated_data,
+    json_response,
+    preload_openapi,
+)
+from rororo.openapi.data import ReadOnlyMapping
 from rororo.openapi.exceptions import (
     ConfigurationError,
+    InvalidCredentials,
     OperationError,
     validation_error_context,
     ValidationError,
 )
+from tests.rororo.executors import CountingExecutor
 
 
 ROOT_PATH = Path(__file__).parent
@@ -50,6 +64,14 @@ TEST_NESTED_OBJECT = {
     },
     "any_data": {"key1": "value1", "key2": "value2", "list": [1, 2, 3]},
 }
+JSON_HEADERS = {"Content-Type": "application/json"}
+TEXT_HEADERS = {"Content-Type": "text/plain"}
+TEST_POST = {
+    "title": "Post",
+    "slug": "post",
+    "content": "Post Content",
+    "published_at": "2020-04-01T12:00:00+02:00",
+}
 
 operations = OperationTableDef()
 invalid_operations = OperationTableDef()
@@ -112,7 +134,11 @@ async def retrieve_array_from_request_body(
 async def retrieve_empty(request: web.Request) -> web.Response:
     context = get_openapi_context(request)
     return web.Response(
-        status=204, headers={"X-API-Key": context.security.get("apiKey") or ""}
+        status=204,
+        headers={
+            "X-API-Key": context.security.get("apiKey") or "",
+            "X-Auth": context.auth.get("apiKey") or "",
+        },
     )
 
 
@@ -298,14 +324,20 @@ async def test_create_post_201(aiohttp_client, schema_path):
         ),
     ),
 )
+@pytest.mark.parametrize("validation_engine", ("default", "compiled"))
 async def test_create_post_422(
-    aiohttp_client, schema_path, invalid_data, expected_detail
+    aiohttp_client,
+    schema_path,
+    invalid_data,
+    expected_detail,
+    validation_engine,
 ):
     app = setup_openapi(
         web.Application(),
         schema_path,
         operations,
         server_url=URL("/dev-api"),
+        validation_engine=validation_engine,
     )
 
     client = await aiohttp_client(app)
@@ -314,6 +346,394 @@ async def test_create_post_422(
     assert (await response.json())["detail"] == expected_detail
 
 
+@pytest.mark.parametrize(
+    "frozen_data, expected_type",
+    (
+        ("none", dict),
+        ("proxy", ReadOnlyMapping),
+        ("pyrsistent", pyrsistent.PMap),
+    ),
+)
+async def test_frozen_data(aiohttp_client, frozen_data, expected_type):
+    types = {}
+
+    async def create_post(request: web.Request) -> web.Response:
+        context = get_openapi_context(request)
+        types["data"] = type(context.data)
+        types["query"] = type(context.parameters.query)
+        return web.json_response(
+            {
+                **context.data,
+                "id": 1,
+                "published_at": context.data["published_at"].isoformat(),
+            },
+            status=201,
+        )
+
+    custom_operations = OperationTableDef()
+    custom_operations.register("create-post")(create_post)
+
+    app = setup_openapi(
+        web.Application(),
+        OPENAPI_YAML_PATH,
+        custom_operations,
+        server_url="/api/",
+        frozen_data=frozen_data,
+    )
+    client = await aiohttp_client(app)
+
+    response = await client.post(
+        "/api/create-post",
+        json={
+            "title": "Post",
+            "slug": "post",
+            "content": "Post Content",
+            "published_at": "2020-04-01T12:00:00+02:00",
+        },
+    )
+    assert response.status == 201
+    assert types == {"data": expected_type, "query": expected_type}
+
+
+@pytest.fixture()
+def max_body_size_schema_path(tmp_path):
+    schema = yaml.safe_load(OPENAPI_YAML_PATH.read_bytes())
+    schema["paths"]["/create-post"]["post"]["x-rororo-max-body-size"] = 256
+    schema["paths"]["/upload-text"]["post"]["requestBody"]["content"][
+        "text/plain"
+    ]["schema"]["maxLength"] = 4
+
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(schema))
+    return path
+
+
+@pytest.mark.parametrize(
+    "url, data, headers, expected_status",
+    (
+        ("/api/create-post", json.dumps(TEST_POST), JSON_HEADERS, 201),
+        (
+            "/api/create-post",
+            json.dumps({**TEST_POST, "content": "Post Content" * 32}),
+            JSON_HEADERS,
+            413,
+        ),
+        ("/api/upload-text", "Text", TEXT_HEADERS, 201),
+        ("/api/upload-text", "Text" * 5, TEXT_HEADERS, 413),
+    ),
+)
+async def test_max_body_size(
+    aiohttp_client,
+    max_body_size_schema_path,
+    url,
+    data,
+    headers,
+    expected_status,
+):
+    app = setup_openapi(
+        web.Application(),
+        max_body_size_schema_path,
+        operations,
+        server_url="/api/",
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post(url, data=data, headers=headers)
+    assert response.status == expected_status
+
+
+@pytest.mark.parametrize(
+    "content_size, expected_status", ((32, 422), (512, 413))
+)
+async def test_max_body_size_chunked(
+    aiohttp_client, max_body_size_schema_path, content_size, expected_status
+):
+    async def iter_chunks():
+        for _ in range(content_size // 16):
+            yield b" " * 16
+
+    app = setup_openapi(
+        web.Application(),
+        max_body_size_schema_path,
+        operations,
+        server_url="/api/",
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post(
+        "/api/create-post", data=iter_chunks(), headers=JSON_HEADERS
+    )
+    assert response.status == expected_status
+
+
+@pytest.mark.parametrize(
+    "max_body_size, client_max_size, content_size, expected_status",
+    (
+        (0, 1024 * 1024, 16, 413),
+        (256, 64, 128, 413),
+        (256, 1024, 128, 422),
+        (256, 0, 512, 413),
+    ),
+)
+async def test_max_body_size_chunked_limits(
+    aiohttp_client,
+    tmp_path,
+    max_body_size,
+    client_max_size,
+    content_size,
+    expected_status,
+):
+    async def iter_chunks():
+        for _ in range(content_size // 16):
+            yield b" " * 16
+
+    schema = yaml.safe_load(OPENAPI_YAML_PATH.read_bytes())
+    schema["paths"]["/create-post"]["post"][
+        "x-rororo-max-body-size"
+    ] = max_body_size
+
+    schema_path = tmp_path / "openapi.json"
+    schema_path.write_text(json.dumps(schema))
+
+    app = setup_openapi(
+        web.Application(client_max_size=client_max_size),
+        schema_path,
+        operations,
+        server_url="/api/",
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post(
+        "/api/create-post", data=iter_chunks(), headers=JSON_HEADERS
+    )
+    assert response.status == expected_status
+
+
+async def test_max_body_size_path_item_ref(aiohttp_client, tmp_path):
+    schema = yaml.safe_load(OPENAPI_YAML_PATH.read_bytes())
+    path_item = schema["paths"]["/create-post"]
+    path_item["post"]["x-rororo-max-body-size"] = 16
+    schema["paths"]["/create-post"] = {"$ref": "#/x-path-items/create-post"}
+    schema["x-path-items"] = {"create-post": path_item}
+
+    schema_path = tmp_path / "openapi.json"
+    schema_path.write_text(json.dumps(schema))
+
+    app = setup_openapi(
+        web.Application(), schema_path, operations, server_url="/api/"
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post("/api/create-post", json=TEST_POST)
+    assert response.status == 413
+
+
+async def test_max_body_size_request_read(
+    aiohttp_client, max_body_size_schema_path
+):
+    bodies = []
+
+    async def create_post(request: web.Request) -> web.Response:
+        bodies.append(await request.read())
+        return web.json_response({}, status=201)
+
+    custom_operations = OperationTableDef()
+    custom_operations.register("create-post")(create_post)
+
+    app = setup_openapi(
+        web.Application(),
+        max_body_size_schema_path,
+        custom_operations,
+        server_url="/api/",
+        is_validate_response=False,
+    )
+
+    client = await aiohttp_client(app)
+    data = json.dumps(TEST_POST).encode("utf-8")
+    response = await client.post(
+        "/api/create-post", data=data, headers=JSON_HEADERS
+    )
+    assert response.status == 201
+
+    # Request body, read by OpenAPI middleware, is still available for the
+    # handler
+    assert bodies == [data]
+
+
+@pytest.mark.parametrize("value", (-1, 1.5, "1024", True))
+def test_max_body_size_invalid(tmp_path, value):
+    schema = yaml.safe_load(OPENAPI_YAML_PATH.read_bytes())
+    schema["paths"]["/create-post"]["post"]["x-rororo-max-body-size"] = value
+
+    schema_path = tmp_path / "openapi.json"
+    schema_path.write_text(json.dumps(schema))
+
+    with pytest.raises(ConfigurationError):
+        setup_openapi(
+            web.Application(), schema_path, operations, server_url="/api/"
+        )
+
+
+@pytest.mark.parametrize(
+    "data, threshold, expected_status, expected_calls",
+    (
+        (TEST_POST, 0, 201, 2),
+        (TEST_POST, 1024 * 1024, 201, 0),
+        ({**TEST_POST, "title": None}, 0, 422, 1),
+    ),
+)
+async def test_validation_executor(
+    aiohttp_client, data, threshold, expected_status, expected_calls
+):
+    with CountingExecutor() as executor:
+        app = setup_openapi(
+            web.Application(),
+            OPENAPI_YAML_PATH,
+            operations,
+            server_url="/api/",
+            validation_executor=executor,
+            validation_executor_threshold=threshold,
+        )
+        client = await aiohttp_client(app)
+
+        response = await client.post("/api/create-post", json=data)
+        assert response.status == expected_status
+        assert executor.calls == expected_calls
+
+
+@pytest.mark.parametrize(
+    "threshold, expected_calls", ((16, 1), (1024 * 1024, 0))
+)
+async def test_validation_executor_json_response(
+    aiohttp_client, threshold, expected_calls
+):
+    json_operations = OperationTableDef()
+
+    @json_operations.register("hello_world")
+    async def hello_world(request: web.Request) -> web.Response:
+        return json_response(
+            {"message": "Hello, world!", "email": "world@example.com"}
+        )
+
+    with CountingExecutor() as executor:
+        app = setup_openapi(
+            web.Application(),
+            OPENAPI_YAML_PATH,
+            json_operations,
+            server_url="/api/",
+            is_validate_response=True,
+            validation_executor=executor,
+            validation_executor_threshold=threshold,
+        )
+        client = await aiohttp_client(app)
+
+        response = await client.get("/api/hello")
+        assert response.status == 200
+        assert executor.calls == expected_calls
+
+
+def test_validation_executor_process_pool():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ConfigurationError):
+            setup_openapi(
+                web.Application(),
+                OPENAPI_YAML_PATH,
+                operations,
+                server_url="/api/",
+                validation_executor=executor,
+            )
+
+
+async def test_default_json_loads_does_not_decode_bytes(
+    monkeypatch, aiohttp_client
+):
+    def core_json_loads(value):
+        raise AssertionError("openapi-core JSON loads should not be used")
+
+    monkeypatch.setattr(
+        MediaTypeDeserializersFactory,
+        "MEDIA_TYPE_DESERIALIZERS",
+        {"application/json": core_json_loads},
+    )
+
+    loaded_types = []
+
+    def json_loads(value):
+        loaded_types.append(type(value))
+        return json.loads(value)
+
+    monkeypatch.setattr(
+        core_validators_module, "json", SimpleNamespace(loads=json_loads)
+    )
+
+    app = setup_openapi(
+        web.Application(), OPENAPI_YAML_PATH, operations, server_url="/api/"
+    )
+    client = await aiohttp_client(app)
+
+    response = await client.post(
+        "/api/create-post",
+        json={
+            "title": "Post",
+            "slug": "post",
+            "content": "Post Content",
+            "published_at": "2020-04-01T12:00:00+02:00",
+        },
+    )
+    assert response.status == 201
+    assert loaded_types == [bytes, bytes]
+
+
+async def test_custom_json_loads_and_dumps(aiohttp_client):
+    calls = {"dumps": 0, "loads": 0}
+
+    def json_dumps(data):
+        calls["dumps"] += 1
+        return json.dumps(data).encode("utf-8")
+
+    def json_loads(value):
+        calls["loads"] += 1
+        return json.loads(value)
+
+    app = setup_openapi(
+        web.Application(),
+        OPENAPI_YAML_PATH,
+        operations,
+        server_url="/api/",
+        json_loads=json_loads,
+        json_dumps=json_dumps,
+    )
+    client = await aiohttp_client(app)
+
+    # Request body & response body are loaded with custom function
+    response = await client.post(
+        "/api/create-post",
+        json={
+            "title": "Post",
+            "slug": "post",
+            "content": "Post Content",
+            "published_at": "2020-04-01T12:00:00+02:00",
+        },
+    )
+    assert response.status == 201
+    assert calls == {"dumps": 0, "loads": 2}
+
+    # Error response is dumped with custom function
+    response = await client.post("/api/create-post", json={})
+    assert response.status == 422
+    assert response.content_type == "application/json"
+    assert (await response.json())["detail"]
+    assert calls == {"dumps": 1, "loads": 3}
+
+    # OpenAPI schema is dumped with custom function as well
+    response = await client.get(
+        "/api/openapi.json", headers={"Accept-Encoding": "identity"}
+    )
+    assert response.status == 200
+    assert await response.json() == get_openapi_schema(app)
+    assert calls == {"dumps": 2, "loads": 3}
+
+
 @pytest.mark.parametrize(
     "schema_path, schema_loader",
     (
@@ -384,6 +804,26 @@ async def test_invalid_parameter_value(aiohttp_client, schema_path):
     }
 
 
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+def test_get_openapi_operation(schema_path):
+    app = setup_openapi(
+        web.Application(), schema_path, operations, server_url="/api/"
+    )
+
+    operation = get_openapi_operation(app, "retrieve_post")
+    assert operation.operation_id == "retrieve_post"
+    assert operation.http_method == "get"
+    assert operation.path_name == "/posts/{post_id}"
+
+    with pytest.raises(OperationError):
+        get_openapi_operation(app, "does-not-exist")
+
+
+def test_get_openapi_operation_no_spec():
+    with pytest.raises(ConfigurationError):
+        get_openapi_operation(web.Application(), "hello_world")
+
+
 def test_get_openapi_schema_no_schema():
     with pytest.raises(ConfigurationError):
         get_openapi_schema(web.Application())
@@ -495,6 +935,44 @@ async def test_openapi_schema_handler(
     assert response.status == expected_status
 
 
+@pytest.mark.parametrize(
+    "url, accept_encoding, expected_encoding",
+    (
+        ("/api/openapi.json", "identity", None),
+        ("/api/openapi.json", "gzip, deflate", "gzip"),
+        ("/api/openapi.yaml", "gzip;q=0, deflate", None),
+        ("/api/openapi.yaml", "*", "gzip"),
+    ),
+)
+async def test_openapi_schema_handler_cache(
+    aiohttp_client, url, accept_encoding, expected_encoding
+):
+    app = web.Application()
+    setup_openapi(app, OPENAPI_YAML_PATH, operations, server_url="/api")
+
+    client = await aiohttp_client(app)
+    headers = {"Accept-Encoding": accept_encoding}
+
+    response = await client.get(url, headers=headers)
+    assert response.status == 200
+    assert response.headers.get("Content-Encoding") == expected_encoding
+    assert yaml.safe_load(await response.read()) == get_openapi_schema(app)
+
+    etag = response.headers["ETag"]
+    assert etag.startswith('"')
+
+    response = await client.get(
+        url, headers={**headers, "If-None-Match": f'W/"fake", {etag}'}
+    )
+    assert response.status == 304
+    assert response.headers["ETag"] == etag
+
+    response = await client.get(
+        url, headers={**headers, "If-None-Match": '"fake"'}
+    )
+    assert response.status == 200
+
+
 @pytest.mark.parametrize(
     "schema_path, headers, expected",
     (
@@ -518,9 +996,74 @@ async def test_optional_security_scheme(
 
 
 @pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
-async def test_request_body_nested_object(aiohttp_client, schema_path):
+async def test_optional_security_scheme_authenticators(
+    aiohttp_client, schema_path
+):
+    calls = []
+
+    async def authenticate(scheme_name, credential):
+        calls.append((scheme_name, credential))
+        if credential == "invalid":
+            raise InvalidCredentials()
+        return f"user:{credential}"
+
     app = setup_openapi(
-        web.Application(), schema_path, operations, server_url="/api/"
+        web.Application(),
+        schema_path,
+        operations,
+        server_url="/api/",
+        authenticators={"apiKey": authenticate},
+    )
+
+    client = await aiohttp_client(app)
+    for _ in range(3):
+        response = await client.get("/api/empty", headers={"X-API-Key": "key"})
+        assert response.status == 204
+        assert response.headers["X-Auth"] == "user:key"
+
+    response = await client.get("/api/empty")
+    assert response.status == 204
+    assert response.headers["X-Auth"] == ""
+
+    for _ in range(2):
+        response = await client.get(
+            "/api/empty", headers={"X-API-Key": "invalid"}
+        )
+        assert response.status == 403
+
+    assert calls == [
+        ("apiKey", "key"),
+        ("apiKey", "invalid"),
+        ("apiKey", "invalid"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "authenticators",
+    ({"doesNotExist": lambda scheme_name, credential: None}, {"apiKey": 1}),
+)
+def test_optional_security_scheme_authenticators_invalid(authenticators):
+    with pytest.raises(ConfigurationError):
+        setup_openapi(
+            web.Application(),
+            OPENAPI_YAML_PATH,
+            operations,
+            server_url="/api/",
+            authenticators=authenticators,
+        )
+
+
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+@pytest.mark.parametrize("validation_engine", ("default", "compiled"))
+async def test_request_body_nested_object(
+    aiohttp_client, schema_path, validation_engine
+):
+    app = setup_openapi(
+        web.Application(),
+        schema_path,
+        operations,
+        server_url="/api/",
+        validation_engine=validation_engine,
     )
 
     client = await aiohttp_client(app)
@@ -592,6 +1135,61 @@ async def test_setup_openapi_schema_and_path_ignore_invalid_schema_path(
     )
 
 
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+async def test_setup_openapi_preloaded(aiohttp_client, schema_path):
+    preloaded = preload_openapi(schema_path)
+    apps = [
+        setup_openapi(
+            web.Application(),
+            operations,
+            preloaded=preloaded,
+            server_url="/api/",
+        )
+        for _ in range(2)
+    ]
+
+    for app in apps:
+        assert get_openapi_schema(app) is preloaded.schema
+        assert get_openapi_spec(app) is preloaded.spec
+        assert (
+            get_openapi_operation(app, "hello_world")
+            is preloaded.operations["hello_world"]
+        )
+
+        client = await aiohttp_client(app)
+        response = await client.get("/api/hello")
+        assert response.status == 200
+        assert await response.json() == {
+            "message": "Hello, world!",
+            "email": "world@example.com",
+        }
+
+
+def test_setup_openapi_preloaded_and_schema():
+    preloaded = preload_openapi(OPENAPI_YAML_PATH)
+    with pytest.raises(ConfigurationError):
+        setup_openapi(
+            web.Application(),
+            operations,
+            schema=preloaded.schema,
+            spec=preloaded.spec,
+            preloaded=preloaded,
+        )
+
+
+@pytest.mark.parametrize(
+    "schema_path",
+    (
+        ROOT_PATH / "does-not-exist.yaml",
+        INVALID_OPENAPI_JSON_PATH,
+        INVALID_OPENAPI_YAML_PATH,
+    ),
+)
+def test_preload_openapi_invalid_schema_path(schema_path):
+    with pytest.raises(ConfigurationError):
+        preload_openapi(schema_path)
+
+
 @pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
 def test_setup_openapi_invalid_operation(schema_path):
     with pytest.raises(OperationError):
@@ -688,6 +1286,22 @@ async def test_upload_image(aiohttp_client, schema_path):
     assert await response.read() == blank_png
 
 
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+async def test_upload_image_utf8_content(aiohttp_client, schema_path):
+    app = setup_openapi(
+        web.Application(), schema_path, operations, server_url="/api"
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post(
+        "/api/upload-image",
+        data=b"GIF89a",
+        headers={"Content-Type": "image/gif"},
+    )
+    assert response.status == 201
+    assert await response.read() == b"GIF89a"
+
+
 @pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
 async def test_upload_text(aiohttp_client, schema_path):
     text = "Hello, world! And other things..."
@@ -767,6 +1381,135 @@ async def test_validate_response(
     assert response.status == expected_status
 
 
+@pytest.mark.parametrize(
+    "is_validate_response, expected_status",
+    (
+        (0, 200),
+        (0.0, 200),
+        (1, 422),
+        (1.0, 422),
+        (lambda operation, request: False, 200),
+        (
+            lambda operation, request: (
+                operation.operation_id == "retrieve_invalid_response"
+                and request.path == "/api/invalid-response"
+            ),
+            422,
+        ),
+    ),
+)
+async def test_validate_response_policy(
+    aiohttp_client, is_validate_response, expected_status
+):
+    app = setup_openapi(
+        web.Application(),
+        OPENAPI_YAML_PATH,
+        operations,
+        server_url="/api",
+        is_validate_response=is_validate_response,
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/invalid-response")
+    assert response.status == expected_status
+
+
+@pytest.mark.parametrize(
+    "is_validate_response, extension_value, expected_status",
+    (
+        (False, True, 422),
+        (False, 1, 422),
+        (True, False, 200),
+        (True, 0.0, 200),
+        (lambda operation, request: True, False, 200),
+    ),
+)
+async def test_validate_response_extension(
+    aiohttp_client,
+    tmp_path,
+    is_validate_response,
+    extension_value,
+    expected_status,
+):
+    schema = yaml.safe_load(OPENAPI_YAML_PATH.read_bytes())
+    schema["paths"]["/invalid-response"]["get"][
+        "x-rororo-validate-response"
+    ] = extension_value
+
+    schema_path = tmp_path / "openapi.json"
+    schema_path.write_text(json.dumps(schema))
+
+    app = setup_openapi(
+        web.Application(),
+        schema_path,
+        operations,
+        server_url="/api",
+        is_validate_response=is_validate_response,
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/invalid-response")
+    assert response.status == expected_status
+
+
+async def test_validate_response_extension_path_item_ref(
+    aiohttp_client, tmp_path
+):
+    schema = yaml.safe_load(OPENAPI_YAML_PATH.read_bytes())
+    path_item = schema["paths"]["/invalid-response"]
+    path_item["get"]["x-rororo-validate-response"] = False
+    schema["paths"]["/invalid-response"] = {
+        "$ref": "#/x-path-items/invalid-response"
+    }
+    schema["x-path-items"] = {"invalid-response": path_item}
+
+    schema_path = tmp_path / "openapi.json"
+    schema_path.write_text(json.dumps(schema))
+
+    app = setup_openapi(
+        web.Application(),
+        schema_path,
+        operations,
+        server_url="/api",
+        is_validate_response=True,
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/invalid-response")
+    assert response.status == 200
+
+
+@pytest.mark.parametrize("is_validate_response", (-0.5, 1.5, "yes", None))
+def test_validate_response_policy_invalid(is_validate_response):
+    with pytest.raises(ConfigurationError):
+        setup_openapi(
+            web.Application(),
+            OPENAPI_YAML_PATH,
+            operations,
+            server_url="/api",
+            is_validate_response=is_validate_response,
+        )
+
+
+@pytest.mark.parametrize("extension_value", (2, "yes", None))
+def test_validate_response_extension_invalid(tmp_path, extension_value):
+    schema = yaml.safe_load(OPENAPI_YAML_PATH.read_bytes())
+    schema["paths"]["/invalid-response"]["get"][
+        "x-rororo-validate-response"
+    ] = extension_value
+
+    schema_path = tmp_path / "openapi.json"
+    schema_path.write_text(json.dumps(schema))
+
+    with pytest.raises(ConfigurationError):
+        setup_openapi(
+            web.Application(),
+            schema_path,
+            operations,
+            server_url="/api",
+        )
+
+
 @pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
 async def test_validate_response_error(aiohttp_client, schema_path):
     app = setup_openapi(
@@ -788,3 +1531,92 @@ async def test_validate_response_error(aiohttp_client, schema_path):
             {"loc": ["response", "any_data"], "message": "Field required"},
         ]
     }
+
+
+@pytest.mark.parametrize("is_validate_response", (False, True))
+async def test_json_response(aiohttp_client, is_validate_response):
+    calls = {"dumps": 0, "loads": 0}
+
+    def json_dumps(data):
+        calls["dumps"] += 1
+        return json.dumps(data)
+
+    def json_loads(value):
+        calls["loads"] += 1
+        return json.loads(value)
+
+    json_operations = OperationTableDef()
+
+    @json_operations.register("hello_world")
+    async def hello_world(request: web.Request) -> web.Response:
+        return json_response(
+            {"message": "Hello, world!", "email": "world@example.com"}
+        )
+
+    app = setup_openapi(
+        web.Application(),
+        OPENAPI_YAML_PATH,
+        json_operations,
+        server_url="/api/",
+        is_validate_response=is_validate_response,
+        json_loads=json_loads,
+        json_dumps=json_dumps,
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/hello")
+    assert response.status == 200
+    assert response.content_type == "application/json"
+    assert await response.json() == {
+        "message": "Hello, world!",
+        "email": "world@example.com",
+    }
+
+    # Response data is validated as is and dumped to JSON only once
+    assert calls == {"dumps": 1, "loads": 0}
+
+
+async def test_json_response_validate_error(aiohttp_client):
+    json_operations = OperationTableDef()
+
+    @json_operations.register("retrieve_invalid_response")
+    async def retrieve_invalid_response(
+        request: web.Request,
+    ) -> web.Response:
+        return json_response({"uid": "not-uuid", "type": "object"})
+
+    app = setup_openapi(
+        web.Application(),
+        OPENAPI_YAML_PATH,
+        json_operations,
+        server_url="/api",
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/invalid-response")
+    assert response.status == 422
+    assert await response.json() == {
+        "detail": [
+            {
+                "loc": ["response", "uid"],
+                "message": "'not-uuid' is not a 'uuid'",
+            },
+            {"loc": ["response", "data"], "message": "Field required"},
+            {"loc": ["response", "any_data"], "message": "Field required"},
+        ]
+    }
+
+
+async def test_json_response_not_openapi_route(aiohttp_client):
+    async def handler(request: web.Request) -> web.Response:
+        return json_response({"ok": True}, status=201)
+
+    app = setup_openapi(
+        web.Application(), OPENAPI_YAML_PATH, operations, server_url="/api"
+    )
+    app.router.add_get("/not-openapi", handler)
+
+    client = await aiohttp_client(app)
+    response = await client.get("/not-openapi")
+    assert response.status == 201
+    assert await response.json() == {"ok": True}
@@ -0,0 +1,239 @@
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from aiohttp import web
+from openapi_core.shortcuts import create_spec
+
+from rororo import OperationTableDef, setup_openapi
+from rororo.__main__ import main
+from rororo.openapi.bundle import bundle_openapi_schema
+from rororo.openapi.exceptions import ConfigurationError
+
+
+ROOT_PATH = Path(__file__).parent
+
+OPENAPI_JSON_PATH = ROOT_PATH / "openapi.json"
+OPENAPI_YAML_PATH = ROOT_PATH / "openapi.yaml"
+
+MULTI_FILE_SCHEMA = {
+    "openapi": "3.0.3",
+    "info": {"title": "Multi-file schema", "version": "1.0.0"},
+    "paths": {
+        "/nodes": {
+            "get": {
+                "operationId": "list_nodes",
+                "responses": {
+                    "200": {
+                        "description": "List of nodes",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "$ref": (
+                                        "components.yaml#/components/schemas/"
+                                        "Nodes"
+                                    )
+                                }
+                            }
+                        },
+                    }
+                },
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "NodeID": {"type": "integer", "minimum": 1},
+            "Node": {
+                "type": "object",
+                "description": "Node of a tree",
+                "properties": {
+                    "description": {"type": "string"},
+                    "parent": {"$ref": "#/components/schemas/NodeID"},
+                },
+            },
+        }
+    },
+}
+
+MULTI_FILE_COMPONENTS = {
+    "components": {
+        "schemas": {
+            "Nodes": {
+                "type": "array",
+                "items": {"$ref": "openapi.yaml#/components/schemas/Node"},
+            }
+        }
+    }
+}
+
+operations = OperationTableDef()
+
+
+@operations.register
+async def hello_world(request: web.Request) -> web.Response:
+    return web.json_response(
+        {"message": "Hello, world!", "email": "world@example.com"}
+    )
+
+
+def iter_keys(value):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield key
+            yield from iter_keys(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_keys(item)
+
+
+@pytest.fixture()
+def multi_file_schema_path(tmp_path):
+    (tmp_path / "components.yaml").write_text(yaml.dump(MULTI_FILE_COMPONENTS))
+    path = tmp_path / "openapi.yaml"
+    path.write_text(yaml.dump(MULTI_FILE_SCHEMA))
+    return path
+
+
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+def test_bundle_openapi_schema(schema_path):
+    schema = bundle_openapi_schema(schema_path)
+    create_spec(schema)
+
+    keys = set(iter_keys(schema))
+    assert "$ref" not in keys
+    assert "example" not in keys
+
+    for path_data in schema["paths"].values():
+        for operation_data in path_data.values():
+            assert "description" not in operation_data
+            for response_data in operation_data["responses"].values():
+                assert response_data["description"] == ""
+
+
+def test_bundle_openapi_schema_keep_docs():
+    schema = bundle_openapi_schema(OPENAPI_YAML_PATH, strip_docs=False)
+    assert "description" in set(iter_keys(schema))
+    assert "$ref" not in set(iter_keys(schema))
+
+
+def test_bundle_openapi_schema_multi_file(multi_file_schema_path):
+    schema = bundle_openapi_schema(multi_file_schema_path)
+    create_spec(schema)
+
+    node_schema = schema["components"]["schemas"]["Node"]
+    assert "description" not in node_schema
+    assert node_schema["properties"]["description"] == {"type": "string"}
+
+    response_schema = schema["paths"]["/nodes"]["get"]["responses"]["200"][
+        "content"
+    ]["application/json"]["schema"]
+    assert response_schema["type"] == "array"
+    assert response_schema["items"]["properties"]["parent"] == {
+        "type": "integer",
+        "minimum": 1,
+    }
+
+
+def test_bundle_openapi_schema_recursive_ref(tmp_path):
+    schema = {
+        **MULTI_FILE_SCHEMA,
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Node": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/Node"},
+                }
+            }
+        },
+    }
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(schema))
+
+    node_schema = bundle_openapi_schema(path)["components"]["schemas"]["Node"]
+    assert node_schema["items"] == {
+        "type": "array",
+        "items": {"$ref": "#/components/schemas/Node"},
+    }
+
+
+def test_bundle_openapi_schema_recursive_ref_to_other_file(tmp_path):
+    (tmp_path / "components.yaml").write_text(
+        yaml.dump(
+            {
+                "Node": {
+                    "type": "array",
+                    "items": {"$ref": "#/Node"},
+                }
+            }
+        )
+    )
+    schema = {
+        **MULTI_FILE_SCHEMA,
+        "paths": {},
+        "components": {"schemas": {"Node": {"$ref": "components.yaml#/Node"}}},
+    }
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(schema))
+
+    with pytest.raises(ConfigurationError):
+        bundle_openapi_schema(path)
+
+
+def test_bundle_openapi_schema_unresolvable_ref(multi_file_schema_path):
+    (multi_file_schema_path.parent / "components.yaml").unlink()
+    with pytest.raises(ConfigurationError):
+        bundle_openapi_schema(multi_file_schema_path)
+
+
+async def test_bundled_schema(aiohttp_client, tmp_path):
+    output = tmp_path / "openapi.bundle.json"
+    assert main(["bundle", str(OPENAPI_YAML_PATH), "-o", str(output)]) == 0
+    assert json.loads(output.read_bytes()) == bundle_openapi_schema(
+        OPENAPI_YAML_PATH
+    )
+
+    app = setup_openapi(
+        web.Application(), output, operations, server_url="/api/"
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/hello")
+    assert response.status == 200
+    assert await response.json() == {
+        "message": "Hello, world!",
+        "email": "world@example.com",
+    }
+
+
+def test_main_bundle_does_not_exist(tmp_path, capsys):
+    output = tmp_path / "openapi.bundle.json"
+    assert (
+        main(["bundle", str(tmp_path / "openapi.yaml"), "-o", str(output)])
+        == 1
+    )
+    assert "ERROR:" in capsys.readouterr().err
+    assert not output.exists()
+
+
+@pytest.mark.parametrize(
+    "file_name, content",
+    (
+        ("openapi.json", '{"openapi": "3.'),
+        ("openapi.yaml", "openapi: [3.0.3\n"),
+        ("openapi.json", b"\xff\xfe"),
+    ),
+)
+def test_main_bundle_invalid_schema(tmp_path, capsys, file_name, content):
+    schema_path = tmp_path / file_name
+    if isinstance(content, bytes):
+        schema_path.write_bytes(content)
+    else:
+        schema_path.write_text(content)
+
+    output = tmp_path / "openapi.bundle.json"
+    assert main(["bundle", str(schema_path), "-o", str(output)]) == 1
+    assert not output.exists()
+    assert "ERROR: Unable to parse OpenAPI schema" in capsys.readouterr().err
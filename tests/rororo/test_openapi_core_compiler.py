@@ -0,0 +1,287 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from openapi_core.shortcuts import create_spec
+from openapi_core.unmarshalling.schemas.enums import UnmarshalContext
+from openapi_core.unmarshalling.schemas.exceptions import UnmarshalError
+from openapi_schema_validator import OAS30Validator
+
+from rororo.openapi.core_compiler import (
+    CompiledUnmarshaller,
+    SchemaCompiler,
+    SchemaNotCompilable,
+)
+from rororo.openapi.core_validators import (
+    CompiledSchemaUnmarshallersFactory,
+    get_custom_formatters,
+    SchemaUnmarshallersFactory,
+)
+from rororo.openapi.exceptions import ValidationError
+
+
+SCHEMAS = {
+    "Email": {"type": "string", "format": "email"},
+    "NonEmptyString": {"type": "string", "minLength": 1},
+    "Post": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "minimum": 1, "readOnly": True},
+            "title": {"$ref": "#/components/schemas/NonEmptyString"},
+            "tags": {
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/NonEmptyString"},
+                "uniqueItems": True,
+                "maxItems": 3,
+            },
+            "published_at": {
+                "type": "string",
+                "format": "date-time",
+                "nullable": True,
+            },
+            "author": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/User"},
+                    {"type": "object", "required": ["email"]},
+                ]
+            },
+            "rating": {
+                "oneOf": [
+                    {"type": "integer", "enum": [1, 2, 3]},
+                    {"type": "string", "pattern": "^[a-c]$"},
+                ]
+            },
+        },
+        "required": ["id", "title"],
+        "additionalProperties": False,
+    },
+    "User": {
+        "type": "object",
+        "properties": {
+            "email": {"$ref": "#/components/schemas/Email"},
+            "name": {"type": "string", "maxLength": 8, "default": "anon"},
+        },
+    },
+}
+
+POST = {"$ref": "#/components/schemas/Post"}
+SCHEMA = {
+    "openapi": "3.0.3",
+    "info": {"title": "Test API", "version": "1.0.0"},
+    "paths": {
+        "/posts": {
+            "post": {
+                "operationId": "create_post",
+                "requestBody": {
+                    "content": {"application/json": {"schema": POST}}
+                },
+                "responses": {
+                    "201": {
+                        "description": "Post created",
+                        "content": {"application/json": {"schema": POST}},
+                    }
+                },
+            }
+        }
+    },
+    "components": {"schemas": SCHEMAS},
+}
+VALID_POST = {
+    "title": "Post",
+    "tags": ["one", "two"],
+    "published_at": None,
+    "author": {"email": "email@domain.com"},
+    "rating": "a",
+}
+INVALID_POSTS = (
+    None,
+    [],
+    {},
+    {**VALID_POST, "title": ""},
+    {**VALID_POST, "title": 1},
+    {**VALID_POST, "tags": ["one", "one"]},
+    {**VALID_POST, "tags": ["1", "2", "3", "4"]},
+    {**VALID_POST, "published_at": "yesterday"},
+    {**VALID_POST, "author": {}},
+    {**VALID_POST, "author": {"email": "not-email"}},
+    {**VALID_POST, "author": {"email": "email@domain.com", "name": "x" * 9}},
+    {**VALID_POST, "rating": 4},
+    {**VALID_POST, "rating": "d"},
+    {**VALID_POST, "id": 1},
+    {**VALID_POST, "extra": True},
+)
+
+
+@pytest.fixture(scope="module")
+def spec():
+    return create_spec(SCHEMA)
+
+
+@pytest.fixture
+def switch_threads_often():
+    # Switch threads as often as possible to run compiling concurrently
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(switch_interval)
+
+
+def create_unmarshallers(spec, context):
+    schema = (
+        spec.paths["/posts"]
+        .operations["post"]
+        .request_body.content["application/json"]
+        .schema
+    )
+    return [
+        factory_class(
+            spec._resolver, get_custom_formatters(), context=context
+        ).create(schema)
+        for factory_class in (
+            SchemaUnmarshallersFactory,
+            CompiledSchemaUnmarshallersFactory,
+        )
+    ]
+
+
+def unmarshal(unmarshaller, value):
+    try:
+        return unmarshaller(value)
+    except UnmarshalError as err:
+        return ValidationError.from_request_errors([err]).errors
+
+
+@pytest.mark.parametrize(
+    "context", (UnmarshalContext.REQUEST, UnmarshalContext.RESPONSE)
+)
+@pytest.mark.parametrize("value", (VALID_POST, *INVALID_POSTS))
+def test_compiled_unmarshaller(spec, context, value):
+    default, compiled = create_unmarshallers(spec, context)
+    assert isinstance(compiled, CompiledUnmarshaller)
+    assert unmarshal(compiled, value) == unmarshal(default, value)
+
+
+def test_compiled_unmarshaller_defaults(spec):
+    _, compiled = create_unmarshallers(spec, UnmarshalContext.REQUEST)
+    assert compiled(VALID_POST)["author"] == {
+        "email": "email@domain.com",
+        "name": "anon",
+    }
+
+
+def test_compiled_unmarshaller_concurrent(spec, switch_threads_often):
+    default, _ = create_unmarshallers(spec, UnmarshalContext.REQUEST)
+    expected = unmarshal(default, VALID_POST)
+    schema = (
+        spec.paths["/posts"]
+        .operations["post"]
+        .request_body.content["application/json"]
+        .schema
+    )
+
+    for _ in range(50):
+        # Compile same schema with fresh factory in all threads at once
+        factory = CompiledSchemaUnmarshallersFactory(
+            spec._resolver,
+            get_custom_formatters(),
+            context=UnmarshalContext.REQUEST,
+        )
+        barrier = threading.Barrier(4)
+
+        def validate(value):
+            barrier.wait()
+            return unmarshal(factory.create(schema), value)
+
+        with ThreadPoolExecutor(4) as executor:
+            assert (
+                list(executor.map(validate, [VALID_POST] * 4))
+                == [expected] * 4
+            )
+
+
+def test_schema_compiler_concurrent(spec, switch_threads_often):
+    for _ in range(50):
+        compiler = SchemaCompiler(
+            spec._resolver, SchemaUnmarshallersFactory()._get_format_checker()
+        )
+        schema = {
+            "type": "object",
+            "properties": {
+                f"prop{idx}": {"type": "string", "minLength": 1}
+                for idx in range(32)
+            },
+        }
+        barrier = threading.Barrier(4)
+
+        def compile_and_validate(value):
+            barrier.wait()
+            return compiler.compile(schema)(value)
+
+        with ThreadPoolExecutor(4) as executor:
+            assert (
+                list(executor.map(compile_and_validate, [{"prop0": "a"}] * 4))
+                == [True] * 4
+            )
+
+
+@pytest.mark.parametrize(
+    "schema, value",
+    (
+        ({"type": "integer", "multipleOf": 2}, 4),
+        ({"type": "integer", "multipleOf": 2}, 3),
+        ({"type": "number", "maximum": 1, "exclusiveMaximum": True}, 1),
+        ({"type": "number", "minimum": 1, "exclusiveMinimum": True}, 1.5),
+        ({"type": "integer"}, True),
+        ({"type": "integer", "nullable": True}, None),
+        ({"type": "string", "format": "uuid"}, "not-uuid"),
+        ({"type": "object", "minProperties": 1}, {}),
+        ({"type": "object", "maxProperties": 1}, {"a": 1, "b": 2}),
+        ({"type": "object", "additionalProperties": {"type": "integer"}}, {}),
+        (
+            {"type": "object", "additionalProperties": {"type": "integer"}},
+            {"a": "b"},
+        ),
+        ({"anyOf": [{"type": "integer"}, {"type": "string"}]}, []),
+        ({"not": {"type": "string"}}, "string"),
+        ({"type": "string", "enum": ["a", "b"]}, "c"),
+        ({"type": "string", "writeOnly": True}, "secret"),
+    ),
+)
+def test_schema_compiler(spec, schema, value):
+    for context, flag in (
+        (UnmarshalContext.REQUEST, "write"),
+        (UnmarshalContext.RESPONSE, "read"),
+    ):
+        compiler = SchemaCompiler(
+            spec._resolver,
+            SchemaUnmarshallersFactory()._get_format_checker(),
+            context=context,
+        )
+        validator = OAS30Validator(
+            schema,
+            resolver=spec._resolver,
+            format_checker=compiler.namespace["check_format"].__self__,
+            **{flag: True},
+        )
+        assert compiler.compile(schema)(value) is validator.is_valid(value)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    (
+        {"type": ["string", "integer"]},
+        {"type": "object", "patternProperties": {"^x-": {}}},
+        {
+            "oneOf": [{"type": "string"}],
+            "discriminator": {"propertyName": "type"},
+        },
+        {"type": "array", "items": [{"type": "string"}]},
+    ),
+)
+def test_schema_not_compilable(spec, schema):
+    compiler = SchemaCompiler(
+        spec._resolver, SchemaUnmarshallersFactory()._get_format_checker()
+    )
+    with pytest.raises(SchemaNotCompilable):
+        compiler.compile(schema)
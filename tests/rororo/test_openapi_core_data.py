@@ -1,12 +1,20 @@
+import json
 from pathlib import Path
 
 import pytest
 from aiohttp import web
 from aiohttp.test_utils import make_mocked_request
-from pyrsistent import pmap
 
-from rororo.openapi.constants import HANDLER_OPENAPI_MAPPING_KEY
-from rororo.openapi.core_data import find_core_operation
+from rororo.openapi import get_openapi_operation, get_openapi_spec
+from rororo.openapi.core_data import (
+    get_body_size,
+    get_parameter_names,
+    is_text_request_body,
+    ParameterNames,
+    RequestBodyStream,
+    ResponseData,
+    to_core_request_parameters,
+)
 from rororo.openapi.openapi import setup_openapi
 
 
@@ -14,44 +22,110 @@ ROOT_PATH = Path(__file__).parent
 
 
 @pytest.mark.parametrize(
-    "path", (ROOT_PATH / "openapi.json", ROOT_PATH / "openapi.yaml")
+    "body, limit, expected",
+    (
+        (b"[1, 2]", 1024, 6),
+        ("[1, 2]", 1024, 6),
+        (None, 1024, None),
+        (RequestBodyStream(None), 1024, None),
+        (ResponseData([]), 1024, 2),
+        (ResponseData({"key": "value"}), 1024, 16),
+        (ResponseData([None, True, 1.5]), 1024, 17),
+    ),
 )
-def test_find_core_operation_missing_operation_id(path):
-    request = make_mocked_request(
-        "GET",
-        "/api/hello",
-        app=setup_openapi(web.Application(), path, server_url="/api/"),
-    )
+def test_get_body_size(body, limit, expected):
+    assert get_body_size(body, limit) == expected
 
-    async def broken_handler(request: web.Request) -> web.Response:
-        return web.json_response(False)
 
-    setattr(
-        broken_handler,
-        HANDLER_OPENAPI_MAPPING_KEY,
-        pmap({"POST": "broken_handler"}),
-    )
+def test_get_body_size_limit():
+    data = ResponseData([{"key": "value" * 1024}] * 1024 * 1024)
+    size = get_body_size(data, 1024)
+    assert 1024 <= size < len(json.dumps(data.value))
 
-    assert find_core_operation(request, broken_handler) is None
+
+@pytest.mark.parametrize(
+    "operation_id, extra_items, expected",
+    (
+        ("hello_world", (), ParameterNames(query=("name", "email"))),
+        ("retrieve_post", (), ParameterNames()),
+        (
+            "retrieve_empty",
+            (("header", "X-API-Key"), ("query", "name"), ("path", "id")),
+            ParameterNames(query=("name",), header=("X-API-Key",)),
+        ),
+    ),
+)
+def test_get_parameter_names(operation_id, extra_items, expected):
+    app = setup_openapi(
+        web.Application(), ROOT_PATH / "openapi.yaml", server_url="/api/"
+    )
+    assert (
+        get_parameter_names(
+            get_openapi_spec(app),
+            get_openapi_operation(app, operation_id),
+            extra_items,
+        )
+        == expected
+    )
 
 
 @pytest.mark.parametrize(
-    "path", (ROOT_PATH / "openapi.json", ROOT_PATH / "openapi.yaml")
+    "operation_id, mimetype, expected",
+    (
+        ("create-post", "application/json", False),
+        ("hello_world", "application/json", False),
+        ("upload_image", "image/png", False),
+        ("upload_image", "text/plain", True),
+        ("upload_text", "text/plain", True),
+        (None, "application/json", True),
+    ),
 )
-def test_find_core_operation_wrong_operation_id(path):
+def test_is_text_request_body(operation_id, mimetype, expected):
+    app = setup_openapi(
+        web.Application(), ROOT_PATH / "openapi.yaml", server_url="/api/"
+    )
+    core_operation = (
+        get_openapi_operation(app, operation_id)
+        if operation_id is not None
+        else None
+    )
+    assert is_text_request_body(core_operation, mimetype) is expected
+
+
+def test_to_core_request_parameters():
     request = make_mocked_request(
         "GET",
-        "/api/hello",
-        app=setup_openapi(web.Application(), path, server_url="/api/"),
+        "/api/hello?name=Name&tags=one&tags=two&page=1",
+        headers={
+            "Cookie": "session=value; tracking=value",
+            "X-Api-Key": "key",
+            "X-Forwarded-For": "127.0.0.1",
+        },
+    )
+    parameters = to_core_request_parameters(
+        request,
+        ParameterNames(
+            query=("name", "tags", "email"),
+            header=("X-API-Key", "X-Request-ID"),
+            cookie=("session", "user"),
+        ),
     )
 
-    async def broken_handler(request: web.Request) -> web.Response:
-        return web.json_response(False)
+    assert list(parameters.query.items()) == [
+        ("name", "Name"),
+        ("tags", "one"),
+        ("tags", "two"),
+    ]
+    assert dict(parameters.header) == {"X-API-Key": "key"}
+    assert parameters.cookie == {"session": "value"}
 
-    setattr(
-        broken_handler,
-        HANDLER_OPENAPI_MAPPING_KEY,
-        pmap({"*": "does-not-exist"}),
-    )
 
-    assert find_core_operation(request, broken_handler) is None
+def test_to_core_request_parameters_all():
+    request = make_mocked_request(
+        "GET",
+        "/api/hello?name=Name&page=1",
+        headers={"X-Forwarded-For": "127.0.0.1"},
+    )
+    parameters = to_core_request_parameters(request)
+    assert dict(parameters.query) == {"name": "Name", "page": "1"}
+    assert parameters.header["X-Forwarded-For"] == "127.0.0.1"
@@ -0,0 +1,272 @@
+import pytest
+from aiohttp import web
+from multidict import MultiDict
+from openapi_core.deserializing.exceptions import DeserializeError
+from openapi_core.deserializing.parameters.exceptions import (
+    EmptyParameterValue,
+)
+from openapi_core.schema.parameters.exceptions import (
+    MissingParameter,
+    MissingRequiredParameter,
+)
+from openapi_core.shortcuts import create_spec
+from openapi_core.validation.request.datatypes import RequestParameters
+
+from rororo import openapi_context, OperationTableDef, setup_openapi
+from rororo.openapi.core_parameters import compile_parameter_decoders
+from rororo.openapi.exceptions import CastError
+
+
+PARAMETERS_SCHEMA = {
+    "openapi": "3.0.3",
+    "info": {"title": "Parameters API", "version": "1.0.0"},
+    "servers": [{"url": "/api/"}],
+    "paths": {
+        "/items/{item_id}": {
+            "parameters": [
+                {
+                    "name": "item_id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"},
+                },
+                {
+                    "name": "limit",
+                    "in": "query",
+                    "schema": {"type": "string"},
+                },
+            ],
+            "get": {
+                "operationId": "list_items",
+                "parameters": [
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "schema": {"type": "integer", "default": 10},
+                    },
+                    {
+                        "name": "ids",
+                        "in": "query",
+                        "explode": False,
+                        "schema": {
+                            "type": "array",
+                            "items": {"type": "integer"},
+                        },
+                    },
+                    {
+                        "name": "tags",
+                        "in": "query",
+                        "schema": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                    },
+                    {
+                        "name": "is_active",
+                        "in": "query",
+                        "schema": {"type": "boolean"},
+                    },
+                    {
+                        "name": "sort",
+                        "in": "query",
+                        "schema": {
+                            "type": "string",
+                            "enum": ["asc", "desc"],
+                        },
+                    },
+                    {
+                        "name": "filter",
+                        "in": "query",
+                        "style": "deepObject",
+                        "schema": {
+                            "type": "object",
+                            "additionalProperties": {"type": "string"},
+                        },
+                    },
+                ],
+                "responses": {"200": {"description": "Items"}},
+            },
+        },
+    },
+}
+
+operations = OperationTableDef()
+
+
+@operations.register
+async def list_items(request: web.Request) -> web.Response:
+    with openapi_context(request) as context:
+        return web.json_response(
+            {**context.parameters.path, **context.parameters.query}
+        )
+
+
+@pytest.fixture
+def decoders():
+    spec = create_spec(PARAMETERS_SCHEMA)
+    path = spec.paths["/items/{item_id}"]
+    return {
+        decoder.name: decoder
+        for decoder in compile_parameter_decoders(
+            [
+                *path.operations["get"].parameters.values(),
+                *path.parameters.values(),
+            ]
+        )
+    }
+
+
+def create_parameters(*, query=None, path=None):
+    return RequestParameters(query=MultiDict(query or ()), path=path or {})
+
+
+def test_decode_array_explode(decoders):
+    parameters = create_parameters(query=[("tags", "a"), ("tags", "b")])
+    assert decoders["tags"].decode(parameters) == ["a", "b"]
+
+
+def test_decode_array_not_explode(decoders):
+    parameters = create_parameters(query=[("ids", "1,2,3")])
+    assert decoders["ids"].decode(parameters) == [1, 2, 3]
+
+
+def test_decode_array_not_explode_invalid_item(decoders):
+    parameters = create_parameters(query=[("ids", "1,two")])
+    with pytest.raises(CastError) as err:
+        decoders["ids"].decode(parameters)
+    assert err.value.name == "ids"
+    assert err.value.value == "two"
+    assert err.value.type == "integer"
+
+
+@pytest.mark.parametrize(
+    "value, expected", (("true", True), ("false", False), ("1", True))
+)
+def test_decode_boolean(decoders, value, expected):
+    parameters = create_parameters(query=[("is_active", value)])
+    assert decoders["is_active"].decode(parameters) is expected
+
+
+def test_decode_default(decoders):
+    assert decoders["limit"].decode(create_parameters()) == 10
+
+
+def test_decode_empty_query_value(decoders):
+    with pytest.raises(EmptyParameterValue):
+        decoders["sort"].decode(create_parameters(query=[("sort", "")]))
+
+
+def test_decode_integer(decoders):
+    parameters = create_parameters(path={"item_id": "42"})
+    assert decoders["item_id"].decode(parameters) == 42
+
+
+def test_decode_unsupported_style(decoders):
+    with pytest.raises(DeserializeError):
+        decoders["filter"].decode(
+            create_parameters(query=[("filter", "status,active")])
+        )
+
+
+def test_decode_missing_parameter(decoders):
+    with pytest.raises(MissingParameter):
+        decoders["sort"].decode(create_parameters())
+
+
+def test_decode_missing_required_parameter(decoders):
+    with pytest.raises(MissingRequiredParameter):
+        decoders["item_id"].decode(create_parameters())
+
+
+def test_operation_parameter_overrides_path_parameter(decoders):
+    assert decoders["limit"].location == "query"
+    assert (
+        decoders["limit"].decode(create_parameters(query=[("limit", "5")]))
+        == 5
+    )
+
+
+@pytest.mark.parametrize(
+    "url, expected_status, expected_data",
+    (
+        (
+            "/api/items/1?ids=1,2&tags=a&tags=b&is_active=false&sort=asc",
+            200,
+            {
+                "item_id": 1,
+                "ids": [1, 2],
+                "is_active": False,
+                "limit": 10,
+                "sort": "asc",
+                "tags": ["a", "b"],
+            },
+        ),
+        ("/api/items/1", 200, {"item_id": 1, "limit": 10}),
+        (
+            "/api/items/one",
+            422,
+            {
+                "detail": [
+                    {
+                        "loc": ["parameters", "item_id"],
+                        "message": "'one' is not a type of 'integer'",
+                    }
+                ]
+            },
+        ),
+        (
+            "/api/items/1?ids=1,two",
+            422,
+            {
+                "detail": [
+                    {
+                        "loc": ["parameters", "ids"],
+                        "message": "'two' is not a type of 'integer'",
+                    }
+                ]
+            },
+        ),
+        (
+            "/api/items/1?filter=status,active",
+            422,
+            {
+                "detail": [
+                    {
+                        "loc": ["parameters"],
+                        "message": (
+                            "Failed to deserialize value status,active with "
+                            "style ParameterStyle.DEEP_OBJECT"
+                        ),
+                    }
+                ]
+            },
+        ),
+        (
+            "/api/items/1?sort=random",
+            422,
+            {
+                "detail": [
+                    {
+                        "loc": ["parameters", "sort"],
+                        "message": "'random' is not one of ['asc', 'desc']",
+                    }
+                ]
+            },
+        ),
+    ),
+)
+async def test_request_parameters(
+    aiohttp_client, url, expected_status, expected_data
+):
+    client = await aiohttp_client(
+        setup_openapi(
+            web.Application(),
+            operations,
+            schema=PARAMETERS_SCHEMA,
+            spec=create_spec(PARAMETERS_SCHEMA),
+        )
+    )
+
+    response = await client.get(url)
+    assert response.status == expected_status
+    assert await response.json() == expected_data
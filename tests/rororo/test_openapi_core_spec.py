@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+from rororo import (
+    get_openapi_schema,
+    get_openapi_spec,
+    OperationTableDef,
+    setup_openapi,
+)
+from rororo.openapi.core_spec import create_lazy_spec, LazyOperation
+from rororo.openapi.exceptions import ConfigurationError
+from rororo.openapi.openapi import create_schema_and_spec
+
+
+ROOT_PATH = Path(__file__).parent
+
+OPENAPI_JSON_PATH = ROOT_PATH / "openapi.json"
+OPENAPI_YAML_PATH = ROOT_PATH / "openapi.yaml"
+
+operations = OperationTableDef()
+
+
+@operations.register
+async def hello_world(request: web.Request) -> web.Response:
+    return web.json_response(
+        {"message": "Hello, world!", "email": "world@example.com"}
+    )
+
+
+def iter_operations(spec):
+    for path in spec.paths.values():
+        yield from path.operations.values()
+
+
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+def test_create_lazy_spec(schema_path):
+    schema, spec = create_schema_and_spec(schema_path)
+    lazy_spec = create_lazy_spec(schema)
+
+    assert list(lazy_spec.paths) == list(spec.paths)
+    assert [item.url for item in lazy_spec.servers] == [
+        item.url for item in spec.servers
+    ]
+    assert list(lazy_spec.components.schemas) == list(spec.components.schemas)
+    assert list(lazy_spec.components.security_schemes) == list(
+        spec.components.security_schemes
+    )
+
+    for operation in spec.paths["/hello"].operations.values():
+        if operation.security == []:
+            operation.security = None
+
+    for http_method, operation in spec.paths["/hello"].operations.items():
+        lazy_operation = lazy_spec.paths["/hello"].operations[http_method]
+        assert isinstance(lazy_operation, LazyOperation)
+        assert lazy_operation.operation_id == operation.operation_id
+        assert lazy_operation._is_created is False
+
+        assert list(lazy_operation.parameters) == list(operation.parameters)
+        assert list(lazy_operation.responses) == list(operation.responses)
+        assert lazy_operation.security == operation.security
+        assert lazy_operation._is_created is True
+
+
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+def test_create_lazy_spec_operation_security(schema_path):
+    schema, _ = create_schema_and_spec(schema_path)
+    for operation in iter_operations(create_lazy_spec(schema)):
+        operation_data = schema["paths"][operation.path_name][
+            operation.http_method
+        ]
+        if "security" in operation_data:
+            assert operation.security == operation_data["security"]
+        else:
+            assert operation.security is None
+
+
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+async def test_lazy_spec(aiohttp_client, schema_path):
+    app = setup_openapi(
+        web.Application(),
+        schema_path,
+        operations,
+        server_url="/api/",
+        lazy_spec=True,
+    )
+    assert get_openapi_schema(app)
+
+    spec = get_openapi_spec(app)
+    assert all(
+        operation._is_created is False for operation in iter_operations(spec)
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/hello")
+    assert response.status == 200
+    assert await response.json() == {
+        "message": "Hello, world!",
+        "email": "world@example.com",
+    }
+
+    assert {
+        operation.operation_id
+        for operation in iter_operations(spec)
+        if operation._is_created
+    } == {"hello_world"}
+
+
+def test_lazy_spec_cache_dir(tmp_path):
+    with pytest.raises(ConfigurationError):
+        setup_openapi(
+            web.Application(),
+            OPENAPI_YAML_PATH,
+            operations,
+            server_url="/api/",
+            cache_dir=tmp_path,
+            lazy_spec=True,
+        )
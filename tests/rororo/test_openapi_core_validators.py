@@ -1,7 +1,163 @@
+import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import isodate
 import pytest
+from aiohttp import web
 from jsonschema.exceptions import FormatError
+from openapi_core.schema.schemas.enums import SchemaType
+from openapi_core.shortcuts import create_spec
+from openapi_core.unmarshalling.schemas.enums import UnmarshalContext
+
+from rororo import OperationTableDef, setup_openapi
+from rororo.openapi import (
+    core_validators as core_validators_module,
+    get_openapi_context,
+    get_openapi_operation,
+)
+from rororo.openapi.core_validators import (
+    create_core_validators,
+    DateTimeFormatter,
+    EmailFormatter,
+    get_core_validators,
+    parse_date_time,
+    RequestValidator,
+    ResponseValidator,
+)
+from rororo.openapi.exceptions import ConfigurationError
+
 
-from rororo.openapi.core_validators import EmailFormatter
+ROOT_PATH = Path(__file__).parent
+
+OPENAPI_JSON_PATH = ROOT_PATH / "openapi.json"
+
+DATE_TIMES_SCHEMA = {
+    "openapi": "3.0.3",
+    "info": {"title": "Date-times API", "version": "1.0.0"},
+    "paths": {
+        "/date-times": {
+            "post": {
+                "operationId": "create_date_times",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "created_at": {
+                                            "type": "string",
+                                            "format": "date-time",
+                                        }
+                                    },
+                                },
+                            }
+                        }
+                    }
+                },
+                "responses": {"204": {"description": "Created"}},
+            }
+        }
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        "2020-04-01T12:00:00Z",
+        "2020-04-01t12:00:00z",
+        "2020-04-01T12:00:00.123Z",
+        "2020-04-01T12:00:00.1234+03:00",
+        "2020-04-01T12:00:00.123456-05:30",
+        "2020-04-01T12:00:00+00:00",
+    ),
+)
+def test_date_time(value):
+    assert DateTimeFormatter().validate(value) is True
+    parsed = parse_date_time(value)
+    assert parsed == isodate.parse_datetime(value.upper())
+    assert parsed.tzinfo is not None
+
+
+@pytest.mark.parametrize(
+    "invalid_value",
+    (
+        "",
+        "2020-04-01",
+        "2020-04-01T12:00:00",
+        "2020-04-01 12:00:00Z",
+        "2020-04-01T12:00Z",
+        "2020-04-01T12:00:00,5Z",
+        "2020-13-01T12:00:00Z",
+        "2020-04-01T12:00:00+0300",
+        "20200401T120000Z",
+    ),
+)
+def test_date_time_invalid_value(invalid_value):
+    assert DateTimeFormatter().validate(invalid_value) is False
+    with pytest.raises(ValueError):
+        parse_date_time(invalid_value)
+
+
+def test_date_time_isodate_fallback(monkeypatch):
+    class DateTime(datetime.datetime):
+        @classmethod
+        def fromisoformat(cls, value):
+            raise ValueError(value)
+
+    monkeypatch.setattr(
+        core_validators_module, "datetime", SimpleNamespace(datetime=DateTime)
+    )
+    assert parse_date_time("2020-04-01T12:00:00.12Z") == datetime.datetime(
+        2020, 4, 1, 12, 0, 0, 120000, tzinfo=datetime.timezone.utc
+    )
+
+
+@pytest.mark.parametrize("validation_engine", ("default", "compiled"))
+def test_date_time_parsed_once(monkeypatch, validation_engine):
+    calls = []
+
+    def counting_parse_date_time(value):
+        calls.append(value)
+        return parse_date_time(value)
+
+    monkeypatch.setattr(
+        core_validators_module, "parse_date_time", counting_parse_date_time
+    )
+
+    spec = create_spec(DATE_TIMES_SCHEMA)
+    media_type = (
+        spec.paths["/date-times"]
+        .operations["post"]
+        .request_body["application/json"]
+    )
+    validator = create_core_validators(
+        spec, validation_engine=validation_engine
+    ).request
+
+    values = [
+        f"2020-04-01T12:{minute:02d}:{second:02d}Z"
+        for minute in range(60)
+        for second in range(60)
+    ]
+    data = validator._unmarshal(
+        media_type, [{"created_at": value} for value in values]
+    )
+
+    assert [item["created_at"] for item in data] == [
+        parse_date_time(value) for value in values
+    ]
+    # Each date-time string parsed once, on checking its format, and parsed
+    # value reused on unmarshalling it
+    assert sorted(calls) == sorted(values)
+
+    # Parsed values are not kept after unmarshalling
+    calls.clear()
+    validator._unmarshal(media_type, [{"created_at": values[0]}])
+    assert calls == [values[0]]
 
 
 @pytest.mark.parametrize(
@@ -26,3 +182,112 @@ def test_valid_email_without_check_deliverability():
         )
         is True
     )
+
+
+@pytest.mark.parametrize(
+    "cache_size, expected_calls", ((0, 6), (1, 5), (1024, 2))
+)
+def test_email_cache(monkeypatch, cache_size, expected_calls):
+    calls = []
+    original_validate_email = core_validators_module.validate_email
+
+    def validate_email(value, **kwargs):
+        calls.append(value)
+        return original_validate_email(value, **kwargs)
+
+    monkeypatch.setattr(
+        "rororo.openapi.core_validators.validate_email", validate_email
+    )
+
+    formatter = EmailFormatter(cache_size=cache_size)
+    for value in ("email@domain.com", "not-email", "email@domain.com") * 2:
+        if value == "not-email":
+            with pytest.raises(FormatError) as exc:
+                formatter.validate(value)
+            assert str(exc.value) == "'not-email' is not an 'email'"
+        else:
+            assert formatter.validate(value) is True
+
+    assert len(calls) == expected_calls
+
+
+def test_email_cache_shared_between_requests():
+    app = setup_openapi(
+        web.Application(),
+        OPENAPI_JSON_PATH,
+        OperationTableDef(),
+        server_url="/api/",
+        validate_email_cache_size=16,
+    )
+    validators = get_core_validators(app)
+    request_formatter = validators.request.custom_formatters["email"]
+    assert request_formatter is validators.response.custom_formatters["email"]
+    assert request_formatter.cache_size == 16
+
+
+def test_validators_reused_between_requests():
+    app = setup_openapi(
+        web.Application(),
+        OPENAPI_JSON_PATH,
+        OperationTableDef(),
+        server_url="/api/",
+    )
+    validators = get_core_validators(app)
+    assert isinstance(validators.request, RequestValidator)
+    assert isinstance(validators.response, ResponseValidator)
+
+    factory = validators.request._get_unmarshallers_factory(
+        UnmarshalContext.REQUEST
+    )
+    assert (
+        validators.request._get_unmarshallers_factory(UnmarshalContext.REQUEST)
+        is factory
+    )
+
+    schema = (
+        get_openapi_operation(app, "create-post")
+        .request_body.content["application/json"]
+        .schema
+    )
+    unmarshaller = factory.create(schema)
+    assert factory.create(schema) is unmarshaller
+    assert factory.create(schema, SchemaType.ANY) is not unmarshaller
+    assert factory._get_format_checker() is factory._get_format_checker()
+
+
+def test_validators_not_registered():
+    with pytest.raises(ConfigurationError):
+        get_core_validators(web.Application())
+
+
+async def test_validate_request_without_path_finder(
+    monkeypatch, aiohttp_client
+):
+    def find(*args, **kwargs):
+        raise AssertionError("PathFinder should not be used")
+
+    monkeypatch.setattr(core_validators_module.PathFinder, "find", find)
+
+    operations = OperationTableDef()
+
+    @operations.register("retrieve_post")
+    async def retrieve_post(request: web.Request) -> web.Response:
+        post_id = get_openapi_context(request).parameters.path["post_id"]
+        return web.json_response({"id": post_id})
+
+    client = await aiohttp_client(
+        setup_openapi(
+            web.Application(),
+            OPENAPI_JSON_PATH,
+            operations,
+            server_url="/api/",
+            is_validate_response=False,
+        )
+    )
+
+    response = await client.get("/api/posts/1")
+    assert response.status == 200
+    assert await response.json() == {"id": 1}
+
+    response = await client.get("/api/posts/not-int")
+    assert response.status == 422
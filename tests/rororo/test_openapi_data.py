@@ -0,0 +1,70 @@
+import pyrsistent
+import pytest
+from openapi_core.validation.request.datatypes import RequestParameters
+
+from rororo.openapi.data import (
+    freeze_data,
+    ReadOnlyMapping,
+    ReadOnlySequence,
+    to_openapi_parameters,
+)
+
+
+TEST_DATA = {"items": [{"key": "value"}], "name": "Name", "total": 1}
+
+
+def test_freeze_data_none():
+    assert freeze_data(TEST_DATA, "none") is TEST_DATA
+
+
+def test_freeze_data_proxy():
+    data = freeze_data(TEST_DATA, "proxy")
+    assert isinstance(data, ReadOnlyMapping)
+    assert data == TEST_DATA
+    assert dict(data) == TEST_DATA
+    assert len(data) == 3
+
+    items = data["items"]
+    assert isinstance(items, ReadOnlySequence)
+    assert items == TEST_DATA["items"]
+    assert isinstance(items[0], ReadOnlyMapping)
+    assert isinstance(items[:1], ReadOnlySequence)
+    assert items[0]["key"] == "value"
+
+    with pytest.raises(TypeError):
+        data["name"] = "Other"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        items[0] = {}  # type: ignore[index]
+
+
+def test_freeze_data_pyrsistent():
+    data = freeze_data(TEST_DATA)
+    assert isinstance(data, pyrsistent.PMap)
+    assert isinstance(data["items"], pyrsistent.PVector)
+    assert pyrsistent.thaw(data) == TEST_DATA
+
+
+@pytest.mark.parametrize(
+    "value", ("string", 1, None, ["item", {"key": "value"}])
+)
+def test_freeze_data_proxy_not_dict(value):
+    assert freeze_data(value, "proxy") == value
+
+
+@pytest.mark.parametrize(
+    "frozen_data, expected_type",
+    (
+        ("none", dict),
+        ("proxy", ReadOnlyMapping),
+        ("pyrsistent", pyrsistent.PMap),
+    ),
+)
+def test_to_openapi_parameters(frozen_data, expected_type):
+    parameters = to_openapi_parameters(
+        RequestParameters(query={"limit": 10}, path={"id": 1}),
+        frozen_data=frozen_data,
+    )
+    assert isinstance(parameters.query, expected_type)
+    assert parameters.query == {"limit": 10}
+    assert parameters.path == {"id": 1}
+    assert parameters.header == {}
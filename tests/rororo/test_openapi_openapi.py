@@ -1,10 +1,14 @@
+import json
+import os
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 from aiohttp import web
 from pyrsistent import pmap
 
-from rororo import OperationTableDef, setup_openapi
+from rororo import get_openapi_spec, OperationTableDef, setup_openapi
+from rororo.openapi import openapi as openapi_module
 from rororo.openapi.constants import HANDLER_OPENAPI_MAPPING_KEY
 from rororo.openapi.exceptions import ConfigurationError
 
@@ -52,6 +56,128 @@ def test_cache_create_schema_and_spec(schema_path):
         )
 
 
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+async def test_cache_dir(monkeypatch, aiohttp_client, tmp_path, schema_path):
+    operations = OperationTableDef()
+
+    @operations.register("hello_world")
+    async def hello_world(request: web.Request) -> web.Response:
+        return web.json_response(
+            {"message": "Hello, world!", "email": "world@example.com"}
+        )
+
+    setup_openapi(
+        web.Application(),
+        schema_path,
+        operations,
+        server_url="/api/",
+        cache_dir=tmp_path,
+    )
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    def broken_create_spec(*args, **kwargs):
+        raise RuntimeError("Spec should be loaded from cache")
+
+    monkeypatch.setattr(openapi_module, "create_spec", broken_create_spec)
+
+    app = setup_openapi(
+        web.Application(),
+        schema_path,
+        operations,
+        server_url="/api/",
+        cache_dir=tmp_path,
+    )
+    assert get_openapi_spec(app)._resolver is not None
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/hello", params={"name": "Name"})
+    assert response.status == 200
+    assert (await response.json())["message"] == "Hello, world!"
+
+
+def test_cache_dir_invalid_cache(tmp_path):
+    operations = OperationTableDef()
+    setup_openapi(
+        web.Application(),
+        OPENAPI_YAML_PATH,
+        operations,
+        server_url="/api/",
+        cache_dir=tmp_path,
+    )
+
+    (cache_path,) = tmp_path.glob("*.pickle")
+    cache_path.write_bytes(b"invalid")
+
+    setup_openapi(
+        web.Application(),
+        OPENAPI_YAML_PATH,
+        operations,
+        server_url="/api/",
+        cache_dir=tmp_path,
+    )
+    assert cache_path.read_bytes() != b"invalid"
+
+
+def test_cache_dir_schema_loader(tmp_path):
+    operations = OperationTableDef()
+    for schema_loader in (None, json.loads, json.loads):
+        setup_openapi(
+            web.Application(),
+            OPENAPI_JSON_PATH,
+            operations,
+            server_url="/api/",
+            schema_loader=schema_loader,
+            cache_dir=tmp_path,
+        )
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX only")
+def test_cache_dir_untrusted_cache(monkeypatch, tmp_path):
+    operations = OperationTableDef()
+    setup_openapi(
+        web.Application(),
+        OPENAPI_YAML_PATH,
+        operations,
+        server_url="/api/",
+        cache_dir=tmp_path,
+    )
+
+    (cache_path,) = tmp_path.glob("*.pickle")
+    cache_path.chmod(0o666)
+
+    with pytest.raises(ConfigurationError):
+        openapi_module.load_schema_and_spec(cache_path)
+
+    create_spec = Mock(wraps=openapi_module.create_spec)
+    monkeypatch.setattr(openapi_module, "create_spec", create_spec)
+
+    setup_openapi(
+        web.Application(),
+        OPENAPI_YAML_PATH,
+        operations,
+        server_url="/api/",
+        cache_dir=tmp_path,
+    )
+    create_spec.assert_called_once()
+    assert cache_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_get_schema_cache_key_external_ref(tmp_path):
+    schema_path = tmp_path / "openapi.yaml"
+    schema_path.write_text(
+        'paths:\n  /hello:\n    $ref: "paths.yaml#/hello"\n'
+    )
+    paths_path = tmp_path / "paths.yaml"
+    paths_path.write_text("hello: {}\n")
+
+    cache_key = openapi_module.get_schema_cache_key(schema_path)
+    assert openapi_module.get_schema_cache_key(schema_path) == cache_key
+
+    paths_path.write_text("hello: {get: {}}\n")
+    assert openapi_module.get_schema_cache_key(schema_path) != cache_key
+
+
 def test_handle_all_create_schema_and_spec_errors(tmp_path):
     invalid_json = tmp_path / "invalid_openapi.json"
     invalid_json.write_text('{"openapi": "3.')
@@ -60,6 +186,25 @@ def test_handle_all_create_schema_and_spec_errors(tmp_path):
         setup_openapi(web.Application(), invalid_json, OperationTableDef())
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"frozen_data": "frozen"},
+        {"frozen_data": None},
+        {"validation_engine": "fast"},
+    ),
+)
+def test_invalid_setup_openapi_option(kwargs):
+    with pytest.raises(ConfigurationError):
+        setup_openapi(
+            web.Application(),
+            OPENAPI_JSON_PATH,
+            OperationTableDef(),
+            server_url="/api/",
+            **kwargs,
+        )
+
+
 def test_ignore_non_http_view_methods():
     operations = OperationTableDef()
 
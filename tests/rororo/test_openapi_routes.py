@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+from pyrsistent import pmap
+
+from rororo import get_openapi_context, OperationTableDef, setup_openapi
+from rororo.openapi.constants import HANDLER_OPENAPI_MAPPING_KEY
+from rororo.openapi.routes import get_route_core_operation, OperationRoute
+
+
+ROOT_PATH = Path(__file__).parent
+
+OPENAPI_JSON_PATH = ROOT_PATH / "openapi.json"
+OPENAPI_YAML_PATH = ROOT_PATH / "openapi.yaml"
+
+operations = OperationTableDef()
+
+
+@operations.register
+async def hello_world(request: web.Request) -> web.Response:
+    return web.json_response("Hello, world!")
+
+
+@operations.register("posts")
+class PostsView(web.View):
+    @operations.register("create-post")
+    async def post(self) -> web.Response:
+        return web.json_response({}, status=201)
+
+
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+def test_operation_route(schema_path):
+    app = setup_openapi(
+        web.Application(), schema_path, operations, server_url="/api/"
+    )
+
+    (route,) = app.router["hello_world"]
+    assert isinstance(route, OperationRoute)
+    assert route.get_core_operation("GET").operation_id == "hello_world"
+
+    (view_route,) = app.router["create-post"]
+    assert isinstance(view_route, OperationRoute)
+    assert view_route.get_core_operation("POST").operation_id == "create-post"
+    assert view_route.get_core_operation("GET") is None
+
+
+async def test_get_route_core_operation_not_operation_route(aiohttp_client):
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response(get_route_core_operation(request) is None)
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+
+    client = await aiohttp_client(app)
+    response = await client.get("/")
+    assert response.status == 200
+    assert await response.json() is True
+
+
+def test_get_route_core_operation_not_found():
+    request = make_mocked_request("GET", "/does-not-exist")
+    assert get_route_core_operation(request) is None
+
+
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+@pytest.mark.parametrize(
+    "query, expected_status, expected_data",
+    (
+        (
+            {"name": "Name"},
+            200,
+            {"message": "Hello, Name!", "email": "world@example.com"},
+        ),
+        (
+            {"email": "not-an-email"},
+            422,
+            {
+                "detail": [
+                    {
+                        "loc": ["parameters", "email"],
+                        "message": "'not-an-email' is not an 'email'",
+                    }
+                ]
+            },
+        ),
+    ),
+)
+async def test_get_route_core_operation_manual_handler(
+    aiohttp_client, schema_path, query, expected_status, expected_data
+):
+    async def handler(request: web.Request) -> web.Response:
+        name = get_openapi_context(request).parameters.query["name"]
+        return web.json_response(
+            {"message": f"Hello, {name}!", "email": "world@example.com"}
+        )
+
+    setattr(handler, HANDLER_OPENAPI_MAPPING_KEY, pmap({"*": "hello_world"}))
+
+    app = setup_openapi(
+        web.Application(), schema_path, OperationTableDef(), server_url="/api/"
+    )
+    app.router.add_get("/api/hello", handler)
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/hello", params=query)
+    assert response.status == expected_status
+    assert await response.json() == expected_data
+
+
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+@pytest.mark.parametrize(
+    "mapping", ({"POST": "hello_world"}, {"*": "does-not-exist"})
+)
+async def test_get_route_core_operation_manual_handler_no_operation(
+    aiohttp_client, schema_path, mapping
+):
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response(get_route_core_operation(request) is None)
+
+    setattr(handler, HANDLER_OPENAPI_MAPPING_KEY, pmap(mapping))
+
+    app = setup_openapi(
+        web.Application(), schema_path, OperationTableDef(), server_url="/api/"
+    )
+    app.router.add_get("/api/hello", handler)
+
+    client = await aiohttp_client(app)
+    response = await client.get("/api/hello")
+    assert response.status == 200
+    assert await response.json() is True
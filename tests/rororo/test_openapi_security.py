@@ -0,0 +1,358 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import attr
+import pytest
+from aiohttp import BasicAuth, web
+from openapi_core.schema.security_schemes.models import SecurityScheme
+from openapi_core.shortcuts import create_spec
+from openapi_core.validation.request.datatypes import RequestParameters
+
+from rororo import get_openapi_context, OperationTableDef, setup_openapi
+from rororo.openapi import (
+    core_data as core_data_module,
+    security as security_module,
+)
+from rororo.openapi.core_validators import create_core_validators
+from rororo.openapi.exceptions import (
+    BasicSecurityError,
+    InvalidCredentials,
+    SecurityError,
+)
+from rororo.openapi.openapi import create_schema_and_spec
+from rororo.openapi.security import (
+    Authenticator,
+    create_security_plan,
+    create_security_plans,
+    SecuritySchemePlan,
+    validate_security,
+)
+
+
+ROOT_PATH = Path(__file__).parent
+
+OPENAPI_JSON_PATH = ROOT_PATH / "openapi.json"
+OPENAPI_YAML_PATH = ROOT_PATH / "openapi.yaml"
+
+SECURED_SCHEMA = {
+    "openapi": "3.0.3",
+    "info": {"title": "Secured API", "version": "1.0.0"},
+    "servers": [{"url": "/api/"}],
+    "paths": {
+        "/upload": {
+            "post": {
+                "operationId": "upload",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "array",
+                                "items": {"type": "object"},
+                            }
+                        }
+                    },
+                },
+                "responses": {"204": {"description": "Uploaded"}},
+            }
+        }
+    },
+    "components": {
+        "securitySchemes": {
+            "apiKey": {"type": "apiKey", "in": "header", "name": "X-API-Key"}
+        }
+    },
+    "security": [{"apiKey": []}],
+}
+
+SECURITY_SCHEMES = {
+    "apiKey": SecurityScheme("apiKey", name="X-API-Key", apikey_in="header"),
+    "apiKeyCookie": SecurityScheme(
+        "apiKey", name="api_key", apikey_in="cookie"
+    ),
+    "basic": SecurityScheme("http", scheme="basic"),
+    "jwt": SecurityScheme("http", scheme="bearer", bearer_format="JWT"),
+    "oauth2": SecurityScheme("oauth2"),
+}
+
+
+operations = OperationTableDef()
+
+
+@operations.register
+async def upload(request: web.Request) -> web.Response:
+    context = get_openapi_context(request)
+    return web.Response(
+        status=204,
+        headers={
+            "X-Auth": context.auth["apiKey"],
+            "X-Items": str(len(context.data)),
+        },
+    )
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_authenticator(**kwargs):
+    calls = []
+
+    async def authenticate(scheme_name, credential):
+        calls.append(credential)
+        await asyncio.sleep(0)
+        if credential == "invalid":
+            raise ValueError(credential)
+        return f"{scheme_name}:{credential}"
+
+    return Authenticator("apiKey", authenticate, **kwargs), calls
+
+
+def create_parameters(*, header=None, cookie=None):
+    return RequestParameters(header=header or {}, cookie=cookie or {})
+
+
+async def test_authenticator_cache_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(
+        security_module, "time", SimpleNamespace(monotonic=clock)
+    )
+    authenticator, calls = create_authenticator(cache_ttl=10)
+
+    assert await authenticator("key") == "apiKey:key"
+    clock.now = 9
+    assert await authenticator("key") == "apiKey:key"
+    assert calls == ["key"]
+
+    clock.now = 11
+    assert await authenticator("key") == "apiKey:key"
+    assert calls == ["key", "key"]
+
+
+async def test_authenticator_cache_size():
+    authenticator, calls = create_authenticator(cache_size=2)
+    for credential in ("one", "two", "one", "three", "one", "two"):
+        await authenticator(credential)
+    assert calls == ["one", "two", "three", "two"]
+
+
+@pytest.mark.parametrize("kwargs", ({"cache_size": 0}, {"cache_ttl": 0}))
+async def test_authenticator_cache_disabled(kwargs):
+    authenticator, calls = create_authenticator(**kwargs)
+    await authenticator("key")
+    await authenticator("key")
+    assert calls == ["key", "key"]
+
+
+async def test_authenticator_error_not_cached():
+    authenticator, calls = create_authenticator()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await authenticator("invalid")
+    assert calls == ["invalid", "invalid"]
+
+
+async def test_authenticator_single_flight():
+    authenticator, calls = create_authenticator(cache_size=0)
+    results = await asyncio.gather(
+        *(authenticator(credential) for credential in ("one", "two") * 5)
+    )
+    assert results == ["apiKey:one", "apiKey:two"] * 5
+    assert calls == ["one", "two"]
+
+    errors = await asyncio.gather(
+        *(authenticator("invalid") for _ in range(5)), return_exceptions=True
+    )
+    assert all(isinstance(item, ValueError) for item in errors)
+    assert calls == ["one", "two", "invalid"]
+
+
+async def test_authenticator_single_flight_cancelled():
+    authenticator, calls = create_authenticator()
+    first = asyncio.ensure_future(authenticator("key"))
+    second = asyncio.ensure_future(authenticator("key"))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    assert await second == "apiKey:key"
+    assert first.cancelled()
+    assert calls == ["key"]
+
+
+@pytest.mark.parametrize("schema_path", (OPENAPI_JSON_PATH, OPENAPI_YAML_PATH))
+def test_create_security_plans(schema_path):
+    schema, spec = create_schema_and_spec(schema_path)
+    plans = create_security_plans(spec, schema)
+
+    assert plans["retrieve_empty"].requirements == (
+        (SecuritySchemePlan("apiKey", location="header", key="X-API-Key"),),
+        (),
+    )
+    assert plans["hello_world"].requirements == ()
+
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        plans["retrieve_empty"].requirements = ()
+
+
+def test_create_security_plans_path_item_ref():
+    schema = {
+        **SECURED_SCHEMA,
+        "paths": {"/upload": {"$ref": "#/x-path-items/upload"}},
+        "x-path-items": {"upload": SECURED_SCHEMA["paths"]["/upload"]},
+    }
+    plans = create_security_plans(create_spec(SECURED_SCHEMA), schema)
+    assert plans["upload"].requirements == (
+        (SecuritySchemePlan("apiKey", location="header", key="X-API-Key"),),
+    )
+
+
+def test_get_security_plan_cached():
+    spec = create_spec(SECURED_SCHEMA)
+    validator = create_core_validators(spec).request
+    operation = spec.paths["/upload"].operations["post"]
+
+    plan = validator.get_security_plan(operation)
+    assert plan.requirements == (
+        (SecuritySchemePlan("apiKey", location="header", key="X-API-Key"),),
+    )
+    assert validator.security_plans == {"upload": plan}
+    assert validator.get_security_plan(operation) is plan
+
+
+def test_create_security_plan_does_not_modify_security_list():
+    security_list = [{}, {"apiKey": []}]
+    plan = create_security_plan(security_list, SECURITY_SCHEMES)
+    assert security_list == [{}, {"apiKey": []}]
+    assert [len(item) for item in plan.requirements] == [1, 0]
+
+
+@pytest.mark.parametrize(
+    "security_list, kwargs, expected",
+    (
+        ([], {}, {}),
+        (
+            [{"apiKey": []}],
+            {"header": {"X-API-Key": "key"}},
+            {"apiKey": "key"},
+        ),
+        (
+            [{"apiKeyCookie": []}],
+            {"cookie": {"api_key": "key"}},
+            {"apiKeyCookie": "key"},
+        ),
+        (
+            [{"jwt": []}],
+            {"header": {"Authorization": "Bearer token"}},
+            {"jwt": "token"},
+        ),
+        (
+            [{"basic": []}],
+            {"header": {"Authorization": BasicAuth("user", "pass").encode()}},
+            {"basic": BasicAuth("user", "pass")},
+        ),
+        (
+            [{"jwt": []}, {"apiKey": []}],
+            {"header": {"X-API-Key": "key"}},
+            {"apiKey": "key"},
+        ),
+        (
+            [{"apiKey": [], "jwt": []}],
+            {"header": {"X-API-Key": "key", "Authorization": "bearer token"}},
+            {"apiKey": "key", "jwt": "token"},
+        ),
+        ([{}, {"apiKey": []}], {}, {}),
+    ),
+)
+def test_validate_security(security_list, kwargs, expected):
+    plan = create_security_plan(security_list, SECURITY_SCHEMES)
+    assert validate_security(plan, create_parameters(**kwargs)) == expected
+
+
+@pytest.mark.parametrize(
+    "security_list, kwargs, expected_error",
+    (
+        ([{"basic": []}], {}, BasicSecurityError),
+        (
+            [{"basic": []}],
+            {"header": {"Authorization": "Bearer token"}},
+            BasicSecurityError,
+        ),
+        ([{"jwt": []}], {"header": {"Authorization": "token"}}, SecurityError),
+        ([{"basic": []}, {"jwt": []}], {}, SecurityError),
+        (
+            [{"apiKey": [], "jwt": []}],
+            {"header": {"X-API-Key": "key"}},
+            SecurityError,
+        ),
+        ([{"oauth2": []}], {}, SecurityError),
+        ([{"missing": []}], {}, SecurityError),
+    ),
+)
+def test_validate_security_error(security_list, kwargs, expected_error):
+    plan = create_security_plan(security_list, SECURITY_SCHEMES)
+    with pytest.raises(expected_error):
+        validate_security(plan, create_parameters(**kwargs))
+
+
+@pytest.mark.parametrize(
+    "headers, expected_status, expected_authenticated",
+    (
+        ({}, 403, []),
+        ({"X-API-Key": "invalid"}, 403, ["invalid"]),
+        ({"X-API-Key": "key"}, 204, ["key"]),
+    ),
+)
+async def test_security_validated_before_reading_body(
+    aiohttp_client,
+    monkeypatch,
+    headers,
+    expected_status,
+    expected_authenticated,
+):
+    read_calls = []
+    read_request_body = core_data_module.read_request_body
+
+    async def track_read_request_body(request, max_body_size):
+        read_calls.append(request.path)
+        return await read_request_body(request, max_body_size)
+
+    monkeypatch.setattr(
+        core_data_module, "read_request_body", track_read_request_body
+    )
+
+    calls = []
+
+    async def authenticate(scheme_name, credential):
+        calls.append(credential)
+        if credential == "invalid":
+            raise InvalidCredentials()
+        return f"{scheme_name}:{credential}"
+
+    app = setup_openapi(
+        web.Application(),
+        operations,
+        schema=SECURED_SCHEMA,
+        spec=create_spec(SECURED_SCHEMA),
+        authenticators={"apiKey": authenticate},
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post(
+        "/api/upload",
+        json=[{"item": index} for index in range(10)],
+        headers=headers,
+    )
+    assert response.status == expected_status
+    assert calls == expected_authenticated
+
+    if expected_status == 204:
+        assert response.headers["X-Auth"] == "apiKey:key"
+        assert response.headers["X-Items"] == "10"
+        assert read_calls == ["/api/upload"]
+    else:
+        assert read_calls == []
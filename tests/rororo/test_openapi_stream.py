@@ -0,0 +1,327 @@
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from aiohttp import web
+
+from rororo import get_openapi_context, OperationTableDef, setup_openapi
+from rororo.openapi.stream import iter_json_array, JSONArrayParser
+from tests.rororo.executors import CountingExecutor
+
+
+ROOT_PATH = Path(__file__).parent
+
+OPENAPI_YAML_PATH = ROOT_PATH / "openapi.yaml"
+
+operations = OperationTableDef()
+
+
+@operations.register
+async def retrieve_array_from_request_body(
+    request: web.Request,
+) -> web.Response:
+    context = get_openapi_context(request)
+    request.app["items"] = items = []
+    async for item in context.data:
+        items.append(item)
+    return web.json_response(items)
+
+
+class ChunksReader:
+    def __init__(self, data, chunk_size):
+        self.chunks = [
+            data[start:end]
+            for start, end in zip(
+                range(0, len(data), chunk_size),
+                range(chunk_size, len(data) + chunk_size, chunk_size),
+            )
+        ]
+
+    async def read(self, _):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+def feed_by_chunks(data, chunk_size):
+    parser = JSONArrayParser()
+    items = []
+    for start in range(0, len(data), chunk_size):
+        end = start + chunk_size
+        items.extend(parser.feed(data[start:end]))
+    items.extend(parser.feed("", is_final=True))
+    parser.close()
+    return items
+
+
+@pytest.fixture()
+def stream_schema_path(tmp_path):
+    schema = yaml.safe_load(OPENAPI_YAML_PATH.read_bytes())
+    operation = schema["paths"]["/array"]["post"]
+    operation["x-rororo-stream-request-body"] = True
+    # Request body errors are raised on iterating over request body items
+    # in the handler, so describe error responses as well
+    for status, description in (
+        ("413", "Request body too large."),
+        ("422", "Validation error."),
+    ):
+        operation["responses"][status] = {
+            "description": description,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/AnyObject"}
+                }
+            },
+        }
+
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(schema))
+    return path
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        [],
+        [1, 2.5, -300, 1e10],
+        ["one", "two", 'with "quotes"', "with ] bracket"],
+        [{"key": [1, {"nested": None}]}, [True, False], None],
+    ),
+)
+@pytest.mark.parametrize("chunk_size", (1, 3, 1024))
+def test_json_array_parser(data, chunk_size):
+    content = json.dumps(data, indent=2)
+    assert feed_by_chunks(content, chunk_size) == data
+
+
+@pytest.mark.parametrize(
+    "content",
+    (
+        "",
+        "{}",
+        "[1, 2",
+        "[1 2]",
+        "[1,]",
+        "[1] 2",
+        '["unterminated]',
+    ),
+)
+def test_json_array_parser_invalid(content):
+    with pytest.raises(ValueError):
+        feed_by_chunks(content, 2)
+
+
+def test_json_array_parser_feed_sized():
+    parser = JSONArrayParser()
+    assert parser.feed_sized('[1, "two", {"three": 3}]', is_final=True) == [
+        (1, 1),
+        ("two", 5),
+        ({"three": 3}, 12),
+    ]
+    parser.close()
+
+
+def test_json_array_parser_large_item_by_chars():
+    parser = JSONArrayParser()
+    calls = []
+    raw_decode = parser._decoder.raw_decode
+
+    def counting_raw_decode(*args):
+        calls.append(args)
+        return raw_decode(*args)
+
+    parser._decoder.raw_decode = counting_raw_decode
+
+    content = json.dumps(["x" * 4096, 1])
+    items = []
+    for char in content:
+        items.extend(parser.feed(char))
+    items.extend(parser.feed("", is_final=True))
+    parser.close()
+
+    assert items == ["x" * 4096, 1]
+    # Decoding of partially fed item is retried only after its buffered size
+    # doubles, instead of retrying it on each fed part
+    assert len(calls) < 32
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"max_size": 1024},
+        {"max_item_size": 1024},
+        {"max_size": 1024 * 1024, "max_item_size": 1024},
+    ),
+)
+async def test_iter_json_array_too_large(kwargs):
+    content = ChunksReader(
+        json.dumps(["one", "x" * 2048, "three"]).encode("utf-8"), 64
+    )
+    items = []
+    with pytest.raises(web.HTTPRequestEntityTooLarge):
+        async for item in iter_json_array(content, chunk_size=64, **kwargs):
+            items.append(item)
+    assert items == ["one"]
+
+
+async def test_iter_json_array_max_item_size():
+    content = ChunksReader(
+        json.dumps(["x" * 1000, "y" * 1000]).encode("utf-8"), 64
+    )
+    items = [
+        item
+        async for item in iter_json_array(
+            content, chunk_size=64, max_item_size=1024
+        )
+    ]
+    assert items == ["x" * 1000, "y" * 1000]
+
+
+async def test_stream_request_body(aiohttp_client, stream_schema_path):
+    app = setup_openapi(
+        web.Application(), stream_schema_path, operations, server_url="/api/"
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post("/api/array", json=["one", "two", "three"])
+    assert response.status == 200
+    assert await response.json() == ["one", "two", "three"]
+
+
+@pytest.mark.parametrize(
+    "threshold, expected_calls", ((0, 3), (6, 1), (1024 * 1024, 0))
+)
+async def test_stream_request_body_executor(
+    aiohttp_client, stream_schema_path, threshold, expected_calls
+):
+    with CountingExecutor() as executor:
+        app = setup_openapi(
+            web.Application(),
+            stream_schema_path,
+            operations,
+            server_url="/api/",
+            is_validate_response=False,
+            validation_executor=executor,
+            validation_executor_threshold=threshold,
+        )
+
+        client = await aiohttp_client(app)
+        response = await client.post(
+            "/api/array", json=["one", "two", "three"]
+        )
+        assert response.status == 200
+        assert await response.json() == ["one", "two", "three"]
+
+        # Only items of size greater than or equal to the threshold are
+        # validated in the executor
+        assert executor.calls == expected_calls
+
+
+@pytest.mark.parametrize(
+    "data, expected_items, expected_detail",
+    (
+        (
+            b'["one", "", "three"]',
+            ["one"],
+            [{"loc": ["body", 1], "message": "'' is too short"}],
+        ),
+        (
+            b'["one", 2]',
+            ["one"],
+            [{"loc": ["body", 1], "message": "2 is not of type string"}],
+        ),
+        (
+            b"[]",
+            [],
+            [{"loc": ["body"], "message": "Array has less than 1 items"}],
+        ),
+        (
+            b'["one", "two"',
+            ["one", "two"],
+            [
+                {
+                    "loc": ["body"],
+                    "message": (
+                        "Invalid JSON array: Unexpected end of JSON array"
+                    ),
+                }
+            ],
+        ),
+    ),
+)
+async def test_stream_request_body_invalid(
+    aiohttp_client, stream_schema_path, data, expected_items, expected_detail
+):
+    app = setup_openapi(
+        web.Application(), stream_schema_path, operations, server_url="/api/"
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post(
+        "/api/array",
+        data=data,
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status == 422
+    assert (await response.json())["detail"] == expected_detail
+
+    # Handler stops receiving items on first invalid one
+    assert app["items"] == expected_items
+
+
+@pytest.mark.parametrize(
+    "client_max_size, max_body_size, expected_status",
+    (
+        (1024, None, 413),
+        (0, 1024, 413),
+        (1024 * 1024, 1024, 413),
+        (1024, 1024 * 1024, 413),
+        (0, None, 200),
+        (1024 * 1024, None, 200),
+    ),
+)
+async def test_stream_request_body_chunked_too_large(
+    aiohttp_client,
+    tmp_path,
+    stream_schema_path,
+    client_max_size,
+    max_body_size,
+    expected_status,
+):
+    async def iter_chunks():
+        yield b'["one", "'
+        for _ in range(128):
+            yield b"x" * 16
+        yield b'"]'
+
+    if max_body_size is not None:
+        schema = json.loads(stream_schema_path.read_text())
+        schema["paths"]["/array"]["post"][
+            "x-rororo-max-body-size"
+        ] = max_body_size
+        stream_schema_path.write_text(json.dumps(schema))
+
+    app = setup_openapi(
+        web.Application(client_max_size=client_max_size),
+        stream_schema_path,
+        operations,
+        server_url="/api/",
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post(
+        "/api/array",
+        data=iter_chunks(),
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status == expected_status
+
+
+async def test_stream_request_body_disabled(aiohttp_client):
+    app = setup_openapi(
+        web.Application(), OPENAPI_YAML_PATH, operations, server_url="/api/"
+    )
+
+    client = await aiohttp_client(app)
+    response = await client.post("/api/array", json=["one", ""])
+    assert response.status == 422
+    assert app.get("items") is None
@@ -2,7 +2,11 @@ import pytest
 from aiohttp import web
 from aiohttp_middlewares import error_middleware
 
-from rororo.openapi.utils import add_prefix, get_openapi_context
+from rororo.openapi.utils import (
+    add_prefix,
+    get_openapi_context,
+    iter_schema_operations,
+)
 
 
 @pytest.mark.parametrize(
@@ -29,3 +33,23 @@ async def test_get_openapi_context_error(aiohttp_client):
     response = await client.get("/")
     assert response.status == 500
     assert (await response.json())["detail"].split()[0] == "Request"
+
+
+def test_iter_schema_operations():
+    schema = {
+        "paths": {
+            "/items": {
+                "parameters": [],
+                "get": {"operationId": "list_items"},
+                "post": {},
+            },
+            "/items/{item_id}": {"$ref": "#/x-path-items/item"},
+        },
+        "x-path-items": {
+            "item": {"summary": "Item", "get": {"operationId": "get_item"}}
+        },
+    }
+    assert list(iter_schema_operations(schema)) == [
+        ("list_items", {"operationId": "list_items"}),
+        ("get_item", {"operationId": "get_item"}),
+    ]